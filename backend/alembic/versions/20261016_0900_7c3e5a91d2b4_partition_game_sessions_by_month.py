@@ -0,0 +1,132 @@
+"""partition_game_sessions_by_month
+
+Revision ID: 7c3e5a91d2b4
+Revises: 0ed41df5fcd3
+Create Date: 2026-10-16 09:00:00.000000+00:00
+
+Converts game_sessions into a table partitioned by RANGE (started_at), one
+partition per month plus a DEFAULT partition. Existing rows are copied into
+the new partitions; the id sequence is kept so ids continue where they were.
+Later months are created by app/reports/partitions.py at runtime.
+
+The copy holds an exclusive lock on game_sessions for its duration - run it
+in a maintenance window on large installations.
+"""
+from datetime import datetime, timezone
+from typing import Optional
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e5a91d2b4'
+down_revision = '0ed41df5fcd3'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+# Indexes declared on the GameSession model (naming convention ix_%(column_0_label)s)
+INDEXED_COLUMNS = ['id', 'child_id', 'session_type', 'scenario_id', 'started_at', 'completion_status']
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + (month.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _month_start(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def _table_exists(bind, table: str) -> bool:
+    return bind.execute(sa.text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}).scalar()
+
+
+def _is_partitioned(bind) -> bool:
+    return bind.execute(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('game_sessions'))"
+    )).scalar()
+
+
+def _swap_in_new_table(bind, partition_by: str) -> Optional[str]:
+    """
+    Replace game_sessions by a copy with the same columns, optionally partitioned
+
+    Constraints and indexes are recreated after the old table is dropped so
+    their convention-based names are free again.
+
+    Returns:
+        Name of the id sequence (None if the column has no owned sequence)
+    """
+    sequence = bind.execute(sa.text("SELECT pg_get_serial_sequence('game_sessions', 'id')")).scalar()
+
+    op.execute("ALTER TABLE game_sessions RENAME TO game_sessions_old")
+    if sequence:
+        # Keep the sequence alive when the old table is dropped
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY NONE")
+    op.execute(
+        "CREATE TABLE game_sessions (LIKE game_sessions_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        + partition_by
+    )
+    return sequence
+
+
+def _finish_swap(sequence: Optional[str], primary_key: str) -> None:
+    op.execute("DROP TABLE game_sessions_old")
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY game_sessions.id")
+    op.execute(f"ALTER TABLE game_sessions ADD CONSTRAINT pk_game_sessions PRIMARY KEY ({primary_key})")
+    op.execute(
+        "ALTER TABLE game_sessions ADD CONSTRAINT fk_game_sessions_child_id_children "
+        "FOREIGN KEY (child_id) REFERENCES children (id)"
+    )
+    for column in INDEXED_COLUMNS:
+        op.create_index(f'ix_game_sessions_{column}', 'game_sessions', [column], unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    # Fresh databases get the partitioned table from the model (create_all)
+    if not _table_exists(bind, 'game_sessions') or _is_partitioned(bind):
+        return
+
+    sequence = _swap_in_new_table(bind, " PARTITION BY RANGE (started_at)")
+
+    # One partition per month from the oldest session to MONTHS_AHEAD months from now
+    oldest = bind.execute(sa.text("SELECT min(started_at) FROM game_sessions_old")).scalar()
+    current = _month_start(datetime.now(timezone.utc))
+    month = _month_start(oldest) if oldest is not None else current
+    last = _add_months(current, MONTHS_AHEAD)
+    if oldest is not None:
+        newest = bind.execute(sa.text("SELECT max(started_at) FROM game_sessions_old")).scalar()
+        last = max(last, _month_start(newest))
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE game_sessions_p{month.year:04d}_{month.month:02d} PARTITION OF game_sessions "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute("CREATE TABLE game_sessions_default PARTITION OF game_sessions DEFAULT")
+
+    op.execute("INSERT INTO game_sessions SELECT * FROM game_sessions_old")
+    _finish_swap(sequence, "id, started_at")
+    op.execute("ANALYZE game_sessions")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or not _is_partitioned(bind):
+        return
+
+    # Detached partitions are independent tables and are left untouched
+    sequence = _swap_in_new_table(bind, "")
+    op.execute("INSERT INTO game_sessions SELECT * FROM game_sessions_old")
+    _finish_swap(sequence, "id")
+    op.execute("ANALYZE game_sessions")
@@ -0,0 +1,93 @@
+"""jsonb_columns_and_gin_indexes
+
+Revision ID: b41f0e8a6c27
+Revises: 7c3e5a91d2b4
+Create Date: 2026-10-16 09:30:00.000000+00:00
+
+Converts the JSON columns that are filtered on (or read field-by-field) to
+JSONB and adds a GIN jsonb_path_ops index for the containment filter used by
+report access checks (reports.sharing_permissions). The cohort therapy filter
+on children.current_therapies compares types case-insensitively, which
+containment cannot do, so that column gets no GIN index.
+
+Changing the column type rewrites the tables; run it in a maintenance window
+on large installations.
+
+game_sessions and reports are not created by the initial migration (they come
+from create_all at application start), so each table is skipped when it does
+not exist yet; create_all then builds it from the models, already with JSONB
+columns and indexes.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b41f0e8a6c27'
+down_revision = '7c3e5a91d2b4'
+branch_labels = None
+depends_on = None
+
+# (table, column, nullable)
+JSONB_COLUMNS = [
+    ('game_sessions', 'emotional_data', True),
+    ('game_sessions', 'interaction_patterns', True),
+    ('children', 'current_therapies', False),
+    ('reports', 'sharing_permissions', True),
+]
+
+GIN_INDEXES = [
+    ('ix_reports_sharing_permissions', 'reports', 'sharing_permissions'),
+]
+
+
+def _table_exists(bind, table: str) -> bool:
+    return bind.execute(sa.text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}).scalar()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for table, column, nullable in JSONB_COLUMNS:
+        if not _table_exists(bind, table):
+            continue
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::jsonb'
+        )
+
+    for name, table, column in GIN_INDEXES:
+        if not _table_exists(bind, table):
+            continue
+        op.create_index(
+            name, table, [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'jsonb_path_ops'},
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for name, table, _ in GIN_INDEXES:
+        if _table_exists(bind, table):
+            op.drop_index(name, table_name=table, if_exists=True)
+
+    for table, column, nullable in JSONB_COLUMNS:
+        if not _table_exists(bind, table):
+            continue
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::json'
+        )
@@ -0,0 +1,76 @@
+"""child_time_composite_indexes
+
+Revision ID: e5d29c4b7a13
+Revises: b41f0e8a6c27
+Create Date: 2026-10-16 10:00:00.000000+00:00
+
+Composite covering indexes for the per-child time-range hot path:
+
+    game_sessions (child_id, started_at DESC, id DESC) INCLUDE (completion_status, score, duration_seconds)
+    activities    (child_id, completed_at) INCLUDE (points_earned, verified_by_parent)
+
+They replace the single-column child_id indexes (the composite indexes have
+child_id as leading column, so lookups and FK checks by child keep an index).
+
+activities is indexed CONCURRENTLY. game_sessions is partitioned, and
+PostgreSQL cannot build an index concurrently on a partitioned parent, so
+that index is built with a regular CREATE INDEX.
+
+game_sessions is not created by the initial migration (create_all builds it,
+with this index, at application start), so it is skipped when it does not
+exist yet.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5d29c4b7a13'
+down_revision = 'b41f0e8a6c27'
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(bind, table: str) -> bool:
+    return bind.execute(sa.text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}).scalar()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    if _table_exists(bind, 'game_sessions'):
+        op.create_index(
+            'ix_game_sessions_child_id_started_at', 'game_sessions',
+            ['child_id', sa.text('started_at DESC'), sa.text('id DESC')], unique=False,
+            postgresql_include=['completion_status', 'score', 'duration_seconds'],
+            if_not_exists=True
+        )
+        op.execute("DROP INDEX IF EXISTS ix_game_sessions_child_id")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_activities_child_id_completed_at', 'activities',
+            ['child_id', 'completed_at'], unique=False,
+            postgresql_include=['points_earned', 'verified_by_parent'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_activities_child_id")
+
+    if _table_exists(bind, 'game_sessions'):
+        op.execute("ANALYZE game_sessions")
+    op.execute("ANALYZE activities")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    if _table_exists(bind, 'game_sessions'):
+        op.create_index('ix_game_sessions_child_id', 'game_sessions', ['child_id'], unique=False)
+        op.drop_index('ix_game_sessions_child_id_started_at', table_name='game_sessions')
+
+    op.create_index('ix_activities_child_id', 'activities', ['child_id'], unique=False)
+    op.drop_index('ix_activities_child_id_completed_at', table_name='activities')
@@ -11,7 +11,7 @@ Centralized API Gateway with:
 
 import logging
 from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -21,6 +21,9 @@ from app.auth.routes import router as auth_router
 from app.users.routes import router as users_router
 from app.reports.routes import router as reports_router
 from app.professional.routes import router as professional_router
+from app.auth.dependencies import require_admin
+from app.auth.principals import CurrentUser
+from app.core.database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
@@ -306,6 +309,32 @@ async def api_v1_health_check() -> Dict[str, Any]:
     }
 
 
+# =============================================================================
+# DATABASE DIAGNOSTICS (Requires admin role)
+# =============================================================================
+
+@api_v1_router.get("/admin/database/performance", tags=["admin", "v1"])
+async def database_performance(current_user: CurrentUser = Depends(require_admin)) -> Dict[str, Any]:
+    """
+    Database size, connection and pool statistics (Admin only)
+    """
+    return DatabaseManager.get_performance_stats()
+
+
+@api_v1_router.get("/admin/database/slow-queries", tags=["admin", "v1"])
+async def database_slow_queries(
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum number of entries"),
+    current_user: CurrentUser = Depends(require_admin)
+) -> Dict[str, Any]:
+    """
+    Recent slow queries of this worker (Admin only)
+    
+    Each entry has the normalised SQL, bind parameter types, the application
+    call site and, for sampled SELECTs, an EXPLAIN (ANALYZE, BUFFERS) plan.
+    """
+    return DatabaseManager.get_slow_queries(limit)
+
+
 # =============================================================================
 # API ENDPOINTS DISCOVERY
 # =============================================================================
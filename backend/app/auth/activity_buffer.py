@@ -0,0 +1,185 @@
+"""
+Write-behind buffer for login and session-activity timestamps
+last_login_at (auth_users) and last_accessed_at (auth_user_sessions) change on
+nearly every login/request but nothing reads them on the request path. Instead
+of committing each one, they are coalesced in memory (latest value per row)
+and written every few seconds with one UPDATE ... FROM (VALUES ...) per column.
+
+Only these timestamps are buffered. failed_login_attempts and locked_until are
+still committed synchronously by AuthService, so account lockout is exact.
+While the database is unreachable the buffer holds at most max_rows rows;
+timestamps for further rows are dropped (and counted) rather than kept
+without bound.
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import DateTime, Integer, bindparam, column, or_, table, update, values
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+# target name -> (table, id column, timestamp column)
+TIMESTAMP_TARGETS: Dict[str, Tuple[str, str, str]] = {
+    "user_login": ("auth_users", "id", "last_login_at"),
+    "session_access": ("auth_user_sessions", "id", "last_accessed_at"),
+}
+
+
+def _target_table(target: str):
+    table_name, id_name, column_name = TIMESTAMP_TARGETS[target]
+    return table(table_name, column(id_name, Integer), column(column_name, DateTime(timezone=True))), id_name, column_name
+
+
+def build_timestamp_update(target: str, rows: Dict[int, datetime]):
+    """
+    UPDATE <table> SET <column> = v.ts FROM (VALUES ...) AS v(id, ts)
+
+    Rows whose stored timestamp is already newer are left alone, so flushes
+    from several workers can interleave in any order.
+    """
+    target_table, id_name, column_name = _target_table(target)
+    batch = values(
+        column("id", Integer), column("ts", DateTime(timezone=True)), name="v"
+    ).data(list(rows.items()))
+    stored = target_table.c[column_name]
+    return (
+        update(target_table)
+        .values({column_name: batch.c.ts})
+        .where(target_table.c[id_name] == batch.c.id)
+        .where(or_(stored.is_(None), stored < batch.c.ts))
+    )
+
+
+def write_timestamps(connection: Connection, target: str, rows: Dict[int, datetime]) -> None:
+    """Write one target's batch (executemany UPDATE on databases without UPDATE ... FROM (VALUES))"""
+    if connection.dialect.name == "postgresql":
+        connection.execute(build_timestamp_update(target, rows))
+        return
+    target_table, id_name, column_name = _target_table(target)
+    stored = target_table.c[column_name]
+    statement = (
+        update(target_table)
+        .values({column_name: bindparam("ts")})
+        .where(target_table.c[id_name] == bindparam("row_id"))
+        .where(or_(stored.is_(None), stored < bindparam("ts")))
+    )
+    connection.execute(statement, [{"row_id": row_id, "ts": at} for row_id, at in rows.items()])
+
+
+class ActivityTimestampBuffer:
+    """Coalesces timestamp updates per row and flushes them in batches"""
+
+    def __init__(self, flush_interval: float = 5.0, max_rows: int = 100000):
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[int, datetime]] = {target: {} for target in TIMESTAMP_TARGETS}
+        self._stats = {"recorded": 0, "flushes": 0, "rows_written": 0, "flush_errors": 0, "dropped": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Buffering is off (callers write through) when the flush interval is 0"""
+        return self.flush_interval > 0
+
+    def _merge(self, target: str, row_id: int, at: datetime) -> None:
+        """Keep the latest timestamp for a row (caller holds the lock)"""
+        pending = self._pending[target]
+        current = pending.get(row_id)
+        if current is None:
+            if sum(len(rows) for rows in self._pending.values()) >= self.max_rows:
+                self._stats["dropped"] += 1
+                return
+            pending[row_id] = at
+        elif at > current:
+            pending[row_id] = at
+
+    def record(self, target: str, row_id: int, at: Optional[datetime] = None) -> None:
+        at = at or datetime.now(timezone.utc)
+        with self._lock:
+            self._merge(target, row_id, at)
+            self._stats["recorded"] += 1
+
+    def record_login(self, user_id: int, at: Optional[datetime] = None) -> None:
+        self.record("user_login", user_id, at)
+
+    def record_session_access(self, session_id: int, at: Optional[datetime] = None) -> None:
+        self.record("session_access", session_id, at)
+
+    def flush(self, bind: Optional[Engine] = None) -> int:
+        """
+        Write all buffered timestamps in one transaction
+
+        On failure the batch is merged back into the buffer (newer values
+        recorded meanwhile win; rows beyond max_rows are dropped) and retried
+        on the next flush.
+
+        Returns:
+            Number of buffered rows written
+        """
+        with self._lock:
+            batches = {target: rows for target, rows in self._pending.items() if rows}
+            if not batches:
+                return 0
+            self._pending = {target: {} for target in TIMESTAMP_TARGETS}
+
+        written = sum(len(rows) for rows in batches.values())
+        try:
+            with (bind or engine).begin() as connection:
+                for target, rows in batches.items():
+                    write_timestamps(connection, target, rows)
+        except Exception as e:
+            with self._lock:
+                for target, rows in batches.items():
+                    for row_id, at in rows.items():
+                        self._merge(target, row_id, at)
+                self._stats["flush_errors"] += 1
+            logger.error(f"Error flushing {written} activity timestamps (kept for retry): {e}")
+            return 0
+
+        with self._lock:
+            self._stats["flushes"] += 1
+            self._stats["rows_written"] += written
+        logger.debug(f"Flushed {written} activity timestamps")
+        return written
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "pending": sum(len(rows) for rows in self._pending.values())}
+
+
+# Global buffer instance
+activity_buffer = ActivityTimestampBuffer(
+    flush_interval=settings.ACTIVITY_FLUSH_INTERVAL,
+    max_rows=settings.ACTIVITY_BUFFER_MAX_ROWS
+)
+
+
+async def activity_flush_loop(interval_seconds: float = 5.0) -> None:
+    """
+    Periodic flush of the activity buffer (run from the app lifespan, which
+    also flushes once more on shutdown)
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(activity_buffer.flush)
+        except Exception as e:
+            logger.error(f"Error in activity flush loop: {e}")
+
+
+__all__ = [
+    "TIMESTAMP_TARGETS",
+    "ActivityTimestampBuffer",
+    "activity_buffer",
+    "activity_flush_loop",
+    "build_timestamp_update",
+    "write_timestamps"
+]
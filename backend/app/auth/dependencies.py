@@ -13,6 +13,7 @@ from app.core.database import get_db
 from app.auth.models import User, UserRole, UserStatus
 from app.auth.services import AuthService, get_auth_service
 from app.auth.schemas import TokenData
+from app.auth.principals import Principal, CurrentUser, get_cached_principal, cache_principal
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -28,21 +29,43 @@ security = HTTPBearer(auto_error=False)
 # CORE AUTHENTICATION DEPENDENCIES
 # =============================================================================
 
+def _resolve_principal(auth_service: AuthService, token_data: TokenData, db: Session) -> Optional[CurrentUser]:
+    """
+    Resolve the user of a verified token, from the principal cache when possible
+    
+    Returns:
+        CurrentUser, or None if the user no longer exists
+    """
+    principal = get_cached_principal(token_data.user_id, token_data.issued_at)
+    if principal is not None:
+        return CurrentUser(principal, db)
+    
+    user = auth_service.get_user_by_id(token_data.user_id)
+    if not user:
+        return None
+    principal = Principal.from_user(user)
+    cache_principal(principal, token_data.issued_at)
+    return CurrentUser(principal, db, user)
+
 async def get_current_user(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> CurrentUser:
     """
     Get current authenticated user from JWT token
     
+    The user is resolved through the principal cache, so most requests do
+    not query the users table; attributes outside the principal load the
+    User row on first access.
+    
     Args:
         request: FastAPI request object
         credentials: HTTP Bearer credentials
         db: Database session
         
     Returns:
-        User object if authenticated, None otherwise
+        CurrentUser for the authenticated user
         
     Raises:
         HTTPException: If authentication fails
@@ -68,8 +91,8 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"}
             )
         
-        # Get user from database
-        user = auth_service.get_user_by_id(token_data.user_id)
+        # Resolve user (principal cache, then database)
+        user = _resolve_principal(auth_service, token_data, db)
         if not user:
             logger.warning(f"User not found for token: {token_data.user_id}")
             raise HTTPException(
@@ -93,8 +116,8 @@ async def get_current_user(
         )
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """
     Get current active user (must be active and verified)
     
@@ -124,8 +147,8 @@ async def get_current_active_user(
     return current_user
 
 async def get_current_verified_user(
-    current_user: User = Depends(get_current_active_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_active_user)
+) -> CurrentUser:
     """
     Get current verified user (must be active and email verified)
     
@@ -162,8 +185,8 @@ def require_role(allowed_roles: List[UserRole]) -> Callable:
         Dependency function that checks user role
     """
     async def role_checker(
-        current_user: User = Depends(get_current_verified_user)
-    ) -> User:
+        current_user: CurrentUser = Depends(get_current_verified_user)
+    ) -> CurrentUser:
         """
         Check if current user has required role
         
@@ -221,7 +244,7 @@ async def get_current_user_optional(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[CurrentUser]:
     """
     Get current user optionally (returns None if not authenticated)
     Useful for endpoints that work for both authenticated and anonymous users
@@ -246,8 +269,8 @@ async def get_current_user_optional(
         if not token_data:
             return None
         
-        # Get user from database
-        user = auth_service.get_user_by_id(token_data.user_id)
+        # Resolve user (principal cache, then database)
+        user = _resolve_principal(auth_service, token_data, db)
         if not user or not user.is_active:
             return None
         
@@ -376,9 +399,9 @@ def require_user_access(target_user_id_param: str = "user_id") -> Callable:
     """
     async def check_user_access(
         request: Request,
-        current_user: User = Depends(get_current_verified_user),
+        current_user: CurrentUser = Depends(get_current_verified_user),
         db: Session = Depends(get_db)
-    ) -> User:
+    ) -> CurrentUser:
         """
         Check if current user can access the target user
         """
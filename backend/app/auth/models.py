@@ -7,10 +7,12 @@ from datetime import datetime, timezone
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import validates
+from sqlalchemy.orm.attributes import set_committed_value
 from passlib.context import CryptContext
 import enum
 
 from app.core.database import Base
+from app.auth.activity_buffer import activity_buffer
 
 # Initialize password context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -227,8 +229,13 @@ class UserSession(Base):
         self.revoked_by = revoked_by
     
     def update_access(self) -> None:
-        """Update last accessed timestamp"""
-        self.last_accessed_at = datetime.now(timezone.utc)
+        """Update last accessed timestamp (written behind in a batch when buffering is enabled)"""
+        accessed_at = datetime.now(timezone.utc)
+        if activity_buffer.enabled and self.id is not None:
+            activity_buffer.record_session_access(self.id, accessed_at)
+            set_committed_value(self, "last_accessed_at", accessed_at)
+        else:
+            self.last_accessed_at = accessed_at
     
     __table_args__ = (
         Index('idx_session_user_active', 'user_id', 'is_active'),
@@ -0,0 +1,152 @@
+"""
+Authenticated principal cache
+Keeps a compact, immutable view of the authenticated user (id, role, status,
+activation and verification flags) per (user_id, token iat) for a short TTL,
+so authentication and role checks do not query the users table on every
+request. Entries are tagged with principal_tag(user_id) and dropped whenever
+the account changes (see invalidate_principal).
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from app.auth.models import User, UserRole, UserStatus
+from app.core.cache import performance_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authentication-relevant subset of a User"""
+    id: int
+    email: str
+    role: UserRole
+    status: UserStatus
+    is_active: bool
+    is_verified: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            status=user.status,
+            is_active=user.is_active,
+            is_verified=user.is_verified
+        )
+
+
+def principal_cache_key(user_id: int, issued_at: int) -> str:
+    """Generate cache key for the principal of one issued token"""
+    return f"principal:{user_id}:{issued_at}"
+
+
+def principal_tag(user_id: int) -> str:
+    """Generate invalidation tag for the cached principals of a user"""
+    return f"principal:{user_id}"
+
+
+def get_cached_principal(user_id: int, issued_at: Optional[int]) -> Optional[Principal]:
+    """Cached principal for a token, None on miss (or for tokens without iat)"""
+    if issued_at is None or settings.PRINCIPAL_CACHE_TTL_SECONDS <= 0:
+        return None
+    return performance_cache.get(principal_cache_key(user_id, issued_at))
+
+
+def cache_principal(principal: Principal, issued_at: Optional[int]) -> None:
+    """Store the principal for a token"""
+    if issued_at is None or settings.PRINCIPAL_CACHE_TTL_SECONDS <= 0:
+        return
+    performance_cache.set(
+        principal_cache_key(principal.id, issued_at),
+        principal,
+        ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        tags={principal_tag(principal.id)}
+    )
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop every cached principal of a user"""
+    removed = performance_cache.invalidate_tags(principal_tag(user_id))
+    if removed:
+        logger.debug(f"Invalidated {removed} cached principals for user {user_id}")
+
+
+class CurrentUser:
+    """
+    Stand-in for the authenticated User returned by get_current_user
+
+    Principal attributes are answered from the (cached) Principal. Reading
+    any other attribute loads the User row from the request's database
+    session on first use, so responses built from the account keep working.
+    The proxy is read-only: handlers that modify the account take the ORM
+    row from .user and change (and refresh) that.
+    """
+
+    __slots__ = ("principal", "_db", "_user")
+
+    def __init__(self, principal: Principal, db: Session, user: Optional[User] = None):
+        object.__setattr__(self, "principal", principal)
+        object.__setattr__(self, "_db", db)
+        object.__setattr__(self, "_user", user)
+
+    @property
+    def id(self) -> int:
+        return self.principal.id
+
+    @property
+    def email(self) -> str:
+        return self.principal.email
+
+    @property
+    def role(self) -> UserRole:
+        return self.principal.role
+
+    @property
+    def status(self) -> UserStatus:
+        return self.principal.status
+
+    @property
+    def is_active(self) -> bool:
+        return self.principal.is_active
+
+    @property
+    def is_verified(self) -> bool:
+        return self.principal.is_verified
+
+    @property
+    def user(self) -> User:
+        """The User row (loaded on first access)"""
+        user = self._user
+        if user is None:
+            user = self._db.get(User, self.principal.id)
+            if user is None:
+                raise LookupError(f"User {self.principal.id} no longer exists")
+            object.__setattr__(self, "_user", user)
+        return user
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.user, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"CurrentUser is read-only; assign {name!r} on current_user.user")
+
+    def __repr__(self) -> str:
+        return f"<CurrentUser {self.principal.id} ({self.principal.role.value})>"
+
+
+__all__ = [
+    "Principal",
+    "CurrentUser",
+    "principal_cache_key",
+    "principal_tag",
+    "get_cached_principal",
+    "cache_principal",
+    "invalidate_principal"
+]
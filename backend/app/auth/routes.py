@@ -9,8 +9,10 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
+from app.core.password_pool import password_pool, PasswordPoolSaturated
 from app.auth.models import User, UserRole, UserStatus
+from app.auth.principals import CurrentUser
 from app.auth.schemas import (
     UserRegister, UserLogin, UserResponse, LoginResponse, 
     RegisterResponse, PasswordChange, PasswordReset, 
@@ -26,6 +28,32 @@ from app.auth.dependencies import (
 # Create router
 router = APIRouter()
 
+async def _run_password_operation(operation, *args):
+    """
+    Run an AuthService method that hashes or verifies a password on the password pool
+    
+    Keeps bcrypt off the event loop; a saturated pool fails fast with 503.
+    The job opens its own session: the request's session is not thread-safe
+    and is closed when the request ends, while a started job runs to
+    completion even if the client has gone.
+    
+    Args:
+        operation: Unbound AuthService method, e.g. AuthService.create_user
+        *args: Arguments after self
+    """
+    def job():
+        with SessionLocal() as db:
+            return operation(AuthService(db), *args)
+    
+    try:
+        return await password_pool.run(job)
+    except PasswordPoolSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service is busy, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+
 # =============================================================================
 # AUTHENTICATION ENDPOINTS
 # =============================================================================
@@ -43,11 +71,8 @@ async def register_user(
     Supports both parent and professional registration.
     """
     try:
-        # Get auth service
-        auth_service = get_auth_service(db)
-        
         # Create user
-        user = auth_service.create_user(user_data)
+        user = await _run_password_operation(AuthService.create_user, user_data)
         
         # Create user response
         user_response = UserResponse.model_validate(user)
@@ -83,7 +108,9 @@ async def login_user(
         auth_service = get_auth_service(db)
         
         # Authenticate user
-        user = auth_service.authenticate_user(form_data.username, form_data.password)
+        user = await _run_password_operation(
+            AuthService.authenticate_user, form_data.username, form_data.password
+        )
         
         if not user:
             raise HTTPException(
@@ -164,7 +191,7 @@ async def refresh_token(
 
 @router.post("/logout")
 async def logout_user(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -198,7 +225,7 @@ async def logout_user(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_verified_user)
+    current_user: CurrentUser = Depends(get_current_verified_user)
 ):
     """
     Get current authenticated user profile
@@ -211,7 +238,7 @@ async def get_current_user_profile(
 @router.put("/me", response_model=UserResponse)
 async def update_current_user_profile(
     update_data: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -250,7 +277,7 @@ async def update_current_user_profile(
 @router.post("/change-password")
 async def change_password(
     password_data: PasswordChange,
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -264,7 +291,7 @@ async def change_password(
         auth_service = get_auth_service(db)
         
         # Change password
-        success = auth_service.change_password(current_user.id, password_data)
+        success = await _run_password_operation(AuthService.change_password, current_user.id, password_data)
         
         if not success:
             raise HTTPException(
@@ -333,11 +360,8 @@ async def reset_password(
     Completes the password reset process using the token sent via email.
     """
     try:
-        # Get auth service
-        auth_service = get_auth_service(db)
-        
         # Reset password
-        success = auth_service.reset_password(reset_data)
+        success = await _run_password_operation(AuthService.reset_password, reset_data)
         
         if not success:
             raise HTTPException(
@@ -407,7 +431,7 @@ async def get_users_list(
     skip: int = 0,
     limit: int = 100,
     role: Optional[UserRole] = None,
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -447,7 +471,7 @@ async def get_users_list(
 
 @router.get("/stats", response_model=Dict[str, Any])
 async def get_user_statistics(
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -481,7 +505,7 @@ async def get_user_statistics(
 
 @router.get("/parent-only")
 async def parent_only_endpoint(
-    current_user: User = Depends(require_parent)
+    current_user: CurrentUser = Depends(require_parent)
 ):
     """Example endpoint that requires parent role"""
     return {
@@ -492,7 +516,7 @@ async def parent_only_endpoint(
 
 @router.get("/professional-only")
 async def professional_only_endpoint(
-    current_user: User = Depends(require_professional)
+    current_user: CurrentUser = Depends(require_professional)
 ):
     """Example endpoint that requires professional role"""
     return {
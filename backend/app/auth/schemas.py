@@ -284,6 +284,7 @@ class TokenData(BaseModel):
     email: str = Field(..., description="User email")
     role: UserRoleSchema = Field(..., description="User role")
     session_id: Optional[str] = Field(None, description="Session ID")
+    issued_at: Optional[int] = Field(None, description="Token issue time (iat, epoch seconds)")
 
 # =============================================================================
 # RESPONSE SCHEMAS
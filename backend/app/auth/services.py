@@ -6,6 +6,7 @@ Comprehensive service layer for user management, authentication, and JWT handlin
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from pydantic import ValidationError
@@ -19,6 +20,9 @@ from app.auth.schemas import (
     PasswordResetConfirm, TokenData
 )
 from app.auth.utils import verify_password, get_password_hash, create_access_token, verify_token
+from app.auth.principals import invalidate_principal
+from app.core.token_cache import revoke_user_tokens
+from app.auth.activity_buffer import activity_buffer
 from app.core.config import settings
 
 # Configure logging
@@ -85,11 +89,22 @@ class AuthService:
                 logger.warning(f"Authentication failed: Invalid password for {email}")
                 return None
             
-            # Reset failed login attempts on successful authentication
-            user.failed_login_attempts = 0
-            user.locked_until = None
-            user.last_login_at = datetime.now(timezone.utc)
-            self.db.commit()
+            # Reset failed login attempts on successful authentication; this is
+            # committed right away so lockout counting stays exact, while
+            # last_login_at is written behind in a batch
+            login_at = datetime.now(timezone.utc)
+            if user.failed_login_attempts or user.locked_until is not None:
+                user.failed_login_attempts = 0
+                user.locked_until = None
+            if activity_buffer.enabled:
+                activity_buffer.record_login(user.id, login_at)
+            else:
+                user.last_login_at = login_at
+            if self.db.is_modified(user):
+                self.db.commit()
+            if activity_buffer.enabled:
+                # Visible on the returned object without marking it dirty
+                set_committed_value(user, "last_login_at", login_at)
             
             logger.info(f"User authenticated successfully: {email}")
             return user
@@ -234,6 +249,7 @@ class AuthService:
             user.updated_at = datetime.now(timezone.utc)
             self.db.commit()
             self.db.refresh(user)
+            invalidate_principal(user_id)
             
             logger.info(f"User updated successfully: {user.email}")
             return user
@@ -272,6 +288,8 @@ class AuthService:
             user.updated_at = datetime.now(timezone.utc)
             
             self.db.commit()
+            invalidate_principal(user_id)
+            revoke_user_tokens(user_id)
             logger.info(f"Password changed successfully for user {user_id}")
             return True
             
@@ -356,6 +374,8 @@ class AuthService:
             reset_token.used_at = datetime.now(timezone.utc)
             
             self.db.commit()
+            invalidate_principal(user.id)
+            revoke_user_tokens(user.id)
             logger.info(f"Password reset successfully for user {user.email}")
             return True
             
@@ -434,7 +454,8 @@ class AuthService:
             token_data = TokenData(
                 user_id=user_id,
                 email=email,
-                role=role
+                role=role,
+                issued_at=payload.get("iat")
             )
             
             return token_data
@@ -532,6 +553,8 @@ class AuthService:
             })
             
             self.db.commit()
+            invalidate_principal(user_id)
+            revoke_user_tokens(user_id)
             logger.info(f"All sessions invalidated for user {user_id}")
             return True
             
@@ -566,6 +589,7 @@ class AuthService:
             user.updated_at = datetime.now(timezone.utc)
             
             self.db.commit()
+            invalidate_principal(user_id)
             logger.info(f"Email verified for user: {user.email}")
             return True
             
@@ -597,6 +621,7 @@ class AuthService:
             self.invalidate_user_sessions(user_id)
             
             self.db.commit()
+            invalidate_principal(user_id)
             logger.info(f"User deactivated: {user.email}")
             return True
             
@@ -3,22 +3,727 @@ Performance Caching Service for Task 27
 Implements in-memory caching for frequently accessed data to improve response times
 """
 
+import abc
+import asyncio
+import copy
+import dataclasses
+import enum
+import hashlib
+import heapq
+import inspect
+import json
 import logging
+import math
+import pickle
+import random
+import sys
 import time
-from typing import Any, Dict, Optional, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Callable, Iterable, Set, Tuple
 from functools import wraps
 from datetime import datetime, timedelta
 import threading
+import zlib
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.shared_cache import SharedCacheTier
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# EVICTION POLICIES
+# =============================================================================
+
+class EvictionPolicy(abc.ABC):
+    """
+    Base class for size-bounded cache eviction policies
+    
+    The cache notifies the policy about inserts, accesses and removals and asks
+    it for a victim whenever a configured limit is exceeded.
+    """
+    
+    name = "base"
+    
+    @abc.abstractmethod
+    def record_insert(self, key: str) -> None:
+        """Track a newly stored key"""
+    
+    @abc.abstractmethod
+    def record_access(self, key: str) -> None:
+        """Track a cache hit on an existing key"""
+    
+    @abc.abstractmethod
+    def record_remove(self, key: str) -> None:
+        """Forget a key removed by delete, expiry or eviction"""
+    
+    @abc.abstractmethod
+    def select_victim(self) -> Optional[str]:
+        """Return the key that should be evicted next"""
+    
+    def admit(self, candidate: str, victim: str) -> bool:
+        """Decide whether a new key may displace the victim (default: always)"""
+        return True
+    
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Reset all policy state"""
+
+
+class LRUPolicy(EvictionPolicy):
+    """Least-recently-used eviction"""
+    
+    name = "lru"
+    
+    def __init__(self):
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+    
+    def record_insert(self, key: str) -> None:
+        self._order[key] = None
+        self._order.move_to_end(key)
+    
+    def record_access(self, key: str) -> None:
+        if key in self._order:
+            self._order.move_to_end(key)
+    
+    def record_remove(self, key: str) -> None:
+        self._order.pop(key, None)
+    
+    def select_victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+    
+    def clear(self) -> None:
+        self._order.clear()
+
+
+class FrequencySketch:
+    """
+    Count-min sketch with 4-bit style saturating counters and periodic aging
+    
+    Used by TinyLFU to estimate how often a key has been requested recently
+    without keeping per-key history for keys that are not cached. Aging halves
+    the counters in slices of _AGING_SLICE columns, one slice per increment,
+    so no single call (made with the cache lock held) walks the whole table.
+    """
+    
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+    _MAX_COUNT = 15
+    _AGING_SLICE = 256
+    
+    def __init__(self, capacity: int = 10000):
+        width = 1
+        while width < max(capacity * 4, 64):
+            width <<= 1
+        self._mask = width - 1
+        self._table = [[0] * width for _ in self._SEEDS]
+        self._sample_size = 10 * width
+        self._additions = 0
+        self._aging_cursor: Optional[int] = None  # Next column to halve while aging
+    
+    def _indexes(self, key: str):
+        for row, seed in enumerate(self._SEEDS):
+            yield row, hash((seed, key)) & self._mask
+    
+    def increment(self, key: str) -> None:
+        for row, index in self._indexes(key):
+            if self._table[row][index] < self._MAX_COUNT:
+                self._table[row][index] += 1
+        self._additions += 1
+        if self._aging_cursor is None and self._additions >= self._sample_size:
+            self._aging_cursor = 0
+            self._additions //= 2
+        if self._aging_cursor is not None:
+            self._age_slice()
+    
+    def frequency(self, key: str) -> int:
+        return min(self._table[row][index] for row, index in self._indexes(key))
+    
+    def _age_slice(self) -> None:
+        """Halve the next slice of counters so that old popularity decays"""
+        start = self._aging_cursor
+        end = min(start + self._AGING_SLICE, self._mask + 1)
+        for row in self._table:
+            row[start:end] = [count >> 1 for count in row[start:end]]
+        self._aging_cursor = end if end <= self._mask else None
+    
+    def clear(self) -> None:
+        for row in self._table:
+            for index in range(len(row)):
+                row[index] = 0
+        self._additions = 0
+        self._aging_cursor = None
+
+
+class TinyLFUPolicy(LRUPolicy):
+    """
+    W-TinyLFU-style admission on top of LRU ordering
+    
+    Recently inserted keys sit in a small admission window and are never
+    rejected; once the window is full, a new key only displaces the LRU victim
+    if the frequency sketch says it is requested more often. This stops
+    one-off lookups (e.g. a scan over every child) from flushing hot entries.
+    """
+    
+    name = "tinylfu"
+    
+    def __init__(self, capacity: int = 10000, window_ratio: float = 0.01):
+        super().__init__()
+        self._sketch = FrequencySketch(capacity)
+        self._window: "OrderedDict[str, None]" = OrderedDict()
+        self._window_size = max(1, int(capacity * window_ratio))
+    
+    def record_insert(self, key: str) -> None:
+        self._sketch.increment(key)
+        super().record_insert(key)
+        self._window[key] = None
+        while len(self._window) > self._window_size:
+            self._window.popitem(last=False)
+    
+    def record_access(self, key: str) -> None:
+        self._sketch.increment(key)
+        super().record_access(key)
+    
+    def record_remove(self, key: str) -> None:
+        super().record_remove(key)
+        self._window.pop(key, None)
+    
+    def record_miss(self, key: str) -> None:
+        """Count requests for keys that are not cached yet"""
+        self._sketch.increment(key)
+    
+    def select_victim(self) -> Optional[str]:
+        # Prefer victims outside the admission window
+        for key in self._order:
+            if key not in self._window:
+                return key
+        return super().select_victim()
+    
+    def admit(self, candidate: str, victim: str) -> bool:
+        if victim in self._window:
+            return True
+        return self._sketch.frequency(candidate) > self._sketch.frequency(victim)
+    
+    def clear(self) -> None:
+        super().clear()
+        self._window.clear()
+        self._sketch.clear()
+
+
+EVICTION_POLICIES = {
+    LRUPolicy.name: LRUPolicy,
+    TinyLFUPolicy.name: TinyLFUPolicy,
+}
+
+
+def create_eviction_policy(name: str, capacity: int = 10000) -> EvictionPolicy:
+    """
+    Build an eviction policy by name
+    
+    Args:
+        name: Policy name ("lru" or "tinylfu")
+        capacity: Expected number of entries (sizes the TinyLFU sketch)
+        
+    Returns:
+        EvictionPolicy instance
+    """
+    policy_name = (name or LRUPolicy.name).lower()
+    if policy_name not in EVICTION_POLICIES:
+        raise ValueError(f"Unknown cache eviction policy: {name}")
+    if policy_name == TinyLFUPolicy.name:
+        return TinyLFUPolicy(capacity=capacity or 10000)
+    return EVICTION_POLICIES[policy_name]()
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes
+    
+    Walks nested containers (bounded depth) so that large analytics dicts are
+    not counted as a single shallow object.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 6:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _depth + 1)
+    elif hasattr(value, "__slots__"):
+        for slot in value.__slots__:
+            size += estimate_size(getattr(value, slot, None), _depth + 1)
+    return size
+
+# =============================================================================
+# CACHE KEYS
+# =============================================================================
+
+def namespace_of(key: str) -> str:
+    """Namespace of a cache key: its prefix up to the first ':'"""
+    return key.partition(":")[0] or "default"
+
+
+# Nesting depth beyond which key arguments are reduced to their type name
+MAX_KEY_DEPTH = 8
+
+
+def normalize_key_value(value: Any, _depth: int = 0, _seen: Optional[Set[int]] = None) -> Any:
+    """
+    Convert a call argument into a JSON-serialisable, process-independent form
+    
+    Unlike str()/hash(), the result does not depend on object identity or on
+    the per-process hash seed, so every worker derives the same key. Database
+    sessions, reference cycles and structures nested deeper than
+    MAX_KEY_DEPTH are reduced to their type name.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, enum.Enum):
+        return normalize_key_value(value.value, _depth, _seen)
+    if isinstance(value, (datetime, timedelta)):
+        return str(value) if isinstance(value, timedelta) else value.isoformat()
+    if isinstance(value, bytes):
+        return value.hex()
+    
+    seen = _seen if _seen is not None else set()
+    if isinstance(value, (Session, AsyncSession)) or _depth >= MAX_KEY_DEPTH or id(value) in seen:
+        return f"<{type(value).__qualname__}>"
+    seen.add(id(value))
+    try:
+        if isinstance(value, dict):
+            return {
+                str(k): normalize_key_value(v, _depth + 1, seen)
+                for k, v in sorted(value.items(), key=lambda item: str(item[0]))
+            }
+        if isinstance(value, (list, tuple)):
+            return [normalize_key_value(item, _depth + 1, seen) for item in value]
+        if isinstance(value, (set, frozenset)):
+            return sorted((normalize_key_value(item, _depth + 1, seen) for item in value), key=repr)
+        if hasattr(value, "model_dump"):
+            return normalize_key_value(value.model_dump(mode="json"), _depth + 1, seen)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return normalize_key_value(dataclasses.asdict(value), _depth + 1, seen)
+        if hasattr(value, "__dict__"):
+            # Plain objects: use public attributes, never the identity-based repr
+            public_attrs = {k: v for k, v in vars(value).items() if not k.startswith("_")}
+            return {"__type__": type(value).__qualname__, **normalize_key_value(public_attrs, _depth + 1, seen)}
+        return repr(value)
+    finally:
+        seen.discard(id(value))
+
+
+class CacheKeyBuilder:
+    """
+    Build stable cache keys for a decorated callable
+    
+    Arguments are bound against the function signature (so positional vs
+    keyword calls and omitted defaults produce the same key), receivers and
+    database sessions are skipped, and the remainder is digested with
+    BLAKE2b. Keys keep the "<prefix>:<function>:" head so prefix-based
+    tooling still works.
+    """
+    
+    SKIP_PARAMETERS = frozenset({"self", "cls", "db"})
+    
+    def __init__(self, func: Callable, key_prefix: str = "", exclude: Iterable[str] = ()):
+        self._signature = inspect.signature(func)
+        self._head = f"{key_prefix}:{func.__qualname__}"
+        self._skip = self.SKIP_PARAMETERS | frozenset(exclude)
+    
+    def build(self, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """
+        Build the cache key for one call
+        
+        Args:
+            args: Positional call arguments
+            kwargs: Keyword call arguments
+            
+        Returns:
+            Deterministic cache key
+        """
+        try:
+            bound = self._signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+        except TypeError:
+            # Let the real call raise; key on what we have
+            arguments = {"args": list(args), "kwargs": kwargs}
+        
+        key_parts = {
+            name: normalize_key_value(value)
+            for name, value in arguments.items()
+            if name not in self._skip and not isinstance(value, (Session, AsyncSession))
+        }
+        payload = json.dumps(key_parts, sort_keys=True, default=repr, separators=(",", ":"))
+        digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self._head}:{digest}"
+
+# =============================================================================
+# REQUEST COALESCING
+# =============================================================================
+
+class _InFlightCall:
+    """Result holder shared between the leader and followers of a sync call"""
+    
+    __slots__ = ("event", "result", "error", "thread_id")
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.thread_id = threading.get_ident()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent computations of the same key
+    
+    The first caller for a key (the leader) runs the computation; callers
+    arriving while it is in flight wait for and share the leader's result.
+    Works for both sync callables (threads) and coroutines (event loops).
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._async_calls: Dict[Any, "asyncio.Future"] = {}
+        self.stats = {"leaders": 0, "coalesced": 0}
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn once per key across concurrent threads"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+                is_leader = True
+                self.stats["leaders"] += 1
+            elif call.thread_id == threading.get_ident():
+                # Re-entrant call for the same key: waiting would deadlock
+                call = None
+                is_leader = False
+            else:
+                is_leader = False
+        
+        if call is None:
+            return fn()
+        
+        if not is_leader:
+            call.event.wait()
+            with self._lock:
+                self.stats["coalesced"] += 1
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+    
+    async def do_async(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Await fn() once per key within the running event loop"""
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        
+        future = self._async_calls.get(flight_key)
+        if future is not None:
+            try:
+                result = await asyncio.shield(future)
+                self.stats["coalesced"] += 1
+                return result
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Leader was cancelled: compute on our own
+                return await fn()
+        
+        future = loop.create_future()
+        self._async_calls[flight_key] = future
+        self.stats["leaders"] += 1
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when there are no followers
+            raise
+        finally:
+            self._async_calls.pop(flight_key, None)
+
+
+def should_refresh_early(entry: Dict[str, Any], beta: float) -> bool:
+    """
+    XFetch probabilistic early expiration
+    
+    Returns True with increasing probability as the entry approaches its
+    expiry, scaled by how long the value took to compute. beta > 1 favours
+    earlier refreshes, beta < 1 later ones.
+    """
+    if beta <= 0 or not entry.get("compute_time"):
+        return False
+    jitter = -entry["compute_time"] * beta * math.log(1.0 - random.random())
+    return time.time() + jitter >= entry["expires_at"]
+
+# =============================================================================
+# STALE-WHILE-REVALIDATE
+# =============================================================================
+
+class BackgroundRefresher:
+    """
+    Run stale-while-revalidate refreshes off the request path
+    
+    Sync callables run on a bounded thread pool; coroutines are scheduled as
+    tasks on the caller's event loop. At most one refresh per key is in flight
+    and at most max_pending overall; extra requests are dropped (the stale
+    value keeps being served until a refresh gets through).
+    """
+    
+    def __init__(self, max_workers: int = 4, max_pending: int = 64):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._tasks: Set["asyncio.Task"] = set()
+        self.stats = {
+            "scheduled": 0,
+            "completed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "total_seconds": 0.0,
+            "max_seconds": 0.0
+        }
+    
+    def _begin(self, key: str) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return False
+            if len(self._pending) >= self.max_pending:
+                self.stats["dropped"] += 1
+                return False
+            self._pending.add(key)
+            self.stats["scheduled"] += 1
+            return True
+    
+    def _finish(self, key: str, started: float, succeeded: bool) -> None:
+        duration = time.perf_counter() - started
+        with self._lock:
+            self._pending.discard(key)
+            self.stats["completed" if succeeded else "failed"] += 1
+            self.stats["total_seconds"] += duration
+            self.stats["max_seconds"] = max(self.stats["max_seconds"], duration)
+    
+    def submit(self, key: str, fn: Callable[[], Any]) -> bool:
+        """Schedule a sync refresh; returns False if skipped"""
+        if not self._begin(key):
+            return False
+        
+        def run():
+            started = time.perf_counter()
+            succeeded = False
+            try:
+                fn()
+                succeeded = True
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed for {key}: {e}")
+            finally:
+                self._finish(key, started, succeeded)
+        
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="cache-refresh"
+                )
+            executor = self._executor
+        executor.submit(run)
+        return True
+    
+    def submit_async(self, key: str, fn: Callable[[], Any]) -> bool:
+        """Schedule a coroutine refresh on the running loop; returns False if skipped"""
+        if not self._begin(key):
+            return False
+        
+        async def run():
+            started = time.perf_counter()
+            succeeded = False
+            try:
+                await fn()
+                succeeded = True
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed for {key}: {e}")
+            finally:
+                self._finish(key, started, succeeded)
+        
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self.stats["completed"] + self.stats["failed"]
+            return {
+                **self.stats,
+                "in_flight": len(self._pending),
+                "average_seconds": round(self.stats["total_seconds"] / finished, 4) if finished else 0.0
+            }
+    
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the refresh thread pool"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+def _rebind_sessions(args: tuple, kwargs: Dict[str, Any]) -> Tuple[tuple, Dict[str, Any], List[Any]]:
+    """
+    Give a background refresh its own database sessions
+    
+    The request's Session/AsyncSession is not safe to share and is closed when
+    the request ends, so session arguments (and a receiver's ``db`` attribute)
+    are swapped for fresh sessions of the same kind that the caller must
+    close (see _close_sessions).
+    """
+    from app.core.database import AsyncSessionLocal, SessionLocal
+    
+    opened: List[Any] = []
+    
+    def is_session(value: Any) -> bool:
+        return isinstance(value, (Session, AsyncSession))
+    
+    def fresh_session(current: Any) -> Any:
+        session = AsyncSessionLocal() if isinstance(current, AsyncSession) else SessionLocal()
+        opened.append(session)
+        return session
+    
+    new_args = []
+    for index, arg in enumerate(args):
+        if is_session(arg):
+            arg = fresh_session(arg)
+        elif index == 0 and is_session(getattr(arg, "db", None)):
+            receiver = copy.copy(arg)
+            receiver.db = fresh_session(arg.db)
+            arg = receiver
+        new_args.append(arg)
+    new_kwargs = {
+        name: fresh_session(value) if is_session(value) else value
+        for name, value in kwargs.items()
+    }
+    return tuple(new_args), new_kwargs, opened
+
+
+async def _close_sessions(sessions: List[Any]) -> None:
+    """Close sessions opened by _rebind_sessions (sync and async)"""
+    for session in sessions:
+        if isinstance(session, AsyncSession):
+            await session.close()
+        else:
+            session.close()
+
+# =============================================================================
+# VALUE COMPRESSION
+# =============================================================================
+
+class CompressedValue:
+    """Pickled and zlib-compressed cache value, decoded on each hit"""
+    
+    __slots__ = ("payload", "raw_size")
+    
+    def __init__(self, payload: bytes, raw_size: int):
+        self.payload = payload
+        self.raw_size = raw_size
+    
+    def __reduce__(self):
+        return (CompressedValue, (self.payload, self.raw_size))
+
+
+class ValueCodec:
+    """
+    Compresses large cache values
+    
+    Values whose estimated size reaches the threshold are pickled and
+    zlib-compressed; smaller or incompressible values are stored as-is.
+    Decoding returns a fresh copy, so callers may mutate hit results freely.
+    """
+    
+    # Keep the compressed form only if it saves at least this fraction
+    MIN_SAVING = 0.1
+    
+    def __init__(self, threshold_bytes: int = 16384, level: int = 6):
+        self.threshold_bytes = max(0, threshold_bytes)
+        self.level = level
+    
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_bytes > 0
+    
+    def encode(self, value: Any, raw_size: int) -> Optional[CompressedValue]:
+        """
+        Compress a value
+        
+        Args:
+            value: Value to cache
+            raw_size: Estimated in-memory size of the value
+            
+        Returns:
+            CompressedValue, or None if the value should be stored uncompressed
+        """
+        if not self.enabled or raw_size < self.threshold_bytes:
+            return None
+        try:
+            payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), self.level)
+        except Exception as e:
+            logger.debug(f"Cache value not compressible ({type(value).__name__}): {e}")
+            return None
+        if len(payload) > raw_size * (1 - self.MIN_SAVING):
+            return None
+        return CompressedValue(payload, raw_size)
+    
+    @staticmethod
+    def decode(value: CompressedValue) -> Any:
+        """Restore the original value"""
+        return pickle.loads(zlib.decompress(value.payload))
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
 class PerformanceCache:
     """
     Simple in-memory cache for performance optimization
-    Thread-safe implementation with TTL support
+    Thread-safe implementation with TTL support and size-bounded eviction
+    
+    Optionally backed by a SharedCacheTier: local misses fall through to the
+    host-wide tier, writes go to both, and invalidations published by other
+    workers are applied locally (polled at most every shared_sync_interval).
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        eviction_policy: str = LRUPolicy.name,
+        compression_threshold: int = 0,
+        compression_level: int = 6
+    ):
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.RLock()
         self._stats = {
@@ -26,8 +731,89 @@ class PerformanceCache:
             "misses": 0,
             "sets": 0,
             "deletes": 0,
-            "cleanups": 0
+            "cleanups": 0,
+            "admission_rejections": 0,
+            "early_refreshes": 0,
+            "shared_hits": 0,
+            "stale_hits": 0,
+            "sweeps": 0,
+            "swept_entries": 0,
+            "compressions": 0,
+            "decompressions": 0,
+            "discarded_refreshes": 0
         }
+        self._evictions_by_policy: Dict[str, int] = {}
+        self._current_bytes = 0
+        # Incremented on every local store; an entry's generation identifies
+        # the exact value a refresh started from (see set(if_generation=...))
+        self._generation = 0
+        # Reverse index: tag -> keys carrying that tag (for targeted invalidation)
+        self._tag_index: Dict[str, Set[str]] = {}
+        # Min-heap of (stale_until, key) driving incremental expiry sweeps;
+        # may hold outdated pairs for overwritten/removed keys (skipped lazily)
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Old heap being compacted into _expiry_heap in bounded slices (None when idle)
+        self._compacting_heap: Optional[List[Tuple[float, str]]] = None
+        self._compacting_pos = 0
+        self._compacting_keys: Set[str] = set()  # Keys already moved (drops duplicate pairs)
+        # Per key-prefix counters (child_sessions, child_analytics, user_children, ...)
+        self._namespace_stats: Dict[str, Dict[str, float]] = {}
+        self.codec = ValueCodec(compression_threshold, compression_level)
+        # Original vs stored size of the entries currently held compressed
+        self._compressed_entries = 0
+        self._compressed_raw_bytes = 0
+        self._compressed_stored_bytes = 0
+        self.flights = SingleFlight()
+        self.refresher = BackgroundRefresher(
+            max_workers=settings.CACHE_REFRESH_WORKERS,
+            max_pending=settings.CACHE_REFRESH_MAX_PENDING
+        )
+        self._shared: Optional[SharedCacheTier] = None
+        self._shared_sync_interval = 0.5
+        self._shared_seq = 0
+        self._shared_last_sync = 0.0
+        self.configure(max_entries=max_entries, max_bytes=max_bytes, eviction_policy=eviction_policy)
+    
+    def attach_shared_tier(self, shared: Optional[SharedCacheTier], sync_interval: float = 0.5) -> None:
+        """
+        Put a cross-worker tier behind this cache
+        
+        Args:
+            shared: Shared tier (None detaches)
+            sync_interval: Max seconds between invalidation polls
+        """
+        with self._lock:
+            self._shared = shared
+            self._shared_sync_interval = sync_interval
+            self._shared_seq = shared.latest_sequence() if shared else 0
+            self._shared_last_sync = time.monotonic()
+    
+    def configure(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: Optional[str] = None
+    ) -> None:
+        """
+        Update size limits and/or eviction policy
+        
+        Args:
+            max_entries: Maximum number of entries (0 = unbounded)
+            max_bytes: Maximum estimated size in bytes (0 = unbounded)
+            eviction_policy: Policy name ("lru" or "tinylfu")
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max(0, max_entries)
+            if max_bytes is not None:
+                self.max_bytes = max(0, max_bytes)
+            if eviction_policy is not None:
+                self._policy = create_eviction_policy(eviction_policy, self.max_entries)
+                self._evictions_by_policy.setdefault(self._policy.name, 0)
+                # Rebuild ordering for entries already cached (oldest access first)
+                for key, entry in sorted(self._cache.items(), key=lambda item: item[1]["last_accessed"]):
+                    self._policy.record_insert(key)
+            self._enforce_limits()
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -39,25 +825,148 @@ class PerformanceCache:
         Returns:
             Cached value or None if not found/expired
         """
-        with self._lock:
-            if key not in self._cache:
-                self._stats["misses"] += 1
-                return None
+        entry = self.get_entry(key)
+        return entry["value"] if entry is not None else None
+    
+    def get_entry(
+        self,
+        key: str,
+        record_stats: bool = True,
+        allow_stale: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cache entry together with its metadata
+        
+        Args:
+            key: Cache key
+            record_stats: Whether to count the lookup as a hit/miss
+            allow_stale: Return entries past their TTL but inside their stale window
             
-            entry = self._cache[key]
+        Returns:
+            Dict with value, expires_at, compute_time, generation and stale
+            flag, or None if not found/expired
+        """
+        self._sync_shared_invalidations()
+        
+        with self._lock:
+            entry = self._cache.get(key)
             
-            # Check if expired
-            if entry["expires_at"] < time.time():
-                del self._cache[key]
-                self._stats["misses"] += 1
-                return None
+            # Check if expired (entries are kept until their stale window ends)
+            if entry is not None and entry["stale_until"] < time.time():
+                self._remove_entry(key)
+                entry = None
             
-            # Update access time
-            entry["last_accessed"] = time.time()
-            self._stats["hits"] += 1
-            return entry["value"]
+            if entry is not None:
+                result = self._entry_result(entry)
+                if result["stale"] and not allow_stale:
+                    return self._record_miss(key, record_stats)
+                # Update access time
+                entry["last_accessed"] = time.time()
+                if record_stats:
+                    self._policy.record_access(key)
+                    self._record_hit(key, stale=result["stale"])
+        
+        if entry is not None:
+            return self._decode_result(result)
+        
+        # Local miss: fall through to the shared tier (outside the lock)
+        if self._shared is not None:
+            shared_entry = self._shared.get(key)
+            if shared_entry is not None:
+                stored, size = self._prepare_value(key, shared_entry["value"])
+                with self._lock:
+                    self._store_local(
+                        key, stored, shared_entry["expires_at"],
+                        shared_entry["tags"], shared_entry["compute_time"],
+                        shared_entry["stale_until"], size=size
+                    )
+                    result = self._entry_result(shared_entry)
+                    if result["stale"] and not allow_stale:
+                        return self._record_miss(key, record_stats)
+                    if record_stats:
+                        self._record_hit(key, stale=result["stale"], shared=True)
+                return self._decode_result(result)
+        
+        with self._lock:
+            return self._record_miss(key, record_stats)
+    
+    @staticmethod
+    def _entry_result(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Public view of an entry returned by get_entry() (value still encoded)"""
+        return {
+            "value": entry["value"],
+            "expires_at": entry["expires_at"],
+            "compute_time": entry["compute_time"],
+            "generation": entry.get("generation", 0),
+            "stale": entry["expires_at"] < time.time()
+        }
     
-    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
+    def _decode_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Decompress a hit's value (called without the lock held)"""
+        if isinstance(result["value"], CompressedValue):
+            result["value"] = self.codec.decode(result["value"])
+            with self._lock:
+                self._stats["decompressions"] += 1
+        return result
+    
+    def _prepare_value(self, key: str, value: Any) -> Tuple[Any, int]:
+        """
+        Compress a value if the codec applies (called without the lock held)
+        
+        Returns:
+            (value to store, estimated stored size in bytes)
+        """
+        if isinstance(value, CompressedValue):
+            # Already encoded by another worker via the shared tier
+            return value, estimate_size(key) + estimate_size(value.payload)
+        raw_size = estimate_size(key) + estimate_size(value)
+        encoded = self.codec.encode(value, raw_size)
+        if encoded is None:
+            return value, raw_size
+        with self._lock:
+            self._stats["compressions"] += 1
+        return encoded, estimate_size(key) + estimate_size(encoded.payload)
+    
+    def _record_hit(self, key: str, stale: bool = False, shared: bool = False) -> None:
+        """Count a hit globally and for the key's namespace (lock held)"""
+        self._stats["hits"] += 1
+        self._namespace(key)["hits"] += 1
+        if shared:
+            self._stats["shared_hits"] += 1
+        if stale:
+            self._stats["stale_hits"] += 1
+    
+    def _record_miss(self, key: str, record_stats: bool) -> None:
+        """Count a miss (lock held)"""
+        if record_stats:
+            self._stats["misses"] += 1
+            self._namespace(key)["misses"] += 1
+            if isinstance(self._policy, TinyLFUPolicy):
+                self._policy.record_miss(key)
+        return None
+    
+    def _namespace(self, key: str) -> Dict[str, float]:
+        """Per-namespace counters for a key (lock held)"""
+        namespace = namespace_of(key)
+        counters = self._namespace_stats.get(namespace)
+        if counters is None:
+            counters = {
+                "hits": 0, "misses": 0, "sets": 0, "evictions": 0,
+                "entries": 0, "bytes": 0, "compute_count": 0, "compute_seconds": 0.0
+            }
+            self._namespace_stats[namespace] = counters
+        return counters
+    
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        tags: Optional[Iterable[str]] = None,
+        compute_time: float = 0.0,
+        stale_ttl: int = 0,
+        if_generation: Optional[int] = None
+    ) -> bool:
         """
         Set value in cache with TTL
         
@@ -65,16 +974,117 @@ class PerformanceCache:
             key: Cache key
             value: Value to cache
             ttl_seconds: Time to live in seconds (default: 5 minutes)
+            tags: Dependency tags (e.g. {"child:42", "user:7"}) used by invalidate_tags()
+            compute_time: Seconds it took to produce the value (drives early refresh)
+            stale_ttl: Extra seconds after expiry during which get_entry(allow_stale=True)
+                       still returns the value (stale-while-revalidate)
+            if_generation: Only store if the key still holds the entry of this generation
+                           (refreshes pass the generation they started from, so a result
+                           computed before an invalidation is dropped)
+        
+        Returns:
+            False if the value was not stored: discarded because of
+            if_generation, or rejected by max_bytes or admission (any older
+            value under the key is dropped in that case)
         """
+        expires_at = time.time() + ttl_seconds
+        stale_until = expires_at + max(0, stale_ttl)
+        entry_tags = frozenset(tags) if tags else frozenset()
+        stored, size = self._prepare_value(key, value)
+        if if_generation is not None:
+            self._sync_shared_invalidations(force=True)
         with self._lock:
-            expires_at = time.time() + ttl_seconds
-            self._cache[key] = {
-                "value": value,
-                "expires_at": expires_at,
-                "created_at": time.time(),
-                "last_accessed": time.time()
-            }
-            self._stats["sets"] += 1
+            if if_generation is not None:
+                current = self._cache.get(key)
+                if current is None or current.get("generation", 0) != if_generation:
+                    self._stats["discarded_refreshes"] += 1
+                    logger.debug(f"Discarded refresh result for {key} (invalidated while refreshing)")
+                    return False
+            accepted = self._store_local(key, stored, expires_at, entry_tags, compute_time, stale_until, size=size)
+            if accepted:
+                self._stats["sets"] += 1
+                counters = self._namespace(key)
+                counters["sets"] += 1
+                if compute_time > 0:
+                    counters["compute_count"] += 1
+                    counters["compute_seconds"] += compute_time
+        
+        if self._shared is not None:
+            if accepted:
+                self._shared.set(key, stored, expires_at, entry_tags, compute_time, stale_until)
+            else:
+                # The shared tier may still hold the value this one replaced
+                self._shared.delete(key)
+        return accepted
+    
+    def _store_local(
+        self,
+        key: str,
+        value: Any,
+        expires_at: float,
+        entry_tags: frozenset,
+        compute_time: float,
+        stale_until: Optional[float] = None,
+        size: Optional[int] = None
+    ) -> bool:
+        """
+        Insert an entry into the local tier, evicting as needed (lock held)
+        
+        Args:
+            size: Precomputed stored size (see _prepare_value)
+        
+        Returns:
+            True if stored, False if rejected by size limits or admission
+            (an existing entry for the key is removed either way)
+        """
+        if size is None:
+            size = estimate_size(key) + estimate_size(value)
+        
+        is_update = key in self._cache
+        if is_update:
+            self._remove_entry(key)
+        
+        if self.max_bytes and size > self.max_bytes:
+            logger.debug(f"Cache value for {key} exceeds max_bytes, not cached")
+            self._stats["admission_rejections"] += 1
+            return False
+        
+        # Make room for the new entry
+        while self._over_limit(extra_entries=1, extra_bytes=size):
+            victim = self._policy.select_victim()
+            if victim is None:
+                break
+            if not is_update and not self._policy.admit(key, victim):
+                self._stats["admission_rejections"] += 1
+                return False
+            self._evict(victim)
+        
+        now = time.time()
+        self._generation += 1
+        self._cache[key] = {
+            "value": value,
+            "generation": self._generation,
+            "expires_at": expires_at,
+            "stale_until": max(expires_at, stale_until or 0.0),
+            "created_at": now,
+            "last_accessed": now,
+            "size": size,
+            "tags": entry_tags,
+            "compute_time": compute_time
+        }
+        self._current_bytes += size
+        if isinstance(value, CompressedValue):
+            self._compressed_entries += 1
+            self._compressed_raw_bytes += value.raw_size
+            self._compressed_stored_bytes += size
+        counters = self._namespace(key)
+        counters["entries"] += 1
+        counters["bytes"] += size
+        for tag in entry_tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        heapq.heappush(self._expiry_heap, (self._cache[key]["stale_until"], key))
+        self._policy.record_insert(key)
+        return True
     
     def delete(self, key: str) -> bool:
         """
@@ -86,18 +1096,94 @@ class PerformanceCache:
         Returns:
             True if key existed, False otherwise
         """
+        if self._shared is not None:
+            self._shared.delete(key)
+        
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove_entry(key)
                 self._stats["deletes"] += 1
                 return True
             return False
     
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every entry carrying any of the given tags
+        
+        Cost is proportional to the number of matching entries, not to the
+        total cache size.
+        
+        Args:
+            tags: Tags to invalidate
+            
+        Returns:
+            Number of local entries removed
+        """
+        if self._shared is not None:
+            self._shared.invalidate_tags(tags)
+        
+        with self._lock:
+            removed = self._invalidate_local_tags(tags)
+            self._stats["deletes"] += removed
+            return removed
+    
     def clear(self) -> None:
         """Clear all cache entries"""
+        if self._shared is not None:
+            self._shared.clear()
+        self._clear_local()
+        logger.info("Cache cleared")
+    
+    def _invalidate_local_tags(self, tags: Iterable[str]) -> int:
+        """Remove local entries carrying any of the tags (lock held)"""
+        keys: Set[str] = set()
+        for tag in tags:
+            keys.update(self._tag_index.get(tag, ()))
+        
+        for key in keys:
+            self._remove_entry(key)
+        return len(keys)
+    
+    def _clear_local(self) -> None:
+        """Drop every local entry"""
         with self._lock:
             self._cache.clear()
-            logger.info("Cache cleared")
+            self._tag_index.clear()
+            self._expiry_heap.clear()
+            self._compacting_heap = None
+            self._compacting_keys = set()
+            for counters in self._namespace_stats.values():
+                counters["entries"] = 0
+                counters["bytes"] = 0
+            self._policy.clear()
+            self._current_bytes = 0
+            self._compressed_entries = 0
+            self._compressed_raw_bytes = 0
+            self._compressed_stored_bytes = 0
+    
+    def _sync_shared_invalidations(self, force: bool = False) -> None:
+        """Apply invalidations other workers published to the shared tier"""
+        if self._shared is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._shared_last_sync < self._shared_sync_interval:
+            return
+        self._shared_last_sync = now
+        
+        seq, events, gap = self._shared.invalidations_since(self._shared_seq)
+        with self._lock:
+            self._shared_seq = max(self._shared_seq, seq)
+            if gap:
+                logger.warning("Missed shared cache invalidations, clearing local tier")
+                self._clear_local()
+                return
+            for kind, target in events:
+                if kind == "key":
+                    self._remove_entry(target)
+                elif kind == "tag":
+                    self._invalidate_local_tags((target,))
+                elif kind == "clear":
+                    self._clear_local()
     
     def cleanup_expired(self) -> int:
         """
@@ -110,11 +1196,11 @@ class PerformanceCache:
             current_time = time.time()
             expired_keys = [
                 key for key, entry in self._cache.items()
-                if entry["expires_at"] < current_time
+                if entry["stale_until"] < current_time
             ]
             
             for key in expired_keys:
-                del self._cache[key]
+                self._remove_entry(key)
             
             if expired_keys:
                 self._stats["cleanups"] += 1
@@ -122,6 +1208,84 @@ class PerformanceCache:
             
             return len(expired_keys)
     
+    def sweep_expired(self, max_entries: int = 500) -> Tuple[int, int]:
+        """
+        Incrementally remove expired entries
+        
+        Visits at most max_entries heap items, so the lock is held for a
+        bounded time no matter how large the cache is. Call repeatedly (e.g.
+        from the maintenance loop) until fewer than max_entries items are
+        visited.
+        
+        Args:
+            max_entries: Maximum heap items to examine in this call
+            
+        Returns:
+            (entries removed, heap items visited)
+        """
+        with self._lock:
+            now = time.time()
+            removed = 0
+            visited = self._compact_expiry_heap(max_entries)
+            heap = self._expiry_heap
+            while heap and visited < max_entries and heap[0][0] < now:
+                _, key = heapq.heappop(heap)
+                visited += 1
+                entry = self._cache.get(key)
+                if entry is not None and entry["stale_until"] < now:
+                    self._remove_entry(key)
+                    removed += 1
+            
+            # Outdated pairs pile up when keys are overwritten; compact rarely,
+            # a slice per call, so no single call walks the whole heap
+            if self._compacting_heap is None and len(heap) > 2 * len(self._cache) + 1024:
+                self._compacting_heap = heap
+                self._compacting_pos = 0
+                self._compacting_keys = set()
+                self._expiry_heap = []
+            
+            self._stats["sweeps"] += 1
+            self._stats["swept_entries"] += removed
+            return removed, visited
+    
+    def _compact_expiry_heap(self, max_items: int) -> int:
+        """
+        Move the next slice of the old heap into _expiry_heap, keeping only
+        pairs that still match a cached entry (caller holds the lock)
+        
+        New pairs go straight into _expiry_heap meanwhile; expired entries
+        whose pair is still in the old heap are swept once it has been moved.
+        
+        Returns:
+            Number of old pairs examined
+        """
+        old = self._compacting_heap
+        if old is None:
+            return 0
+        start = self._compacting_pos
+        end = min(start + max_items, len(old))
+        for expires, key in old[start:end]:
+            entry = self._cache.get(key)
+            if entry is not None and entry["stale_until"] == expires and key not in self._compacting_keys:
+                self._compacting_keys.add(key)
+                heapq.heappush(self._expiry_heap, (expires, key))
+        if end == len(old):
+            self._compacting_heap = None
+            self._compacting_keys = set()
+        else:
+            self._compacting_pos = end
+        return end - start
+    
+    def prune_shared(self) -> int:
+        """
+        Prune the shared tier, if one is attached (SQLite I/O: call off the event loop)
+        
+        Returns:
+            Number of shared entries removed
+        """
+        shared = self._shared
+        return shared.prune() if shared is not None else 0
+    
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics
@@ -129,6 +1293,8 @@ class PerformanceCache:
         Returns:
             Cache statistics dictionary
         """
+        # The shared tier queries SQLite; never do that while holding the lock
+        shared_stats = self._shared.get_stats() if self._shared is not None else None
         with self._lock:
             total_requests = self._stats["hits"] + self._stats["misses"]
             hit_rate = (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0
@@ -138,18 +1304,109 @@ class PerformanceCache:
                 "total_requests": total_requests,
                 "hit_rate_percent": round(hit_rate, 2),
                 "cache_size": len(self._cache),
-                "memory_usage_estimate": self._estimate_memory_usage()
+                "memory_usage_estimate": self._estimate_memory_usage(),
+                "eviction_policy": self._policy.name,
+                "evictions": sum(self._evictions_by_policy.values()),
+                "evictions_by_policy": dict(self._evictions_by_policy),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "current_bytes": self._current_bytes,
+                "tag_count": len(self._tag_index),
+                "single_flight": dict(self.flights.stats),
+                "shared_tier": shared_stats,
+                "background_refresh": self.refresher.get_stats(),
+                "compression": self._compression_stats(),
+                "namespaces": self.get_namespace_stats()
             }
     
+    def get_namespace_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get hits, misses, evictions, bytes and compute latency per key prefix
+        
+        Returns:
+            Mapping of namespace to its counters
+        """
+        with self._lock:
+            result = {}
+            for namespace, counters in self._namespace_stats.items():
+                lookups = counters["hits"] + counters["misses"]
+                result[namespace] = {
+                    **counters,
+                    "hit_rate_percent": round(counters["hits"] / lookups * 100, 2) if lookups else 0.0,
+                    "avg_compute_seconds": (
+                        round(counters["compute_seconds"] / counters["compute_count"], 4)
+                        if counters["compute_count"] else 0.0
+                    )
+                }
+            return result
+    
+    def _compression_stats(self) -> Dict[str, Any]:
+        """Codec settings and the space saved by compressed entries (lock held)"""
+        stored = self._compressed_stored_bytes
+        return {
+            "enabled": self.codec.enabled,
+            "threshold_bytes": self.codec.threshold_bytes,
+            "compressed_entries": self._compressed_entries,
+            "raw_bytes": self._compressed_raw_bytes,
+            "stored_bytes": stored,
+            "ratio": round(self._compressed_raw_bytes / stored, 2) if stored else 1.0
+        }
+    
+    def record_early_refresh(self) -> None:
+        """Count a probabilistic early refresh triggered by a reader"""
+        with self._lock:
+            self._stats["early_refreshes"] += 1
+    
+    def _over_limit(self, extra_entries: int = 0, extra_bytes: int = 0) -> bool:
+        """Check whether the cache (plus a pending entry) exceeds its limits"""
+        if self.max_entries and len(self._cache) + extra_entries > self.max_entries:
+            return True
+        if self.max_bytes and self._current_bytes + extra_bytes > self.max_bytes:
+            return True
+        return False
+    
+    def _enforce_limits(self) -> None:
+        """Evict entries until the cache fits its configured limits"""
+        while self._over_limit():
+            victim = self._policy.select_victim()
+            if victim is None:
+                break
+            self._evict(victim)
+    
+    def _evict(self, key: str) -> None:
+        """Evict a single entry because of size limits"""
+        self._remove_entry(key)
+        self._evictions_by_policy[self._policy.name] = self._evictions_by_policy.get(self._policy.name, 0) + 1
+        self._namespace(key)["evictions"] += 1
+    
+    def _remove_entry(self, key: str) -> None:
+        """Drop an entry and keep size accounting and policy state in sync"""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry.get("size", 0)
+            if isinstance(entry["value"], CompressedValue):
+                self._compressed_entries -= 1
+                self._compressed_raw_bytes -= entry["value"].raw_size
+                self._compressed_stored_bytes -= entry.get("size", 0)
+            counters = self._namespace(key)
+            counters["entries"] -= 1
+            counters["bytes"] -= entry.get("size", 0)
+            for tag in entry.get("tags", ()):
+                tagged_keys = self._tag_index.get(tag)
+                if tagged_keys is not None:
+                    tagged_keys.discard(key)
+                    if not tagged_keys:
+                        del self._tag_index[tag]
+        self._policy.record_remove(key)
+    
     def _estimate_memory_usage(self) -> str:
-        """Estimate memory usage of cache (rough approximation)"""
-        import sys
+        """
+        Estimate memory usage of cache (rough approximation)
         
-        total_size = 0
-        for key, entry in self._cache.items():
-            total_size += sys.getsizeof(key)
-            total_size += sys.getsizeof(entry["value"])
-            total_size += sys.getsizeof(entry)
+        Uses the byte count tracked on insert/remove instead of walking
+        every entry under the lock.
+        """
+        total_size = self._current_bytes
         
         # Convert to human readable format
         if total_size < 1024:
@@ -160,15 +1417,50 @@ class PerformanceCache:
             return f"{total_size / (1024 * 1024):.1f} MB"
 
 # Global cache instance
-performance_cache = PerformanceCache()
+performance_cache = PerformanceCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    eviction_policy=settings.CACHE_EVICTION_POLICY,
+    compression_threshold=settings.CACHE_COMPRESSION_THRESHOLD,
+    compression_level=settings.CACHE_COMPRESSION_LEVEL
+)
+
+if settings.CACHE_SHARED_PATH:
+    try:
+        performance_cache.attach_shared_tier(
+            SharedCacheTier(settings.CACHE_SHARED_PATH, max_entries=settings.CACHE_MAX_ENTRIES),
+            sync_interval=settings.CACHE_SHARED_SYNC_INTERVAL
+        )
+    except Exception as e:
+        logger.error(f"Shared cache tier unavailable, using local cache only: {e}")
 
-def cached(ttl_seconds: int = 300, key_prefix: str = ""):
+def cached(
+    ttl_seconds: int = 300,
+    key_prefix: str = "",
+    tags: Optional[Callable[..., Iterable[str]]] = None,
+    single_flight: bool = True,
+    early_refresh_beta: float = 0.0,
+    exclude: Iterable[str] = (),
+    stale_ttl: int = 0
+):
     """
     Decorator for caching function results
     
+    Works for both regular functions and coroutines.
+    
     Args:
         ttl_seconds: Time to live in seconds
         key_prefix: Prefix for cache key
+        tags: Optional callable receiving the call arguments and returning
+              the dependency tags for the cached result
+        single_flight: Coalesce concurrent misses so only one caller computes per key
+        early_refresh_beta: Enable XFetch probabilistic early refresh (0 disables,
+                            1.0 is the usual setting)
+        exclude: Extra parameter names to leave out of the cache key
+                 (self/cls/db and Session arguments are always skipped)
+        stale_ttl: Seconds after expiry during which the old value is returned
+                   immediately while a background refresh recomputes it
+                   (stale-while-revalidate; 0 disables)
     
     Usage:
         @cached(ttl_seconds=600, key_prefix="user_data")
@@ -177,25 +1469,116 @@ def cached(ttl_seconds: int = 300, key_prefix: str = ""):
             return data
     """
     def decorator(func: Callable) -> Callable:
+        key_builder = CacheKeyBuilder(func, key_prefix=key_prefix, exclude=exclude)
+        
+        def lookup(cache_key: str) -> Tuple[str, Any, Optional[int]]:
+            """
+            Classify a lookup as "hit", "stale", "refresh" or "miss"
+            
+            Returns:
+                (state, cached value, generation of the cached entry)
+            """
+            entry = performance_cache.get_entry(cache_key, allow_stale=stale_ttl > 0)
+            if entry is None:
+                logger.debug(f"Cache miss for {func.__name__}")
+                return "miss", None, None
+            if entry["stale"]:
+                logger.debug(f"Stale cache hit for {func.__name__}")
+                return "stale", entry["value"], entry["generation"]
+            if should_refresh_early(entry, early_refresh_beta):
+                logger.debug(f"Early refresh for {func.__name__}")
+                performance_cache.record_early_refresh()
+                return "refresh", entry["value"], entry["generation"]
+            logger.debug(f"Cache hit for {func.__name__}")
+            return "hit", entry["value"], entry["generation"]
+        
+        def store(cache_key: str, result: Any, started: float, args, kwargs, generation: Optional[int] = None) -> None:
+            """Cache a result; refreshes pass the generation they replace"""
+            if result is None:
+                return
+            result_tags = tags(*args, **kwargs) if tags else None
+            performance_cache.set(
+                cache_key, result, ttl_seconds,
+                tags=result_tags, compute_time=time.perf_counter() - started,
+                stale_ttl=stale_ttl, if_generation=generation
+            )
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                # Generate cache key
+                cache_key = key_builder.build(args, kwargs)
+                
+                state, cached_result, generation = lookup(cache_key)
+                if state == "hit":
+                    return cached_result
+                if state == "stale":
+                    async def revalidate():
+                        bg_args, bg_kwargs, sessions = _rebind_sessions(args, kwargs)
+                        try:
+                            started = time.perf_counter()
+                            result = await func(*bg_args, **bg_kwargs)
+                            store(cache_key, result, started, args, kwargs, generation)
+                        finally:
+                            await _close_sessions(sessions)
+                    
+                    performance_cache.refresher.submit_async(cache_key, revalidate)
+                    return cached_result
+                is_refresh = state == "refresh"
+                
+                async def compute():
+                    if not is_refresh:
+                        # Another leader may have filled the key while we queued
+                        entry = performance_cache.get_entry(cache_key, record_stats=False)
+                        if entry is not None:
+                            return entry["value"]
+                    started = time.perf_counter()
+                    result = await func(*args, **kwargs)
+                    store(cache_key, result, started, args, kwargs, generation if is_refresh else None)
+                    return result
+                
+                if single_flight:
+                    return await performance_cache.flights.do_async(cache_key, compute)
+                return await compute()
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
+            cache_key = key_builder.build(args, kwargs)
             
-            # Try to get from cache
-            cached_result = performance_cache.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for {func.__name__}")
+            state, cached_result, generation = lookup(cache_key)
+            if state == "hit":
                 return cached_result
+            if state == "stale":
+                def revalidate():
+                    bg_args, bg_kwargs, sessions = _rebind_sessions(args, kwargs)
+                    try:
+                        started = time.perf_counter()
+                        store(cache_key, func(*bg_args, **bg_kwargs), started, args, kwargs, generation)
+                    finally:
+                        for session in sessions:
+                            session.close()
+                
+                performance_cache.refresher.submit(cache_key, revalidate)
+                return cached_result
+            is_refresh = state == "refresh"
             
-            # Cache miss - execute function
-            logger.debug(f"Cache miss for {func.__name__}")
-            result = func(*args, **kwargs)
-            
-            # Store in cache
-            performance_cache.set(cache_key, result, ttl_seconds)
+            def compute():
+                if not is_refresh:
+                    # Another leader may have filled the key while we queued
+                    entry = performance_cache.get_entry(cache_key, record_stats=False)
+                    if entry is not None:
+                        return entry["value"]
+                started = time.perf_counter()
+                result = func(*args, **kwargs)
+                store(cache_key, result, started, args, kwargs, generation if is_refresh else None)
+                return result
             
-            return result
+            if single_flight:
+                return performance_cache.flights.do(cache_key, compute)
+            return compute()
         
         return wrapper
     return decorator
@@ -212,31 +1595,23 @@ def cache_user_children(user_id: int) -> str:
     """Generate cache key for user's children"""
     return f"user_children:{user_id}"
 
+def child_tag(child_id: int) -> str:
+    """Generate invalidation tag for entries depending on a child"""
+    return f"child:{child_id}"
+
+def user_tag(user_id: int) -> str:
+    """Generate invalidation tag for entries depending on a user"""
+    return f"user:{user_id}"
+
 def invalidate_child_cache(child_id: int) -> None:
     """Invalidate all cache entries related to a child"""
-    patterns = [
-        f"child_sessions:{child_id}:",
-        f"child_analytics:{child_id}:",
-        f"child_progress:{child_id}:"
-    ]
-    
-    with performance_cache._lock:
-        keys_to_delete = []
-        for key in performance_cache._cache.keys():
-            for pattern in patterns:
-                if key.startswith(pattern):
-                    keys_to_delete.append(key)
-        
-        for key in keys_to_delete:
-            performance_cache.delete(key)
-        
-        if keys_to_delete:
-            logger.info(f"Invalidated {len(keys_to_delete)} cache entries for child {child_id}")
+    removed = performance_cache.invalidate_tags(child_tag(child_id))
+    if removed:
+        logger.info(f"Invalidated {removed} cache entries for child {child_id}")
 
 def invalidate_user_cache(user_id: int) -> None:
     """Invalidate all cache entries related to a user"""
-    pattern = f"user_children:{user_id}"
-    performance_cache.delete(pattern)
+    performance_cache.invalidate_tags(user_tag(user_id))
     logger.info(f"Invalidated cache entries for user {user_id}")
 
 # Performance monitoring function
@@ -260,3 +1635,44 @@ def periodic_cache_cleanup():
         
     except Exception as e:
         logger.error(f"Error during cache cleanup: {e}")
+
+async def cache_maintenance_loop(
+    interval_seconds: float = 30.0,
+    sweep_batch_size: int = 500,
+    max_batches_per_tick: int = 20,
+    stats_every_ticks: int = 10
+) -> None:
+    """
+    Background maintenance for the performance cache (run from the app lifespan)
+    
+    Each tick sweeps expired entries in bounded batches, yielding to the event
+    loop between batches, prunes the shared tier off-loop, and periodically
+    logs cache statistics.
+    
+    Args:
+        interval_seconds: Seconds between ticks
+        sweep_batch_size: Heap items examined per locked batch
+        max_batches_per_tick: Upper bound on batches per tick
+        stats_every_ticks: Log statistics every N ticks (0 disables)
+    """
+    tick = 0
+    while True:
+        await asyncio.sleep(interval_seconds)
+        tick += 1
+        try:
+            removed = 0
+            for _ in range(max_batches_per_tick):
+                batch_removed, visited = performance_cache.sweep_expired(sweep_batch_size)
+                removed += batch_removed
+                if visited < sweep_batch_size:
+                    break  # Caught up; a full batch may have skipped outdated pairs only
+                await asyncio.sleep(0)
+            if removed:
+                logger.debug(f"Cache maintenance swept {removed} expired entries")
+            
+            await asyncio.to_thread(performance_cache.prune_shared)
+            
+            if stats_every_ticks and tick % stats_every_ticks == 0:
+                log_cache_performance()
+        except Exception as e:
+            logger.error(f"Error during cache maintenance: {e}")
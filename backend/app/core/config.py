@@ -28,12 +28,67 @@ class Settings(BaseSettings):
     DATABASE_POOL_RECYCLE: int = Field(default=1800)  # Reduced from 3600 (30 min instead of 1 hour)
     DATABASE_POOL_PRE_PING: bool = Field(default=True)  # Enable connection validation
     DATABASE_ECHO: bool = Field(default=False)  # Control SQL logging separately from DEBUG
+    # Read replicas - comma-separated URLs used by read-only sessions (get_readonly_db); empty = primary only
+    DATABASE_REPLICA_URLS: str = Field(default="")
+    DATABASE_REPLICA_POOL_SIZE: int = Field(default=10)  # Per replica
+    DATABASE_REPLICA_MAX_OVERFLOW: int = Field(default=10)
+    # Async engine (asyncpg) used by async routes - separate pool from the sync engine
+    ASYNC_DATABASE_URL: str = Field(default="")  # Empty = derived from DATABASE_URL (postgresql+asyncpg://, sqlite+aiosqlite://)
+    DATABASE_ASYNC_POOL_SIZE: int = Field(default=10)
+    DATABASE_ASYNC_MAX_OVERFLOW: int = Field(default=10)
+    # Analytics (OLAP) pool - heavy population/cohort/export queries never compete with logins
+    ANALYTICS_DATABASE_URL: str = Field(default="")  # Empty = DATABASE_URL (point at a replica if available)
+    ANALYTICS_POOL_SIZE: int = Field(default=5)
+    ANALYTICS_MAX_OVERFLOW: int = Field(default=5)
+    ANALYTICS_POOL_TIMEOUT: int = Field(default=30)  # Analytics requests may wait longer for a connection
+    ANALYTICS_STATEMENT_TIMEOUT: str = Field(default="120s")
+    ANALYTICS_WORK_MEM: str = Field(default="64MB")  # Per sort/hash node; keep pool size * work_mem in check
+    # game_sessions monthly partitions (PostgreSQL) - see app/reports/partitions.py
+    GAME_SESSION_PARTITION_MONTHS_AHEAD: int = Field(default=3)  # Future months created in advance
+    GAME_SESSION_PARTITION_RETENTION_MONTHS: int = Field(default=0)  # Months kept attached (0 = never detach)
+    PARTITION_MAINTENANCE_INTERVAL: float = Field(default=3600.0)  # Seconds between maintenance runs (0 disables)
+
+    # SQL instrumentation - per-request query count/time, N+1 warnings, Server-Timing header
+    SQL_INSTRUMENTATION_ENABLED: bool = Field(default=True)
+    SQL_N_PLUS_ONE_THRESHOLD: int = Field(default=10)  # Repeats of one statement shape logged as N+1
+    SQL_SERVER_TIMING: bool = Field(default=True)  # Expose DB time in the Server-Timing response header
+    SLOW_QUERY_THRESHOLD_MS: float = Field(default=200.0)  # Statements slower than this are logged (0 disables)
+    SLOW_QUERY_BUFFER_SIZE: int = Field(default=200)  # Slow queries kept in memory per worker
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = Field(default=0.1)  # Fraction of slow SELECTs re-run with EXPLAIN ANALYZE
+
+    # Performance Cache Settings - bound in-process cache growth (0 disables a limit)
+    CACHE_MAX_ENTRIES: int = Field(default=10000)
+    CACHE_MAX_BYTES: int = Field(default=128 * 1024 * 1024)  # 128 MB per worker
+    CACHE_EVICTION_POLICY: str = Field(default="lru")  # "lru" or "tinylfu"
+    CACHE_SHARED_PATH: str = Field(default="")  # e.g. /dev/shm/smile_adventure_cache.db; empty disables the shared tier
+    CACHE_SHARED_SYNC_INTERVAL: float = Field(default=0.5)  # Max seconds before a worker sees another worker's invalidation
+    CACHE_REFRESH_WORKERS: int = Field(default=4)  # Threads for stale-while-revalidate refreshes
+    CACHE_REFRESH_MAX_PENDING: int = Field(default=64)  # Refreshes queued beyond this are skipped
+    CACHE_MAINTENANCE_INTERVAL: float = Field(default=30.0)  # Seconds between expiry sweeps (0 disables)
+    CACHE_SWEEP_BATCH_SIZE: int = Field(default=500)  # Entries examined per locked sweep batch
+    CACHE_COMPRESSION_THRESHOLD: int = Field(default=16384)  # Compress values estimated above this size (0 disables)
+    CACHE_COMPRESSION_LEVEL: int = Field(default=6)  # zlib level 1 (fast) - 9 (small)
       # JWT Security Configuration
     SECRET_KEY: str = Field(
         default="your-super-secret-key-change-this-in-production-please-make-it-longer-than-32-chars"
     )
     ALGORITHM: str = Field(default="HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(default=60)  # Cache authenticated principals per (user, token iat); 0 disables
+    TOKEN_CACHE_MAX_ENTRIES: int = Field(default=10000)  # Verified JWT payloads kept per worker until exp; 0 disables
+    PASSWORD_HASH_WORKERS: int = Field(default=4)  # Threads running bcrypt hash/verify per worker process
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=32)  # Password operations admitted at once; beyond this auth routes return 503
+    ACTIVITY_FLUSH_INTERVAL: float = Field(default=5.0)  # Seconds between write-behind flushes of login/session timestamps (0 writes through)
+    ACTIVITY_BUFFER_MAX_ROWS: int = Field(default=100000)  # Rows buffered (incl. failed flushes kept for retry) before new ones are dropped
+    
+    # Credential endpoint rate limiting (login, register, forgot-password; per worker)
+    RATE_LIMIT_ENABLED: bool = Field(default=True)
+    RATE_LIMIT_IP_BURST: int = Field(default=20)  # Requests an IP can make at once
+    RATE_LIMIT_IP_PER_MINUTE: float = Field(default=10.0)  # Sustained requests per IP
+    RATE_LIMIT_EMAIL_BURST: int = Field(default=5)  # Requests naming one account at once
+    RATE_LIMIT_EMAIL_PER_MINUTE: float = Field(default=2.0)  # Sustained requests per account
+    RATE_LIMIT_MAX_KEYS: int = Field(default=100000)  # Tracked buckets; beyond this new clients are not limited
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = Field(default=0)  # Reverse proxies appending to X-Forwarded-For; 0 ignores the header
     
     # Development Configuration
     AUTO_VERIFY_EMAIL: bool = Field(default=True)  # Auto-verify emails in development
@@ -4,13 +4,17 @@ Enhanced SQLAlchemy setup with PostgreSQL, connection pooling, and session manag
 """
 
 import logging
-from typing import Generator
+import random
+from typing import AsyncGenerator, Generator, List, Optional
 from sqlalchemy import create_engine, event, MetaData, text
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from app.core.config import settings
+from app.core.slow_queries import slow_query_log
 
 # Setup logging for database operations
 logger = logging.getLogger(__name__)
@@ -49,10 +53,176 @@ engine = create_engine(
     query_cache_size=1200,  # Increase query cache for better performance
 )
 
+# =============================================================================
+# READ REPLICA CONFIGURATION
+# =============================================================================
+
+def create_replica_engine(url: str) -> Engine:
+    """
+    Create the engine for one read replica
+    
+    PostgreSQL replicas get the same session options as the primary; other
+    backends (e.g. SQLite files standing in for replicas) use defaults.
+    """
+    options = {
+        "poolclass": QueuePool,
+        "pool_size": settings.DATABASE_REPLICA_POOL_SIZE,
+        "max_overflow": settings.DATABASE_REPLICA_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+    if make_url(url).get_backend_name() == "postgresql":
+        options.update(
+            isolation_level="READ_COMMITTED",
+            connect_args={
+                "application_name": f"{settings.APP_NAME}_v{settings.APP_VERSION}_replica",
+                "options": "-c timezone=UTC -c statement_timeout=30s -c idle_in_transaction_session_timeout=60s -c jit=off",
+                "connect_timeout": 10,
+            },
+        )
+    return create_engine(url, echo=settings.DATABASE_ECHO, future=True, query_cache_size=1200, **options)
+
+replica_engines: List[Engine] = [
+    create_replica_engine(url.strip())
+    for url in settings.DATABASE_REPLICA_URLS.split(",")
+    if url.strip()
+]
+
+# =============================================================================
+# ANALYTICS ENGINE CONFIGURATION
+# =============================================================================
+
+def _analytics_engine_options(url: str) -> dict:
+    """
+    Pool and connection options for the analytics engine
+    
+    The session options (statement_timeout, work_mem, ...) and isolation level
+    are PostgreSQL-only; other backends get the pool settings alone.
+    """
+    options = {
+        "poolclass": QueuePool,
+        "pool_size": settings.ANALYTICS_POOL_SIZE,
+        "max_overflow": settings.ANALYTICS_MAX_OVERFLOW,
+        "pool_timeout": settings.ANALYTICS_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+    if make_url(url).get_backend_name() == "postgresql":
+        options.update(
+            isolation_level="READ_COMMITTED",
+            connect_args={
+                "application_name": f"{settings.APP_NAME}_v{settings.APP_VERSION}_analytics",
+                "options": (
+                    f"-c timezone=UTC -c statement_timeout={settings.ANALYTICS_STATEMENT_TIMEOUT} "
+                    f"-c work_mem={settings.ANALYTICS_WORK_MEM} -c idle_in_transaction_session_timeout=60s "
+                    f"-c lock_timeout=10s"
+                ),
+                "connect_timeout": 10,
+            },
+        )
+    return options
+
+# Separate pool for long-running analytics (population, cohort, export) so a
+# few heavy reports cannot exhaust the pool used by logins and session writes
+_analytics_database_url = settings.ANALYTICS_DATABASE_URL or settings.DATABASE_URL
+analytics_engine = create_engine(
+    _analytics_database_url,
+    echo=settings.DATABASE_ECHO,
+    future=True,
+    query_cache_size=1200,
+    **_analytics_engine_options(_analytics_database_url)
+)
+
+# =============================================================================
+# ASYNC ENGINE CONFIGURATION
+# =============================================================================
+
+# Async driver used for each backend when DATABASE_URL names a sync driver
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+def get_async_database_url() -> Optional[str]:
+    """
+    URL of the async engine
+    
+    Uses ASYNC_DATABASE_URL when set, otherwise DATABASE_URL with its driver
+    switched to the backend's async counterpart (postgresql -> asyncpg,
+    sqlite -> aiosqlite).
+    
+    Returns:
+        The URL, or None if the backend has no known async driver
+    """
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    if url.get_dialect().is_async:
+        return settings.DATABASE_URL
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        return None
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+def _async_engine_options(url: str) -> dict:
+    """Pool and connection options for the async engine (asyncpg takes server_settings, not options)"""
+    if make_url(url).get_backend_name() != "postgresql":
+        return {}
+    return {
+        "pool_size": settings.DATABASE_ASYNC_POOL_SIZE,
+        "max_overflow": settings.DATABASE_ASYNC_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "isolation_level": "READ_COMMITTED",
+        "connect_args": {
+            "timeout": 10,  # Connection timeout
+            "server_settings": {
+                "application_name": f"{settings.APP_NAME}_v{settings.APP_VERSION}_async",
+                "timezone": "UTC",
+                "statement_timeout": "30s",
+                "idle_in_transaction_session_timeout": "60s",
+                "jit": "off",
+                "lock_timeout": "10s",
+            },
+        },
+    }
+
+# Async engine for async def routes: queries await the driver instead of
+# blocking the event loop (the sync engine stays for sync code paths).
+# None when the configured backend has no async driver; get_async_db then fails.
+_async_database_url = get_async_database_url()
+async_engine: Optional[AsyncEngine] = None
+if _async_database_url is not None:
+    async_engine = create_async_engine(
+        _async_database_url,
+        echo=settings.DATABASE_ECHO,
+        query_cache_size=1200,
+        **_async_engine_options(_async_database_url)
+    )
+else:
+    logger.warning(f"No async driver for {make_url(settings.DATABASE_URL).get_backend_name()}; async routes are unavailable")
+
 # =============================================================================
 # SESSION CONFIGURATION
 # =============================================================================
 
+class ReadOnlySession(Session):
+    """
+    Session for read-only units of work, served by a read replica
+    
+    Bound to one replica picked per session (the primary when no replicas
+    are configured). Flushing pending changes raises, so ORM writes can never
+    reach a replica - or be computed from replica data and written to the
+    primary. Endpoints that write must use get_db.
+    """
+    
+    def __init__(self, *args, replicas: Optional[List[Engine]] = None, **kwargs):
+        if replicas:
+            kwargs["bind"] = random.choice(replicas)
+        super().__init__(*args, **kwargs)
+
 # Create SessionLocal class with specific configuration
 SessionLocal = sessionmaker(
     bind=engine,
@@ -61,6 +231,32 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,  # Keep objects accessible after commit
 )
 
+# Sessions for read-only endpoints (dashboards, reports); replica when configured
+ReadOnlySessionLocal = sessionmaker(
+    class_=ReadOnlySession,
+    replicas=replica_engines,
+    bind=engine,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Sessions on the analytics pool (read-mostly reporting queries)
+AnalyticsSessionLocal = sessionmaker(
+    bind=analytics_engine,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# AsyncSession factory; expire_on_commit=False is required because expired
+# attributes cannot be lazy-loaded outside an await
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+) if async_engine is not None else None
+
 # =============================================================================
 # METADATA AND BASE MODEL
 # =============================================================================
@@ -103,6 +299,12 @@ def receive_before_commit(session):
     if settings.DEBUG:
         logger.debug("Database session committing changes")
 
+@event.listens_for(ReadOnlySession, "before_flush")
+def reject_read_only_flush(session, flush_context, instances):
+    """Refuse ORM writes on read-only sessions"""
+    if session.new or session.dirty or session.deleted:
+        raise InvalidRequestError("Read-only session cannot write; use get_db for endpoints that modify data")
+
 # =============================================================================
 # DATABASE DEPENDENCIES
 # =============================================================================
@@ -130,6 +332,75 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+def get_readonly_db() -> Generator[Session, None, None]:
+    """
+    Database session dependency for read-only endpoints
+    
+    Same contract as get_db, but reads are served by a read replica when
+    DATABASE_REPLICA_URLS is set and any attempt to flush changes raises.
+    Replicas may lag the primary slightly; endpoints that must see a write
+    made just before should keep using get_db.
+    
+    Yields:
+        Session: SQLAlchemy database session
+    """
+    db = ReadOnlySessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Read-only database session error: {type(e).__name__}: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def get_analytics_db() -> Generator[Session, None, None]:
+    """
+    Database session dependency for analytics endpoints
+    
+    Same contract as get_db, but on the dedicated analytics pool with a
+    longer statement_timeout and larger work_mem.
+    
+    Yields:
+        Session: SQLAlchemy database session
+    """
+    db = AnalyticsSessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Analytics database session error: {type(e).__name__}: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database session dependency for FastAPI
+    
+    Yields:
+        AsyncSession: SQLAlchemy async session
+        
+    Usage:
+        @app.get("/")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    
+    Note:
+        Lazy loading is not available on async sessions; load relationships
+        eagerly (selectinload/joinedload) in the query.
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError(f"No async driver configured for {make_url(settings.DATABASE_URL).get_backend_name()}; set ASYNC_DATABASE_URL")
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Async database session error: {type(e).__name__}: {str(e)}")
+            await db.rollback()
+            raise
+
 def get_db_sync() -> Session:
     """
     Get database session for synchronous operations
@@ -187,21 +458,25 @@ class DatabaseManager:
             return False
     
     @staticmethod
-    def get_pool_status() -> dict:
+    def get_pool_status(pool_engine: Engine = None) -> dict:
         """
         Get connection pool status information
         
+        Args:
+            pool_engine: Engine to inspect (default: the sync engine)
+        
         Returns:
             dict: Pool status information
         """
-        pool = engine.pool
+        pool = (pool_engine or engine).pool
+        capacity = pool.size() + pool.overflow()
         return {
             "pool_size": pool.size(),
             "checked_in": pool.checkedin(),
             "checked_out": pool.checkedout(),
             "overflow": pool.overflow(),
             "total_connections": pool.checkedin() + pool.checkedout(),
-            "utilization_percent": round(((pool.checkedin() + pool.checkedout()) / (pool.size() + pool.overflow())) * 100, 2)
+            "utilization_percent": round(((pool.checkedin() + pool.checkedout()) / capacity) * 100, 2) if capacity > 0 else 0.0
         }
     
     @staticmethod
@@ -266,6 +541,22 @@ class DatabaseManager:
             logger.error(f"Error getting performance stats: {e}")
             return {"error": str(e)}
     
+    @staticmethod
+    def get_slow_queries(limit: int = 50) -> dict:
+        """
+        Get the most recent slow queries captured by the slow-query log
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            dict: Slow-query log statistics and entries (newest first)
+        """
+        return {
+            "stats": slow_query_log.get_stats(),
+            "queries": slow_query_log.get_entries(limit)
+        }
+    
     @staticmethod
     def optimize_table(table_name: str) -> bool:
         """
@@ -321,6 +612,9 @@ db_manager = DatabaseManager()
 # Log database configuration on module import
 logger.info(f"Database engine configured for: {settings.DATABASE_URL.split('@')[-1]}")
 logger.info(f"Pool configuration: size={settings.DATABASE_POOL_SIZE}, overflow={settings.DATABASE_MAX_OVERFLOW}")
+if replica_engines:
+    logger.info(f"Read replicas configured: {len(replica_engines)} (used by read-only sessions)")
+logger.info(f"Analytics pool configuration: size={settings.ANALYTICS_POOL_SIZE}, overflow={settings.ANALYTICS_MAX_OVERFLOW}")
 
 # Export commonly used objects
 __all__ = [
@@ -329,6 +623,16 @@ __all__ = [
     "Base",
     "get_db",
     "get_db_sync",
+    "replica_engines",
+    "ReadOnlySession",
+    "ReadOnlySessionLocal",
+    "get_readonly_db",
+    "analytics_engine",
+    "AnalyticsSessionLocal",
+    "get_analytics_db",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_async_db",
     "DatabaseManager",
     "DatabaseSession",
     "db_manager"
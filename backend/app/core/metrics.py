@@ -0,0 +1,192 @@
+"""
+Prometheus text exposition for cache, database pool, password pool and rate limiter metrics
+Served by the /metrics endpoint in main.py
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.cache import performance_cache
+from app.core.database import DatabaseManager, async_engine, analytics_engine, replica_engines
+from app.core.password_pool import password_pool
+from app.core.rate_limit import credential_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "smile"
+
+# Content type expected by Prometheus scrapers for the text format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"  # charset is appended by the response
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class PrometheusWriter:
+    """Accumulates metric families in Prometheus text format"""
+
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def metric(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        samples: Iterable[Tuple[Optional[Dict[str, Any]], Any]]
+    ) -> None:
+        """
+        Add one metric family
+
+        Args:
+            name: Metric name without the global prefix
+            metric_type: "counter" or "gauge"
+            help_text: HELP line text
+            samples: (labels or None, value) pairs
+        """
+        full_name = f"{METRIC_PREFIX}_{name}"
+        self._lines.append(f"# HELP {full_name} {help_text}")
+        self._lines.append(f"# TYPE {full_name} {metric_type}")
+        for labels, value in samples:
+            if value is None:
+                continue
+            if labels:
+                label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in sorted(labels.items()))
+                self._lines.append(f"{full_name}{{{label_text}}} {float(value)}")
+            else:
+                self._lines.append(f"{full_name} {float(value)}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _cache_metrics(writer: PrometheusWriter) -> None:
+    stats = performance_cache.get_stats()
+    namespaces = stats["namespaces"]
+
+    def per_namespace(field: str):
+        return [({"namespace": ns}, counters[field]) for ns, counters in sorted(namespaces.items())]
+
+    writer.metric("cache_hits_total", "counter", "Cache hits by key namespace", per_namespace("hits"))
+    writer.metric("cache_misses_total", "counter", "Cache misses by key namespace", per_namespace("misses"))
+    writer.metric("cache_sets_total", "counter", "Cache writes by key namespace", per_namespace("sets"))
+    writer.metric("cache_evictions_total", "counter", "Size-limit evictions by key namespace",
+                  per_namespace("evictions"))
+    writer.metric("cache_entries", "gauge", "Cached entries by key namespace", per_namespace("entries"))
+    writer.metric("cache_bytes", "gauge", "Estimated cached bytes by key namespace", per_namespace("bytes"))
+    writer.metric("cache_compute_seconds_total", "counter",
+                  "Time spent computing cached values by key namespace", per_namespace("compute_seconds"))
+    writer.metric("cache_compute_total", "counter",
+                  "Number of cached value computations by key namespace", per_namespace("compute_count"))
+
+    writer.metric("cache_evictions_by_policy_total", "counter", "Size-limit evictions by eviction policy",
+                  [({"policy": policy}, count) for policy, count in sorted(stats["evictions_by_policy"].items())])
+    writer.metric("cache_admission_rejections_total", "counter", "Writes rejected by size limits or admission",
+                  [(None, stats["admission_rejections"])])
+    writer.metric("cache_stale_hits_total", "counter", "Stale values served while revalidating",
+                  [(None, stats["stale_hits"])])
+    writer.metric("cache_early_refreshes_total", "counter", "Probabilistic early refreshes",
+                  [(None, stats["early_refreshes"])])
+    writer.metric("cache_shared_hits_total", "counter", "Local misses served by the shared tier",
+                  [(None, stats["shared_hits"])])
+    writer.metric("cache_swept_entries_total", "counter", "Expired entries removed by maintenance sweeps",
+                  [(None, stats["swept_entries"])])
+    writer.metric("cache_max_entries", "gauge", "Configured entry limit (0 = unbounded)",
+                  [(None, stats["max_entries"])])
+    writer.metric("cache_max_bytes", "gauge", "Configured byte limit (0 = unbounded)",
+                  [(None, stats["max_bytes"])])
+
+    compression = stats["compression"]
+    writer.metric("cache_compressed_entries", "gauge", "Entries stored compressed",
+                  [(None, compression["compressed_entries"])])
+    writer.metric("cache_compressed_raw_bytes", "gauge", "Estimated size of compressed entries before compression",
+                  [(None, compression["raw_bytes"])])
+    writer.metric("cache_compressed_stored_bytes", "gauge", "Stored size of compressed entries",
+                  [(None, compression["stored_bytes"])])
+    writer.metric("cache_compression_ratio", "gauge", "Raw/stored size ratio of compressed entries",
+                  [(None, compression["ratio"])])
+
+    flights = stats["single_flight"]
+    writer.metric("cache_single_flight_total", "counter", "Single-flight computations by role",
+                  [({"role": "leader"}, flights["leaders"]), ({"role": "coalesced"}, flights["coalesced"])])
+
+    refresh = stats["background_refresh"]
+    writer.metric("cache_background_refresh_total", "counter", "Background refreshes by outcome",
+                  [({"outcome": outcome}, refresh[outcome])
+                   for outcome in ("scheduled", "completed", "failed", "dropped")])
+    writer.metric("cache_background_refresh_seconds_total", "counter", "Time spent in background refreshes",
+                  [(None, refresh["total_seconds"])])
+    writer.metric("cache_background_refresh_in_flight", "gauge", "Background refreshes in flight",
+                  [(None, refresh["in_flight"])])
+
+
+def _pool_metrics(writer: PrometheusWriter) -> None:
+    pools = {
+        "sync": DatabaseManager.get_pool_status(),
+        "analytics": DatabaseManager.get_pool_status(analytics_engine)
+    }
+    if async_engine is not None:
+        pools["async"] = DatabaseManager.get_pool_status(async_engine.sync_engine)
+    for index, replica in enumerate(replica_engines):
+        pools[f"replica{index}"] = DatabaseManager.get_pool_status(replica)
+    for field, help_text in (
+        ("pool_size", "Configured connection pool size"),
+        ("checked_in", "Idle connections in the pool"),
+        ("checked_out", "Connections in use"),
+        ("overflow", "Overflow connections currently open"),
+        ("total_connections", "Connections held by the pool"),
+        ("utilization_percent", "Pool utilization percentage"),
+    ):
+        writer.metric(f"db_pool_{field}", "gauge", help_text,
+                      [({"pool": name}, status.get(field)) for name, status in pools.items()])
+
+
+def _password_pool_metrics(writer: PrometheusWriter) -> None:
+    stats = password_pool.get_stats()
+    writer.metric("password_pool_queue_depth", "gauge", "Password operations waiting for a hashing thread",
+                  [(None, stats["queue_depth"])])
+    writer.metric("password_pool_running", "gauge", "Password operations being hashed",
+                  [(None, stats["running"])])
+    writer.metric("password_pool_max_pending", "gauge", "Admission cap of the password pool",
+                  [(None, stats["max_pending"])])
+    writer.metric("password_pool_operations_total", "counter", "Password operations by outcome",
+                  [({"outcome": outcome}, stats[outcome]) for outcome in ("completed", "failed", "rejected")])
+    writer.metric("password_pool_wait_seconds_total", "counter", "Time password operations spent queued",
+                  [(None, stats["wait_seconds"])])
+    writer.metric("password_pool_run_seconds_total", "counter", "Time spent running password operations",
+                  [(None, stats["run_seconds"])])
+
+
+def _rate_limit_metrics(writer: PrometheusWriter) -> None:
+    stats = credential_rate_limiter.get_stats()
+    writer.metric("rate_limit_allowed_total", "counter", "Credential requests admitted by the rate limiter",
+                  [(None, stats["allowed"])])
+    writer.metric("rate_limit_rejected_total", "counter", "Credential requests rejected by endpoint and bucket scope",
+                  [({"endpoint": row["endpoint"], "scope": row["scope"]}, row["count"]) for row in stats["rejected"]])
+    writer.metric("rate_limit_saved_seconds_total", "counter",
+                  "Estimated password hashing time avoided by rejected requests",
+                  [(None, stats["estimated_saved_seconds"])])
+    writer.metric("rate_limit_tracked_keys", "gauge", "Token buckets currently tracked",
+                  [(None, stats["tracked_keys"])])
+    writer.metric("rate_limit_untracked_total", "counter", "Requests let through because the bucket store was full",
+                  [(None, stats["untracked"])])
+
+
+def render_prometheus_metrics() -> str:
+    """
+    Render all application metrics in Prometheus text format
+
+    Returns:
+        Exposition text
+    """
+    writer = PrometheusWriter()
+    for collector in (_cache_metrics, _pool_metrics, _password_pool_metrics, _rate_limit_metrics):
+        try:
+            collector(writer)
+        except Exception as e:
+            logger.error(f"Error collecting metrics in {collector.__name__}: {e}")
+    return writer.render()
+
+
+__all__ = ["render_prometheus_metrics", "PrometheusWriter", "PROMETHEUS_CONTENT_TYPE"]
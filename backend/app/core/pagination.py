@@ -0,0 +1,128 @@
+"""
+Keyset (cursor) pagination helpers
+Pages are fetched with WHERE (sort_column, id) < (last_value, last_id) instead of
+OFFSET, so deep pages cost the same as the first one
+"""
+
+import base64
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import desc, tuple_
+from sqlalchemy.orm import Query
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+@dataclass
+class KeysetPage:
+    """One page of results plus the cursor for the next page"""
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total_count: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """Opaque cursor for the position after (sort_value, row_id)"""
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def keyset_paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    page_size: int,
+    cursor: Optional[str] = None,
+    offset: int = 0
+) -> KeysetPage:
+    """
+    Fetch one page, newest first, ordered by (sort_column, id_column)
+
+    Args:
+        query: Filtered ORM query (without ordering/limit)
+        sort_column: Timestamp column (e.g. GameSession.started_at)
+        id_column: Unique tiebreaker column (primary key)
+        page_size: Items per page
+        cursor: Cursor returned with the previous page (None for the first page)
+        offset: Legacy page offset, only used when no cursor is given
+
+    Returns:
+        KeysetPage with the items and the next cursor (None on the last page)
+    """
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        query = query.filter(tuple_(sort_column, id_column) < tuple_(sort_value, last_id))
+
+    query = query.order_by(desc(sort_column), desc(id_column))
+    if offset and not cursor:
+        query = query.offset(offset)
+    rows = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return KeysetPage(items=rows, next_cursor=next_cursor)
+
+
+def count_rows(query: Query, estimated: bool = False) -> Tuple[int, bool]:
+    """
+    Count the rows a query matches
+
+    With estimated=True on PostgreSQL the planner's row estimate is used
+    (EXPLAIN, no scan); other backends fall back to an exact COUNT(*).
+
+    Returns:
+        (count, is_estimate)
+    """
+    query = query.order_by(None)
+    session = query.session
+    statement = query.statement
+    if estimated:
+        bind = session.get_bind(clause=statement)
+        if bind.dialect.name == "postgresql":
+            try:
+                compiled = statement.compile(dialect=bind.dialect, compile_kwargs={"render_postcompile": True})
+                connection = session.connection(bind_arguments={"clause": statement})
+                with connection.begin_nested():  # A failed EXPLAIN must not abort the request transaction
+                    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"]), True
+            except Exception as e:
+                logger.debug(f"Row estimate failed, counting exactly: {e}")
+    return query.count(), False
+
+
+__all__ = [
+    "InvalidCursorError",
+    "KeysetPage",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_paginate",
+    "count_rows"
+]
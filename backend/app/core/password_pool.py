@@ -0,0 +1,117 @@
+"""
+Bounded executor for password hashing
+bcrypt at 12 rounds costs a few hundred milliseconds of CPU per hash or
+verification. Running it inside an async route blocks the event loop of the
+worker for that long, so the auth routes submit every password operation here
+instead: a small thread pool (bcrypt releases the GIL while hashing) with an
+admission cap. When the cap is reached, callers get PasswordPoolSaturated
+immediately (surfaced as 503) rather than queueing behind a login burst.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordPoolSaturated(Exception):
+    """Raised when the password pool has no free admission slot"""
+
+
+class PasswordHashingPool:
+    """
+    Thread pool for CPU-bound password work with a cap on admitted jobs
+
+    Args:
+        max_workers: Threads hashing in parallel
+        max_pending: Jobs admitted at once (running + queued); beyond this, run() rejects
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 32):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0,
+                       "wait_seconds": 0.0, "run_seconds": 0.0}
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run fn(*args, **kwargs) on the pool and await its result
+
+        Raises:
+            PasswordPoolSaturated: If max_pending jobs are already admitted
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                raise PasswordPoolSaturated(f"{self._pending} password operations already pending")
+            self._pending += 1
+            self._stats["submitted"] += 1
+        try:
+            future = self._executor.submit(self._call, time.perf_counter(), partial(fn, *args, **kwargs))
+        except RuntimeError:
+            self._release(None)
+            raise
+        # Released when the job finishes or is cancelled before starting, not when the caller stops waiting
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _call(self, submitted_at: float, job: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            self._stats["wait_seconds"] += started - submitted_at
+        try:
+            return job()
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._stats["run_seconds"] += time.perf_counter() - started
+
+    def _release(self, future: Optional[Future]) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future is None or future.cancelled():
+                return
+            if future.exception() is not None:
+                self._stats["failed"] += 1
+            else:
+                self._stats["completed"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size, queue depth and cumulative counters"""
+        with self._lock:
+            finished = self._stats["completed"] + self._stats["failed"]
+            return {
+                **self._stats,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "avg_wait_ms": round(self._stats["wait_seconds"] / finished * 1000, 2) if finished else 0.0,
+                "avg_run_ms": round(self._stats["run_seconds"] / finished * 1000, 2) if finished else 0.0
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global pool instance
+password_pool = PasswordHashingPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
+
+__all__ = ["PasswordHashingPool", "PasswordPoolSaturated", "password_pool"]
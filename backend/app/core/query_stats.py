@@ -0,0 +1,226 @@
+"""
+Per-request SQL instrumentation
+Counts queries and DB time for each request through SQLAlchemy cursor events,
+flags repeated statement shapes (N+1 patterns) and reports the totals in a
+Server-Timing header
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Statement shape normalisation: literals and expanded IN lists collapse so
+# "WHERE child_id = 1" and "WHERE child_id = 2" count as the same shape
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAM_LIST_PATTERN = re.compile(r"\((?:\s*(?:\?|%s|%\(\w+\)s|\$\d+|:\w+)\s*,?)+\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a SQL statement to its shape (literals and parameter lists removed)"""
+    shape = _LITERAL_PATTERN.sub("?", statement)
+    shape = _PARAM_LIST_PATTERN.sub("(?)", shape)
+    return _WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """Queries executed during one request (or one tracked block)"""
+
+    def __init__(self):
+        self.query_count = 0
+        self.total_seconds = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.query_count += 1
+        self.total_seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statement shapes executed at least threshold times (likely N+1 loops)
+
+        Returns:
+            (shape, count) pairs, most repeated first
+        """
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def server_timing(self, threshold: int) -> str:
+        """Server-Timing header value for these stats"""
+        value = f'db;dur={self.total_seconds * 1000:.1f};desc="{self.query_count} queries"'
+        repeated = self.repeated_shapes(threshold)
+        if repeated:
+            value += f', db-repeated;desc="{len(repeated)} shapes, max {repeated[0][1]}x"'
+        return value
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# =============================================================================
+# SQLALCHEMY EVENTS
+# =============================================================================
+
+# Consumers of statement timings: (is_active, on_query) pairs. One pair of
+# cursor listeners times each statement once and hands the duration to every
+# consumer, so the per-request stats and the slow-query log share the timer.
+QueryTimingCallback = Callable[[Any, str, Any, bool, float], None]
+_query_timers: List[Tuple[Callable[[], bool], QueryTimingCallback]] = []
+
+
+def add_query_timer(is_active: Callable[[], bool], on_query: QueryTimingCallback) -> None:
+    """
+    Receive the duration of every SQL statement executed on any Engine
+
+    Args:
+        is_active: Checked before each statement; the statement is only timed
+                   when at least one consumer is active
+        on_query: Called after the statement with (connection, statement,
+                  parameters, executemany, seconds); exceptions are logged and
+                  do not affect the query or other consumers
+    """
+    _query_timers.append((is_active, on_query))
+
+
+# The start time lives on the execution context, not on the pooled connection,
+# so a statement that raises leaves nothing behind
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and any(is_active() for is_active, _ in _query_timers):
+        context._query_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start", None)
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+    for _, on_query in _query_timers:
+        try:
+            on_query(conn, statement, parameters, executemany, seconds)
+        except Exception as e:
+            logger.debug(f"Query timing consumer failed: {e}")
+
+
+def _record_request_query(conn, statement, parameters, executemany, seconds) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+
+add_query_timer(lambda: _current_stats.get() is not None, _record_request_query)
+
+# =============================================================================
+# TRACKING HELPERS
+# =============================================================================
+
+def get_current_query_stats() -> Optional[QueryStats]:
+    """Stats of the request being handled, if instrumentation is active"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Record the queries executed inside the block
+
+    Usage:
+        with track_queries() as stats:
+            service.get_children_by_parent(parent_id)
+        print(stats.query_count, stats.repeated_shapes(5))
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, max_repeats: Optional[int] = None) -> Iterator[QueryStats]:
+    """
+    Fail if the block executes more queries than its budget
+
+    Args:
+        max_queries: Maximum number of queries allowed
+        max_repeats: Maximum executions of a single statement shape (N+1 guard)
+
+    Raises:
+        AssertionError: When the budget is exceeded
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.query_count > max_queries:
+        raise AssertionError(
+            f"Query budget exceeded: {stats.query_count} queries (budget {max_queries})"
+        )
+    if max_repeats is not None:
+        repeated = stats.repeated_shapes(max_repeats + 1)
+        if repeated:
+            shape, count = repeated[0]
+            raise AssertionError(f"Statement repeated {count} times (budget {max_repeats}): {shape[:200]}")
+
+# =============================================================================
+# MIDDLEWARE
+# =============================================================================
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware recording SQL count and time per request
+
+    Adds a Server-Timing header, logs a debug line per request and a warning
+    when one statement shape repeats n_plus_one_threshold times or more.
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int = 10, server_timing: bool = True):
+        """
+        Initialize middleware
+
+        Args:
+            app: FastAPI application
+            n_plus_one_threshold: Repeats of one statement shape reported as N+1
+            server_timing: Whether to add the Server-Timing response header
+        """
+        super().__init__(app)
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.server_timing = server_timing
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        endpoint = f"{request.method} {request.url.path}"
+        logger.debug(
+            f"{endpoint}: {stats.query_count} queries, {stats.total_seconds * 1000:.1f} ms in database"
+        )
+        for shape, count in stats.repeated_shapes(self.n_plus_one_threshold):
+            logger.warning(f"Possible N+1 in {endpoint}: statement executed {count} times: {shape[:300]}")
+
+        if self.server_timing:
+            response.headers.append("Server-Timing", stats.server_timing(self.n_plus_one_threshold))
+        return response
+
+
+__all__ = [
+    "QueryStats",
+    "QueryTimingCallback",
+    "add_query_timer",
+    "QueryStatsMiddleware",
+    "get_current_query_stats",
+    "track_queries",
+    "query_budget",
+    "statement_shape"
+]
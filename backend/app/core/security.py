@@ -18,6 +18,7 @@ import re
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.token_cache import verified_token_cache
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -140,7 +141,11 @@ class JWTManager:
             Optional[Dict]: Decoded payload if valid, None otherwise
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            # Signature and exp are checked by jose once per token, then served from cache until exp
+            payload = verified_token_cache.get(token)
+            if payload is None:
+                payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+                verified_token_cache.put(token, payload)
             
             # Verify token type
             if payload.get("type") != token_type:
@@ -0,0 +1,364 @@
+"""
+Shared (cross-worker) cache tier
+Second cache level shared by every uvicorn worker on a host, backed by a
+SQLite database in shared memory (e.g. /dev/shm) with WAL mode so readers
+never block writers. Also carries an invalidation log that each worker polls
+so that deletes, tag invalidations and overwrites reach every process.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import stat
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long invalidation events are kept (workers polling slower than this
+# fall back to clearing their local tier)
+INVALIDATION_RETENTION_SECONDS = 3600
+
+# Bump when the layout changes; cached data is disposable so old files are rebuilt
+SCHEMA_VERSION = 2
+
+_DROP_SCHEMA = """
+DROP TABLE IF EXISTS cache_entries;
+DROP TABLE IF EXISTS cache_entry_tags;
+DROP TABLE IF EXISTS cache_invalidations;
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    compute_time REAL NOT NULL DEFAULT 0,
+    tags TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS ix_cache_entries_stale_until ON cache_entries (stale_until);
+CREATE TABLE IF NOT EXISTS cache_entry_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+CREATE INDEX IF NOT EXISTS ix_cache_entry_tags_key ON cache_entry_tags (key);
+CREATE TABLE IF NOT EXISTS cache_invalidations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    target TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class SharedCacheTier:
+    """
+    Host-wide cache tier shared between worker processes
+
+    Values are pickled, so the database file is created with owner-only
+    permissions, and the tier refuses to attach (PermissionError) to a file,
+    -wal or -shm file that belongs to another user or is writable by group or
+    others. All operations are best effort: errors are logged and treated as
+    misses.
+    """
+
+    def __init__(self, path: str, max_entries: int = 0, busy_timeout: float = 5.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.busy_timeout = busy_timeout
+        self._pid = os.getpid()
+        self.origin = f"{self._pid}:{uuid.uuid4().hex[:8]}"
+        self._local = threading.local()
+        self._writes = 0
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "errors": 0,
+            "invalidations_sent": 0,
+            "invalidations_received": 0
+        }
+        self._initialize()
+
+    # -------------------------------------------------------------------------
+    # Connection management
+    # -------------------------------------------------------------------------
+
+    def _initialize(self) -> None:
+        """Create the database file (owner-only) and schema"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_CREAT | os.O_RDWR | getattr(os, "O_NOFOLLOW", 0), 0o600)
+        os.close(fd)
+        self._check_file_permissions(self.path)
+        conn = self._connection()
+        # WAL mode creates the -wal and -shm files; they may also predate us
+        for suffix in ("-wal", "-shm"):
+            if os.path.lexists(self.path + suffix):
+                self._check_file_permissions(self.path + suffix)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.executescript(_DROP_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        logger.info(f"Shared cache tier ready at {self.path} (origin {self.origin})")
+
+    @staticmethod
+    def _check_file_permissions(path: str) -> None:
+        """
+        Refuse files another user could have written (values are unpickled)
+
+        Raises:
+            PermissionError: If path is a symlink, is not owned by the current
+                user or is writable by group or others
+        """
+        st = os.lstat(path)
+        if stat.S_ISLNK(st.st_mode):
+            raise PermissionError(f"Shared cache file {path} is a symlink")
+        if hasattr(os, "getuid") and st.st_uid != os.getuid():
+            raise PermissionError(f"Shared cache file {path} is owned by uid {st.st_uid}, not {os.getuid()}")
+        if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(f"Shared cache file {path} is writable by group or others ({oct(st.st_mode & 0o777)})")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection (reopened after a fork)"""
+        if os.getpid() != self._pid:
+            # Forked worker: never reuse the parent's connections or identity
+            self._pid = os.getpid()
+            self.origin = f"{self._pid}:{uuid.uuid4().hex[:8]}"
+            self._local = threading.local()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+        return conn
+
+    # -------------------------------------------------------------------------
+    # Entry operations
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an entry (fresh or still inside its stale window) from the shared tier
+
+        Returns:
+            Dict with value, expires_at, stale_until, compute_time and tags, or None
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT value, expires_at, stale_until, compute_time, tags FROM cache_entries "
+                "WHERE key = ? AND stale_until >= ?",
+                (key, time.time())
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            self._count("hits")
+            return {
+                "value": pickle.loads(row[0]),
+                "expires_at": row[1],
+                "stale_until": row[2],
+                "compute_time": row[3],
+                "tags": frozenset(filter(None, row[4].split("\n")))
+            }
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Shared cache read failed for {key}: {e}")
+            return None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expires_at: float,
+        tags: Iterable[str] = (),
+        compute_time: float = 0.0,
+        stale_until: Optional[float] = None
+    ) -> bool:
+        """
+        Store an entry and tell other workers to drop their local copy
+
+        Returns:
+            True if stored, False if the value could not be shared
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Value for {key} is not picklable, kept local only: {e}")
+            return False
+
+        tag_list = sorted(set(tags))
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("DELETE FROM cache_entry_tags WHERE key = ?", (key,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, value, expires_at, stale_until, compute_time, tags) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, payload, expires_at, max(expires_at, stale_until or 0.0),
+                     compute_time, "\n".join(tag_list))
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO cache_entry_tags (tag, key) VALUES (?, ?)",
+                    [(tag, key) for tag in tag_list]
+                )
+                self._log_invalidation(conn, "key", key)
+            self._count("sets")
+            self._writes += 1
+            if self._writes % 500 == 0:
+                self.prune()
+            return True
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Shared cache write failed for {key}: {e}")
+            return False
+
+    def delete(self, key: str) -> None:
+        """Delete an entry everywhere"""
+        self._write_invalidation(
+            "key", key,
+            [("DELETE FROM cache_entries WHERE key = ?", (key,)),
+             ("DELETE FROM cache_entry_tags WHERE key = ?", (key,))]
+        )
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Delete every entry carrying one of the tags, everywhere"""
+        for tag in tags:
+            self._write_invalidation(
+                "tag", tag,
+                [("DELETE FROM cache_entries WHERE key IN "
+                  "(SELECT key FROM cache_entry_tags WHERE tag = ?)", (tag,)),
+                 ("DELETE FROM cache_entry_tags WHERE key IN "
+                  "(SELECT key FROM cache_entry_tags WHERE tag = ?)", (tag,))]
+            )
+
+    def clear(self) -> None:
+        """Delete all entries everywhere"""
+        self._write_invalidation(
+            "clear", "",
+            [("DELETE FROM cache_entries", ()),
+             ("DELETE FROM cache_entry_tags", ())]
+        )
+
+    def prune(self) -> int:
+        """
+        Drop expired entries, old invalidation events and (if bounded) the
+        entries closest to expiry beyond max_entries
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            conn = self._connection()
+            now = time.time()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                removed = conn.execute("DELETE FROM cache_entries WHERE stale_until < ?", (now,)).rowcount
+                if self.max_entries:
+                    removed += conn.execute(
+                        "DELETE FROM cache_entries WHERE key IN ("
+                        "SELECT key FROM cache_entries ORDER BY stale_until DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,)
+                    ).rowcount
+                if removed:
+                    conn.execute("DELETE FROM cache_entry_tags WHERE key NOT IN (SELECT key FROM cache_entries)")
+                conn.execute(
+                    "DELETE FROM cache_invalidations WHERE created_at < ?",
+                    (now - INVALIDATION_RETENTION_SECONDS,)
+                )
+            return removed
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Shared cache prune failed: {e}")
+            return 0
+
+    # -------------------------------------------------------------------------
+    # Invalidation broadcast
+    # -------------------------------------------------------------------------
+
+    def latest_sequence(self) -> int:
+        """Current head of the invalidation log"""
+        try:
+            row = self._connection().execute("SELECT MAX(seq) FROM cache_invalidations").fetchone()
+            return row[0] or 0
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Shared cache sequence read failed: {e}")
+            return 0
+
+    def invalidations_since(self, seq: int) -> Tuple[int, List[Tuple[str, str]], bool]:
+        """
+        Read invalidation events published by other workers
+
+        Args:
+            seq: Last sequence number already applied
+
+        Returns:
+            (new last sequence, [(kind, target), ...], gap) where gap is True
+            if events were pruned before this worker saw them
+        """
+        try:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT seq, kind, target, origin FROM cache_invalidations WHERE seq > ? ORDER BY seq",
+                (seq,)
+            ).fetchall()
+            gap = False
+            if rows and seq and rows[0][0] > seq + 1:
+                # Events between seq and the oldest retained one were pruned
+                oldest = conn.execute("SELECT MIN(seq) FROM cache_invalidations").fetchone()[0]
+                gap = oldest is not None and oldest > seq + 1
+            events = [(kind, target) for _, kind, target, origin in rows if origin != self.origin]
+            self._count("invalidations_received", len(events))
+            return (rows[-1][0] if rows else seq), events, gap
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Shared cache invalidation poll failed: {e}")
+            return seq, [], False
+
+    def _log_invalidation(self, conn: sqlite3.Connection, kind: str, target: str) -> None:
+        conn.execute(
+            "INSERT INTO cache_invalidations (kind, target, origin, created_at) VALUES (?, ?, ?, ?)",
+            (kind, target, self.origin, time.time())
+        )
+        self._count("invalidations_sent")
+
+    def _write_invalidation(self, kind: str, target: str, statements: List[Tuple[str, tuple]]) -> None:
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for sql, params in statements:
+                    conn.execute(sql, params)
+                self._log_invalidation(conn, kind, target)
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"Shared cache invalidation failed ({kind} {target}): {e}")
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Shared tier statistics (runs a COUNT query: call without cache locks held)"""
+        with self._stats_lock:
+            stats = {**self._stats, "path": self.path, "origin": self.origin}
+        try:
+            stats["entries"] = self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        except Exception:
+            stats["entries"] = None
+        return stats
+
+
+__all__ = ["SharedCacheTier"]
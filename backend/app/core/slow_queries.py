@@ -0,0 +1,250 @@
+"""
+Slow-query log
+Statements slower than SLOW_QUERY_THRESHOLD_MS are kept in an in-memory ring
+buffer with their normalised SQL, bind parameter shapes and application call
+site; a sample of slow SELECTs also gets an EXPLAIN (ANALYZE, BUFFERS) plan,
+captured in a background thread on a separate connection. Reads that lock
+rows or write (FOR UPDATE/SHARE, data-modifying CTEs, SELECT INTO, sequence
+calls) only get a plain EXPLAIN, which does not execute them.
+"""
+
+import itertools
+import logging
+import os
+import random
+import re
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.query_stats import add_query_timer, statement_shape
+
+logger = logging.getLogger(__name__)
+
+# Root of the application package, used to find the call site of a query
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_THIS_FILE = os.path.abspath(__file__)
+
+# Marker on connections used to run EXPLAIN (their statements are not logged)
+_EXPLAIN_CONNECTION_FLAG = "slow_query_explain"
+
+# Keywords that make a SELECT/WITH statement lock rows or write when executed
+_SIDE_EFFECT_PATTERN = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO|SHARE|NEXTVAL|SETVAL)\b", re.IGNORECASE)
+
+
+def is_plain_read(statement: str) -> bool:
+    """
+    Whether EXPLAIN ANALYZE may safely re-execute a statement
+    
+    Only SELECT/WITH statements without row locks, data-modifying CTEs,
+    SELECT INTO or sequence calls qualify (string literals are ignored).
+    """
+    shape = statement_shape(statement)
+    return _is_read(shape) and not _SIDE_EFFECT_PATTERN.search(shape)
+
+
+def _is_read(statement: str) -> bool:
+    """Whether a statement starts with SELECT or WITH"""
+    words = statement.split(None, 1)
+    return bool(words) and words[0].upper() in ("SELECT", "WITH")
+
+
+def bind_shapes(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Describe bind parameters by type only (values may hold personal data)
+
+    Returns:
+        {name: type} for dict parameters, [type, ...] for positional ones
+    """
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": bind_shapes(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+
+def find_call_site() -> Optional[Dict[str, Any]]:
+    """Innermost application frame (under app/) that led to the current query"""
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if filename.startswith(_APP_ROOT) and filename != _THIS_FILE and not filename.endswith("query_stats.py"):
+            return {
+                "file": os.path.relpath(filename, os.path.dirname(_APP_ROOT)),
+                "line": frame.lineno,
+                "function": frame.name,
+                "code": frame.line
+            }
+    return None
+
+
+class SlowQueryLog:
+    """
+    Thread-safe ring buffer of slow statements
+
+    EXPLAIN runs are executed by a single background thread; when it falls
+    behind, further plans are skipped rather than queued.
+    """
+
+    MAX_PENDING_EXPLAINS = 4
+    MAX_STATEMENT_LENGTH = 4000
+
+    def __init__(self, threshold_ms: float = 200.0, buffer_size: int = 200, explain_sample_rate: float = 0.0):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._entries: deque = deque(maxlen=max(1, buffer_size))
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_explains = 0
+        self._stats = {"recorded": 0, "explained": 0, "explain_failures": 0, "explains_skipped": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def record(
+        self,
+        conn,
+        statement: str,
+        parameters: Any,
+        duration_seconds: float,
+        executemany: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Store a statement if it exceeded the threshold
+
+        Returns:
+            The stored entry, or None if the statement was fast enough
+        """
+        duration_ms = duration_seconds * 1000
+        if duration_ms < self.threshold_ms:
+            return None
+
+        url = conn.engine.url
+        entry = {
+            "id": next(self._ids),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "statement": statement_shape(statement)[:self.MAX_STATEMENT_LENGTH],
+            "bind_shapes": bind_shapes(parameters, executemany),
+            "call_site": find_call_site(),
+            "database": f"{url.host or ''}/{url.database or ''}",
+            "explain": None,
+            "explain_analyzed": False
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self._stats["recorded"] += 1
+
+        logger.warning(
+            f"Slow query ({entry['duration_ms']} ms) at "
+            f"{(entry['call_site'] or {}).get('file')}:{(entry['call_site'] or {}).get('line')}: "
+            f"{entry['statement'][:300]}"
+        )
+
+        if self._should_explain(conn, statement, executemany):
+            self._schedule_explain(conn.engine, statement, parameters, entry, analyze=is_plain_read(statement))
+        return entry
+
+    def _should_explain(self, conn, statement: str, executemany: bool) -> bool:
+        # Reads only; whether ANALYZE may re-run them is decided by is_plain_read
+        return (
+            self.explain_sample_rate > 0
+            and not executemany
+            and conn.dialect.name == "postgresql"
+            and not conn.dialect.is_async
+            and _is_read(statement)
+            and random.random() < self.explain_sample_rate
+        )
+
+    def _schedule_explain(
+        self,
+        engine: Engine,
+        statement: str,
+        parameters: Any,
+        entry: Dict[str, Any],
+        analyze: bool = True
+    ) -> None:
+        with self._lock:
+            if self._pending_explains >= self.MAX_PENDING_EXPLAINS:
+                self._stats["explains_skipped"] += 1
+                return
+            self._pending_explains += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        entry["explain"] = "pending"
+        entry["explain_analyzed"] = analyze
+        self._executor.submit(self._explain, engine, statement, parameters, entry, analyze)
+
+    def _explain(self, engine: Engine, statement: str, parameters: Any, entry: Dict[str, Any], analyze: bool) -> None:
+        options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+        try:
+            with engine.connect() as connection:
+                connection.info[_EXPLAIN_CONNECTION_FLAG] = True
+                try:
+                    result = connection.exec_driver_sql(f"EXPLAIN ({options}) {statement}", parameters or ())
+                    entry["explain"] = result.scalar()
+                finally:
+                    connection.rollback()
+                    connection.info.pop(_EXPLAIN_CONNECTION_FLAG, None)
+            with self._lock:
+                self._stats["explained"] += 1
+        except Exception as e:
+            entry["explain"] = {"error": str(e)}
+            with self._lock:
+                self._stats["explain_failures"] += 1
+            logger.debug(f"EXPLAIN failed for slow query {entry['id']}: {e}")
+        finally:
+            with self._lock:
+                self._pending_explains -= 1
+
+    def get_entries(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent slow queries first"""
+        with self._lock:
+            entries = list(self._entries)
+        return list(reversed(entries))[:limit]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "threshold_ms": self.threshold_ms,
+                "explain_sample_rate": self.explain_sample_rate,
+                "buffered": len(self._entries),
+                "buffer_size": self._entries.maxlen
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Global slow-query log
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    buffer_size=settings.SLOW_QUERY_BUFFER_SIZE,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+)
+
+# =============================================================================
+# QUERY TIMING
+# =============================================================================
+
+def _check_duration(conn, statement, parameters, executemany, seconds) -> None:
+    if slow_query_log.enabled and not conn.info.get(_EXPLAIN_CONNECTION_FLAG):
+        slow_query_log.record(conn, statement, parameters, seconds, executemany)
+
+
+add_query_timer(lambda: slow_query_log.enabled, _check_duration)
+
+
+__all__ = ["SlowQueryLog", "slow_query_log", "bind_shapes", "find_call_site", "is_plain_read"]
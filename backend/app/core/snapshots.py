@@ -0,0 +1,94 @@
+"""
+Detached ORM snapshots for caching
+Converts ORM rows into compact, immutable __slots__ dataclasses so cached data
+does not keep Session identity maps alive or risk DetachedInstanceError
+"""
+
+import importlib
+from dataclasses import make_dataclass, fields
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import inspect as sa_inspect
+
+# Generated snapshot classes, one per (model, extra attributes) combination
+_snapshot_types: Dict[Tuple[type, Tuple[str, ...]], type] = {}
+
+
+def snapshot_type(model: type, extra_attributes: Iterable[str] = ()) -> type:
+    """
+    Get (or build) the snapshot dataclass for an ORM model
+
+    Args:
+        model: SQLAlchemy mapped class
+        extra_attributes: Non-column attributes (properties, hybrid properties)
+                          to capture as well, e.g. computed response fields
+
+    Returns:
+        Frozen, slotted dataclass type with one field per column/attribute
+    """
+    extras = tuple(extra_attributes)
+    cache_key = (model, extras)
+    if cache_key not in _snapshot_types:
+        column_names = [attr.key for attr in sa_inspect(model).mapper.column_attrs]
+        field_names = column_names + [name for name in extras if name not in column_names]
+        
+        def __reduce__(self):
+            # Pickle by model path so other worker processes can rebuild the type
+            values = tuple(getattr(self, name) for name in field_names)
+            return (_restore_snapshot, (model.__module__, model.__qualname__, extras, values))
+        
+        snapshot_cls = make_dataclass(
+            f"{model.__name__}Snapshot",
+            [(name, Any) for name in field_names],
+            namespace={"__reduce__": __reduce__},
+            frozen=True,
+            slots=True
+        )
+        snapshot_cls.__module__ = __name__
+        _snapshot_types[cache_key] = snapshot_cls
+    return _snapshot_types[cache_key]
+
+
+def _restore_snapshot(module_name: str, model_name: str, extras: Tuple[str, ...], values: tuple) -> Any:
+    """Rebuild a pickled snapshot (see snapshot_type)"""
+    model = getattr(importlib.import_module(module_name), model_name)
+    return snapshot_type(model, extras)(*values)
+
+
+def to_snapshot(obj: Any, extra_attributes: Iterable[str] = ()) -> Any:
+    """
+    Copy the loaded state of an ORM instance into a detached snapshot
+
+    Args:
+        obj: ORM instance
+        extra_attributes: Non-column attributes to capture
+
+    Returns:
+        Snapshot instance (read-only; serve responses via model_validate)
+
+    Raises:
+        AttributeError: If an extra attribute does not exist on the model
+        SQLAlchemyError: If an attribute cannot be loaded (e.g. DetachedInstanceError);
+                         callers should skip caching rather than cache a partial copy
+    """
+    snapshot_cls = snapshot_type(type(obj), extra_attributes)
+    return snapshot_cls(**{field.name: getattr(obj, field.name) for field in fields(snapshot_cls)})
+
+
+def to_snapshots(rows: Iterable[Any], extra_attributes: Iterable[str] = ()) -> List[Any]:
+    """Snapshot a list of ORM instances"""
+    extras = tuple(extra_attributes)
+    return [to_snapshot(row, extras) for row in rows]
+
+
+def snapshot_as_dict(snapshot: Any) -> Dict[str, Any]:
+    """Convert a snapshot back to a plain dictionary"""
+    return {field.name: getattr(snapshot, field.name) for field in fields(snapshot)}
+
+
+__all__ = [
+    "snapshot_type",
+    "to_snapshot",
+    "to_snapshots",
+    "snapshot_as_dict"
+]
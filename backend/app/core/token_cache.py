@@ -0,0 +1,177 @@
+"""
+Verified JWT cache
+Bearer tokens are reused across many requests; decoding one means an HMAC
+check plus claim parsing in python-jose. This module keeps the decoded payload
+of successfully verified tokens in a bounded LRU keyed by a SHA-256 digest of
+the token, until the token's own exp. Tokens are only ever added after a full
+verification, so a cache hit never accepts a token jose would have rejected.
+
+Per-user revocation (revoke_user_tokens) purges the entries of a user on
+logout and password changes. The cache is per process.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def token_subject(payload: Dict[str, Any]) -> Optional[str]:
+    """User a token belongs to (user_id claim, falling back to sub)"""
+    subject = payload.get("user_id", payload.get("sub"))
+    return str(subject) if subject is not None else None
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified JWT payloads, valid until each token's exp
+
+    Thread-safe; entries are indexed by subject so all tokens of a user can
+    be purged at once.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float, Optional[str]]]" = OrderedDict()
+        self._by_subject: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "revoked": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached payload of a verified token
+
+        Returns:
+            A copy of the payload, or None if unknown or expired
+        """
+        if not self.enabled:
+            return None
+        digest = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            payload, expires_at, _ = entry
+            if time.time() >= expires_at:
+                self._remove(digest)
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(digest)
+            self._stats["hits"] += 1
+        return dict(payload)
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """Remember a verified payload until its exp (tokens without exp are not cached)"""
+        if not self.enabled:
+            return
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        digest = token_digest(token)
+        subject = token_subject(payload)
+        with self._lock:
+            if digest in self._entries:
+                self._remove(digest)
+            self._entries[digest] = (dict(payload), float(expires_at), subject)
+            if subject is not None:
+                self._by_subject.setdefault(subject, set()).add(digest)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def get_or_verify(self, token: str, verify: Callable[[str], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        Cached payload, or verify(token) on a miss (successful results are cached)
+
+        Args:
+            token: Encoded JWT
+            verify: Full verification returning the payload or None
+        """
+        payload = self.get(token)
+        if payload is not None:
+            return payload
+        payload = verify(token)
+        if payload:
+            self.put(token, payload)
+        return payload
+
+    def revoke_token(self, token: str) -> bool:
+        """Purge one token; returns True if it was cached"""
+        digest = token_digest(token)
+        with self._lock:
+            if digest not in self._entries:
+                return False
+            self._remove(digest)
+            self._stats["revoked"] += 1
+            return True
+
+    def revoke_subject(self, subject: Any) -> int:
+        """Purge every cached token of a user; returns the number of entries removed"""
+        with self._lock:
+            digests = self._by_subject.pop(str(subject), set())
+            for digest in digests:
+                self._entries.pop(digest, None)
+            self._stats["revoked"] += len(digests)
+            return len(digests)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_subject.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate_percent": round(self._stats["hits"] / lookups * 100, 2) if lookups else 0.0
+            }
+
+    def _remove(self, digest: str) -> None:
+        """Drop an entry and its subject index (lock held)"""
+        _, _, subject = self._entries.pop(digest)
+        if subject is not None:
+            digests = self._by_subject.get(subject)
+            if digests is not None:
+                digests.discard(digest)
+                if not digests:
+                    del self._by_subject[subject]
+
+
+# Global cache instance
+verified_token_cache = VerifiedTokenCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
+def revoke_user_tokens(user_id: int) -> None:
+    """Revocation hook: purge cached verifications of a user's tokens"""
+    removed = verified_token_cache.revoke_subject(user_id)
+    if removed:
+        logger.info(f"Purged {removed} cached token verifications for user {user_id}")
+
+
+__all__ = [
+    "VerifiedTokenCache",
+    "verified_token_cache",
+    "revoke_user_tokens",
+    "token_digest",
+    "token_subject"
+]
+
@@ -9,7 +9,7 @@ from typing import List, Optional
 
 from app.core.database import get_db
 from app.auth.dependencies import get_current_user, require_professional, require_parent_or_professional
-from app.users.models import User
+from app.auth.principals import CurrentUser
 from app.users.schemas import ProfessionalProfileCreate, ProfessionalProfileUpdate, ProfessionalProfileResponse
 from app.users.profile_routes import (
     create_professional_profile as _create_professional_profile,
@@ -23,7 +23,7 @@ router = APIRouter()
 @router.post("/professional-profile", response_model=ProfessionalProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_professional_profile(
     profile_data: ProfessionalProfileCreate,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -34,7 +34,7 @@ async def create_professional_profile(
 
 @router.get("/professional-profile", response_model=ProfessionalProfileResponse)
 async def get_professional_profile(
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -46,7 +46,7 @@ async def get_professional_profile(
 @router.put("/professional-profile", response_model=ProfessionalProfileResponse)
 async def update_professional_profile(
     profile_data: ProfessionalProfileUpdate,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -61,7 +61,7 @@ async def search_professionals(
     location: Optional[str] = Query(None, description="Filter by location (city, state, or country)"),
     accepting_patients: Optional[bool] = Query(None, description="Filter by professionals accepting new patients"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
-    current_user: User = Depends(require_parent_or_professional),
+    current_user: CurrentUser = Depends(require_parent_or_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -8,7 +8,8 @@ Comprehensive clinical analytics service for healthcare professionals
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc, asc
+from sqlalchemy import and_, or_, func, desc, asc, case, cast, column, exists
+from sqlalchemy.dialects.postgresql import JSONB
 from dataclasses import dataclass
 import statistics
 import logging
@@ -20,6 +21,27 @@ from app.users.crud import get_analytics_service
 
 logger = logging.getLogger(__name__)
 
+
+def therapy_type_condition(therapy_type: str):
+    """
+    SQL condition: child has a current therapy of the given type
+    
+    Types are compared case-insensitively ("speech therapy" matches a stored
+    "Speech Therapy"), as the in-Python cohort filter did. Containment (@>)
+    cannot do that, so the check unnests current_therapies per candidate
+    child; the other cohort criteria narrow the candidates first.
+    """
+    therapies = case(
+        (func.jsonb_typeof(Child.current_therapies) == "array", Child.current_therapies),
+        else_=cast("[]", JSONB)
+    )
+    therapy = func.jsonb_array_elements(therapies).table_valued(column("value", JSONB)).alias("therapy")
+    return (
+        exists()
+        .select_from(therapy)
+        .where(func.lower(therapy.c.value["type"].astext) == therapy_type.lower())
+    )
+
 # =============================================================================
 # DATA CLASSES FOR CLINICAL ANALYTICS
 # =============================================================================
@@ -143,9 +165,7 @@ class ClinicalAnalyticsService:
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Child]:
         """Get patients assigned to professional (placeholder implementation)"""
-        # In a real implementation, this would query patient-professional assignments
-        # For now, return a sample of children for demonstration
-        query = self.db.query(Child).filter(Child.is_active == True)
+        query = self._assigned_patients_query(professional_id)
         
         if filters:
             if 'age_min' in filters:
@@ -157,6 +177,12 @@ class ClinicalAnalyticsService:
         
         return query.limit(20).all()  # Limit for demo
     
+    def _assigned_patients_query(self, professional_id: int):
+        """Query of patients assigned to professional (placeholder implementation)"""
+        # In a real implementation, this would query patient-professional assignments
+        # For now, return a sample of children for demonstration
+        return self.db.query(Child).filter(Child.is_active == True)
+    
     def _analyze_patient_demographics(self, patients: List[Child]) -> Dict[str, Any]:
         """Analyze patient demographics"""
         if not patients:
@@ -537,46 +563,28 @@ class ClinicalAnalyticsService:
         professional_id: int, 
         criteria: Dict[str, Any]
     ) -> List[Child]:
-        """Get patients matching specific criteria"""
+        """Get patients matching specific criteria (filtered in SQL)"""
         # Start with assigned patients
-        patients = self._get_assigned_patients(professional_id)
+        query = self._assigned_patients_query(professional_id)
         
-        # Apply criteria filters
-        filtered_patients = []
+        # Age criteria
+        if "age_range" in criteria:
+            age_min, age_max = criteria["age_range"]
+            query = query.filter(Child.age.between(age_min, age_max))
         
-        for patient in patients:
-            matches_criteria = True
-            
-            # Age criteria
-            if "age_range" in criteria:
-                age_min, age_max = criteria["age_range"]
-                if not (age_min <= patient.age <= age_max):
-                    matches_criteria = False
-            
-            # Support level criteria
-            if "support_level" in criteria:
-                if patient.support_level != criteria["support_level"]:
-                    matches_criteria = False
-            
-            # Communication style criteria
-            if "communication_style" in criteria:
-                if patient.communication_style != criteria["communication_style"]:
-                    matches_criteria = False
-            
-            # Therapy criteria
-            if "has_therapy" in criteria:
-                therapy_type = criteria["has_therapy"]
-                has_therapy = any(
-                    therapy.get("type", "").lower() == therapy_type.lower()
-                    for therapy in (patient.current_therapies or [])
-                )
-                if not has_therapy:
-                    matches_criteria = False
-            
-            if matches_criteria:
-                filtered_patients.append(patient)
+        # Support level criteria
+        if "support_level" in criteria:
+            query = query.filter(Child.support_level == criteria["support_level"])
+        
+        # Communication style criteria
+        if "communication_style" in criteria:
+            query = query.filter(Child.communication_style == criteria["communication_style"])
         
-        return filtered_patients
+        # Therapy criteria - case-insensitive match on current_therapies[*].type
+        if "has_therapy" in criteria:
+            query = query.filter(therapy_type_condition(criteria["has_therapy"]))
+        
+        return query.limit(20).all()  # Limit for demo
     
     def _analyze_cohort(
         self,
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, desc, asc, func, text
+from sqlalchemy import and_, or_, desc, asc, func, text, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.auth.models import User, UserRole
@@ -17,6 +17,7 @@ from app.reports.schemas import (
     GameSessionCreate, GameSessionUpdate, GameSessionComplete, ReportCreate, ReportUpdate,
     GameSessionFilters, ReportFilters, PaginationParams
 )
+from app.core.pagination import KeysetPage, keyset_paginate, count_rows
 
 logger = logging.getLogger(__name__)
 
@@ -560,56 +561,100 @@ class ReportService:
             logger.error(f"Error updating report {report_id}: {str(e)}")
             return None
     
+    def _filtered_reports_query(self, filters: Optional[ReportFilters] = None):
+        """Report query with the ReportFilters conditions applied"""
+        query = self.db.query(Report)
+        if filters:
+            if filters.child_id:
+                query = query.filter(Report.child_id == filters.child_id)
+            if filters.professional_id:
+                query = query.filter(Report.professional_id == filters.professional_id)
+            if filters.report_type:
+                query = query.filter(Report.report_type == filters.report_type)
+            if filters.status:
+                query = query.filter(Report.status == filters.status)
+            if filters.date_from:
+                query = query.filter(Report.created_at >= filters.date_from)
+            if filters.date_to:
+                query = query.filter(Report.created_at <= filters.date_to)
+            if filters.auto_generated is not None:
+                query = query.filter(Report.auto_generated == filters.auto_generated)
+            if filters.peer_reviewed is not None:
+                query = query.filter(Report.peer_reviewed == filters.peer_reviewed)
+            if filters.has_metrics is not None:
+                if filters.has_metrics:
+                    query = query.filter(Report.metrics.isnot(None))
+                else:
+                    query = query.filter(Report.metrics.is_(None))
+        return query
+    
+    def list_reports(
+        self,
+        filters: Optional[ReportFilters] = None,
+        pagination: Optional[PaginationParams] = None,
+        accessible_child_ids: Optional[List[int]] = None,
+        cursor: Optional[str] = None,
+        count: Optional[str] = None
+    ) -> KeysetPage:
+        """
+        List reports newest first with keyset pagination on (created_at, id)
+        
+        Args:
+            filters: Optional filters
+            pagination: Page size; page numbers only apply without a cursor
+            accessible_child_ids: Restrict to these children (access control)
+            cursor: Cursor returned with the previous page
+            count: None (no count), "exact" or "estimated" total
+            
+        Returns:
+            KeysetPage of Report objects
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        query = self._filtered_reports_query(filters)
+        if accessible_child_ids is not None:
+            query = query.filter(Report.child_id.in_(accessible_child_ids))
+        
+        page_size = pagination.page_size if pagination else 20
+        offset = (pagination.page - 1) * page_size if pagination and not cursor else 0
+        page = keyset_paginate(query, Report.created_at, Report.id, page_size, cursor, offset)
+        if count:
+            page.total_count, page.total_is_estimate = count_rows(query, estimated=(count == "estimated"))
+        return page
+    
     def get_reports_by_child(self, child_id: int, filters: Optional[ReportFilters] = None,
                            pagination: Optional[PaginationParams] = None,
-                           user_id: int = None, user_role: str = None) -> Tuple[List[Report], int]:
+                           user_id: int = None, user_role: str = None,
+                           count: Optional[str] = "exact") -> Tuple[List[Report], Optional[int]]:
         """
         Get reports for a child with filtering and pagination
         
+        Prefer list_reports() with a cursor for deep pages: OFFSET cost grows
+        with the page number.
+        
         Args:
             child_id: Child ID
             filters: Optional filters
             pagination: Optional pagination parameters
             user_id: User requesting reports (for permission checking)
             user_role: Role of requesting user
+            count: "exact" (default), "estimated" or None to skip counting
             
         Returns:
-            Tuple of (reports list, total count)
+            Tuple of (reports list, total count or None)
         """
         try:
-            query = self.db.query(Report).filter(Report.child_id == child_id)
+            query = self._filtered_reports_query(filters).filter(Report.child_id == child_id)
             
-            # Apply filters
-            if filters:
-                if filters.professional_id:
-                    query = query.filter(Report.professional_id == filters.professional_id)
-                if filters.report_type:
-                    query = query.filter(Report.report_type == filters.report_type)
-                if filters.status:
-                    query = query.filter(Report.status == filters.status)
-                if filters.date_from:
-                    query = query.filter(Report.created_at >= filters.date_from)
-                if filters.date_to:
-                    query = query.filter(Report.created_at <= filters.date_to)
-                if filters.auto_generated is not None:
-                    query = query.filter(Report.auto_generated == filters.auto_generated)
-                if filters.peer_reviewed is not None:
-                    query = query.filter(Report.peer_reviewed == filters.peer_reviewed)
-                if filters.has_metrics is not None:
-                    if filters.has_metrics:
-                        query = query.filter(Report.metrics.isnot(None))
-                    else:
-                        query = query.filter(Report.metrics.is_(None))
-            
-            # Filter by permissions if user specified
+            # Filter by permissions in SQL so counts and pages only include visible reports
             if user_id and user_role:
-                # For parents, only show reports they have access to
-                if user_role == "parent":
-                    # Add permission filtering logic here
-                    pass
+                access_condition = self._report_access_condition(user_id, user_role)
+                if access_condition is not None:
+                    query = query.filter(access_condition)
             
             # Get total count
-            total_count = query.count()
+            total_count = count_rows(query, estimated=(count == "estimated"))[0] if count else None
             
             # Apply pagination and sorting
             if pagination:
@@ -621,22 +666,21 @@ class ReportService:
                         else:
                             query = query.order_by(desc(sort_column))
                 else:
-                    query = query.order_by(desc(Report.created_at))
+                    query = query.order_by(desc(Report.created_at), desc(Report.id))
                 
                 offset = (pagination.page - 1) * pagination.page_size
                 query = query.offset(offset).limit(pagination.page_size)
             else:
-                query = query.order_by(desc(Report.created_at))
+                query = query.order_by(desc(Report.created_at), desc(Report.id))
             
             reports = query.all()
             
-            # Filter results by permission if needed
-            if user_id and user_role:
-                accessible_reports = []
-                for report in reports:
-                    if self._check_report_access(report, user_id, user_role):
-                        accessible_reports.append(report)
-                reports = accessible_reports
+            # Expiry dates of external grants are only checked here
+            if user_id and user_role and user_role not in ("admin", "parent"):
+                reports = [
+                    report for report in reports
+                    if report.professional_id == user_id or self._has_active_external_grant(report, user_id)
+                ]
             
             return reports, total_count
             
@@ -662,6 +706,10 @@ class ReportService:
                 return permissions.get("parent_access", True)
         
         # Check external professional access
+        return self._has_active_external_grant(report, user_id)
+    
+    def _has_active_external_grant(self, report: Report, user_id: int) -> bool:
+        """Check if report shares access with an external professional and the grant has not expired"""
         permissions = report.sharing_permissions or {}
         external_access = permissions.get("external_professionals", [])
         for access in external_access:
@@ -669,9 +717,36 @@ class ReportService:
                 expiry = access.get("expiry_date")
                 if not expiry or datetime.fromisoformat(expiry) > datetime.now():
                     return True
-        
         return False
     
+    def _report_access_condition(self, user_id: int, user_role: str):
+        """
+        SQL equivalent of _check_report_access
+        
+        External grants are matched by JSONB containment (GIN index on
+        sharing_permissions); their expiry dates are checked in Python on the
+        returned page with _has_active_external_grant.
+        
+        Returns:
+            Filter condition, or None when the user can see every report
+        """
+        if user_role == "admin":
+            return None
+        
+        conditions = [
+            Report.professional_id == user_id,
+            Report.sharing_permissions.contains({"external_professionals": [{"professional_id": user_id}]})
+        ]
+        if user_role == "parent":
+            conditions.append(and_(
+                Report.child_id.in_(select(Child.id).where(Child.parent_id == user_id)),
+                or_(
+                    Report.sharing_permissions.is_(None),
+                    ~Report.sharing_permissions.contains({"parent_access": False})
+                )
+            ))
+        return or_(*conditions)
+    
     def generate_progress_report(self, child_id: int, period_days: int = 30,
                                creator_id: int = None) -> Optional[Report]:
         """
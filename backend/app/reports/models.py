@@ -5,7 +5,8 @@ Enhanced models for comprehensive ASD support with professional reporting capabi
 
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, Enum, Index, desc
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -69,9 +70,20 @@ class GameSession(Base):
     Fields not yet in the database will be handled as properties with defaults.
     """
     __tablename__ = "game_sessions"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    child_id = Column(Integer, ForeignKey("children.id"), nullable=False, index=True)
+    # PostgreSQL: monthly RANGE partitions on started_at, managed by
+    # app/reports/partitions.py. The table key must include the partition
+    # column, so it is (id, started_at); the ORM identity stays id alone.
+    __table_args__ = (
+        # Hot path: WHERE child_id = ? AND started_at >= ? ORDER BY started_at (and the
+        # (started_at, id) keyset order); the INCLUDE columns serve per-child aggregates
+        # from the index alone. Replaces the single-column child_id index.
+        Index('ix_game_sessions_child_id_started_at', 'child_id', desc('started_at'), desc('id'),
+              postgresql_include=['completion_status', 'score', 'duration_seconds']),
+        {"postgresql_partition_by": "RANGE (started_at)"},
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    child_id = Column(Integer, ForeignKey("children.id"), nullable=False)
     
     # Session identification and type
     session_type = Column(String, nullable=False, index=True)  # Changed from Enum to String for compatibility
@@ -79,7 +91,7 @@ class GameSession(Base):
     scenario_id = Column(String(100), nullable=True, index=True)
     
     # Timing information
-    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), primary_key=True, nullable=False, index=True)
     ended_at = Column(DateTime(timezone=True), nullable=True)
     duration_seconds = Column(Integer, nullable=True)
     
@@ -92,8 +104,8 @@ class GameSession(Base):
     help_requests = Column(Integer, default=0, nullable=False)
     
     # ASD-specific emotional and behavioral tracking
-    emotional_data = Column(JSON, nullable=True)
-    interaction_patterns = Column(JSON, nullable=True)
+    emotional_data = Column(JSONB, nullable=True)
+    interaction_patterns = Column(JSONB, nullable=True)
     
     # Completion and outcome tracking
     completion_status = Column(String(20), default='in_progress', nullable=False, index=True)
@@ -135,8 +147,8 @@ class GameSession(Base):
     
     @property
     def total_pause_duration(self):
-        """Compatibility property for total_pause_duration"""
-        return getattr(self, '_total_pause_duration', 0)
+        """Compatibility property for total_pause_duration (bulk-ingested sessions keep it in interaction_patterns)"""
+        return getattr(self, '_total_pause_duration', (self.interaction_patterns or {}).get('total_pause_duration', 0))
     
     @total_pause_duration.setter
     def total_pause_duration(self, value):
@@ -153,8 +165,8 @@ class GameSession(Base):
     
     @property
     def hint_usage_count(self):
-        """Compatibility property for hint_usage_count"""
-        return getattr(self, '_hint_usage_count', 0)
+        """Compatibility property for hint_usage_count (bulk-ingested sessions keep it in interaction_patterns)"""
+        return getattr(self, '_hint_usage_count', (self.interaction_patterns or {}).get('hint_usage_count', 0))
     
     @hint_usage_count.setter
     def hint_usage_count(self, value):
@@ -257,6 +269,8 @@ class GameSession(Base):
       # Relationships
     child = relationship("Child", back_populates="game_sessions")
     
+    __mapper_args__ = {"primary_key": [id]}
+    
     # =========================================================================
     # CALCULATED PROPERTIES AND METHODS
     # =========================================================================
@@ -326,6 +340,11 @@ class Report(Base):
     Supports multiple report types with flexible content structure
     """
     __tablename__ = "reports"
+    __table_args__ = (
+        # Access checks: sharing_permissions @> '{"external_professionals": [{"professional_id": 1}]}'
+        Index('ix_reports_sharing_permissions', 'sharing_permissions',
+              postgresql_using='gin', postgresql_ops={'sharing_permissions': 'jsonb_path_ops'}),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     child_id = Column(Integer, ForeignKey("children.id"), nullable=False, index=True)
@@ -466,7 +485,7 @@ class Report(Base):
     approved_at = Column(DateTime(timezone=True), nullable=True)
     
     # Sharing and permissions
-    sharing_permissions = Column(JSON, nullable=True, doc="""
+    sharing_permissions = Column(JSONB, nullable=True, doc="""
     Control who can access this report:
     {
         "parent_access": true,
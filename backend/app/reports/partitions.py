@@ -0,0 +1,287 @@
+"""
+Monthly range partitions for game_sessions
+game_sessions is partitioned by RANGE (started_at) on PostgreSQL, one partition
+per calendar month (UTC). This module creates partitions ahead of time, keeps a
+DEFAULT partition as a safety net and detaches partitions that fall outside the
+retention window (detached tables are kept, not dropped, so they can be
+archived or re-attached).
+"""
+
+import asyncio
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+GAME_SESSIONS_TABLE = "game_sessions"
+
+# Partition names look like game_sessions_p2025_06
+_PARTITION_NAME_PATTERN = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant (UTC) of the month containing value"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months"""
+    index = month.year * 12 + (month.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: datetime, table: str = GAME_SESSIONS_TABLE) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Month covered by a partition, parsed from its name (None for DEFAULT/foreign names)"""
+    match = _PARTITION_NAME_PATTERN.search(name)
+    if not match:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+
+
+def month_bounds(month: datetime) -> Tuple[str, str]:
+    """FROM/TO literals of the partition for a month"""
+    return month.isoformat(), add_months(month, 1).isoformat()
+
+# =============================================================================
+# PARTITION DDL
+# =============================================================================
+
+def is_partitioned(connection: Connection, table: str = GAME_SESSIONS_TABLE) -> bool:
+    """Whether table exists as a partitioned table (always False off PostgreSQL)"""
+    if connection.dialect.name != "postgresql":
+        return False
+    return connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {"table": table}
+    ).scalar()
+
+
+def list_partitions(connection: Connection, table: str = GAME_SESSIONS_TABLE) -> List[str]:
+    """Names of the partitions currently attached to table"""
+    rows = connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table) "
+            "ORDER BY child.relname"
+        ),
+        {"table": table}
+    )
+    return [row[0] for row in rows]
+
+
+def default_partition_name(table: str = GAME_SESSIONS_TABLE) -> str:
+    return f"{table}_default"
+
+
+def create_month_partition(connection: Connection, month: datetime, table: str = GAME_SESSIONS_TABLE) -> str:
+    """
+    Create the partition for one month if it does not exist
+
+    PostgreSQL refuses to add a range partition while the DEFAULT partition
+    holds rows in that range, so such rows are moved into a standalone table
+    first and the table is then attached. Run inside a transaction so a failed
+    attach leaves the rows in DEFAULT.
+
+    Returns:
+        Partition name
+    """
+    name = partition_name(month, table)
+    default = default_partition_name(table)
+    lower, upper = month_bounds(month)
+    bounds = {"lower": lower, "upper": upper}
+    stranded = default in list_partitions(connection, table) and connection.execute(
+        text(f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE started_at >= :lower AND started_at < :upper)'),
+        bounds
+    ).scalar()
+    if not stranded:
+        connection.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        ))
+        return name
+
+    connection.execute(text(
+        f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    ))
+    moved = connection.execute(
+        text(
+            f'WITH moved AS (DELETE FROM "{default}" '
+            f"WHERE started_at >= :lower AND started_at < :upper RETURNING *) "
+            f'INSERT INTO "{name}" SELECT * FROM moved'
+        ),
+        bounds
+    ).rowcount
+    connection.execute(text(
+        f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" '
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    ))
+    logger.info(f"Moved {moved} rows from {default} into {name}")
+    return name
+
+
+def ensure_default_partition(connection: Connection, table: str = GAME_SESSIONS_TABLE) -> str:
+    """Create the DEFAULT partition catching rows outside every monthly range"""
+    name = default_partition_name(table)
+    connection.execute(text(f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" DEFAULT'))
+    return name
+
+
+def detach_partition(connection: Connection, name: str, table: str = GAME_SESSIONS_TABLE) -> None:
+    connection.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+
+
+def missing_partition_months(
+    existing: List[str],
+    months_ahead: int,
+    now: Optional[datetime] = None,
+    table: str = GAME_SESSIONS_TABLE
+) -> List[datetime]:
+    """
+    Months (the current one and the next months_ahead) that have no partition yet
+
+    Args:
+        existing: Names of the attached partitions
+    """
+    existing = set(existing)
+    current = month_start(now or datetime.now(timezone.utc))
+    months = [add_months(current, offset) for offset in range(months_ahead + 1)]
+    return [month for month in months if partition_name(month, table) not in existing]
+
+
+def expired_partitions(
+    existing: List[str],
+    retention_months: int,
+    now: Optional[datetime] = None
+) -> List[str]:
+    """
+    Monthly partitions older than the retention window
+
+    Args:
+        existing: Names of the attached partitions
+        retention_months: Months kept attached, including the current one (0 keeps everything)
+    """
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(now or datetime.now(timezone.utc)), -(retention_months - 1))
+    expired = []
+    for name in existing:
+        month = partition_month(name)
+        if month is not None and month < cutoff:
+            expired.append(name)
+    return expired
+
+# =============================================================================
+# MAINTENANCE
+# =============================================================================
+
+def maintain_game_session_partitions(
+    bind: Optional[Engine] = None,
+    months_ahead: Optional[int] = None,
+    retention_months: Optional[int] = None,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Create upcoming partitions and detach expired ones
+
+    Does nothing unless game_sessions is a partitioned PostgreSQL table. Every
+    partition is created or detached in its own transaction; a failing step is
+    logged and reported under "failed" without undoing or blocking the others.
+
+    Args:
+        bind: Engine to use (default: primary engine)
+        months_ahead: Defaults to settings.GAME_SESSION_PARTITION_MONTHS_AHEAD
+        retention_months: Defaults to settings.GAME_SESSION_PARTITION_RETENTION_MONTHS
+        now: Reference time (default: current UTC time)
+
+    Returns:
+        Summary with created/detached/failed partition names
+    """
+    bind = bind or engine
+    if months_ahead is None:
+        months_ahead = settings.GAME_SESSION_PARTITION_MONTHS_AHEAD
+    if retention_months is None:
+        retention_months = settings.GAME_SESSION_PARTITION_RETENTION_MONTHS
+
+    created, detached, failed = [], [], []
+    with bind.connect() as connection:
+        with connection.begin():
+            if not is_partitioned(connection):
+                return {"partitioned": False, "created": [], "detached": [], "failed": []}
+            ensure_default_partition(connection)
+            existing = list_partitions(connection)
+
+        for month in missing_partition_months(existing, months_ahead, now):
+            name = partition_name(month)
+            try:
+                with connection.begin():
+                    create_month_partition(connection, month)
+            except SQLAlchemyError:
+                logger.exception(f"Could not create partition {name}")
+                failed.append(name)
+            else:
+                logger.info(f"Created partition {name}")
+                created.append(name)
+
+        for name in expired_partitions(existing, retention_months, now):
+            try:
+                with connection.begin():
+                    detach_partition(connection, name)
+            except SQLAlchemyError:
+                logger.exception(f"Could not detach partition {name}")
+                failed.append(name)
+            else:
+                logger.warning(f"Detached partition {name} (outside {retention_months}-month retention)")
+                detached.append(name)
+
+    return {"partitioned": True, "created": created, "detached": detached, "failed": failed}
+
+
+async def partition_maintenance_loop(interval_seconds: float = 3600.0) -> None:
+    """
+    Periodic partition maintenance (run from the app lifespan after an initial
+    synchronous maintain_game_session_partitions() call)
+
+    DDL runs in a worker thread so the event loop is never blocked on locks.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(maintain_game_session_partitions)
+        except Exception:
+            logger.exception("Error during partition maintenance")
+
+
+__all__ = [
+    "GAME_SESSIONS_TABLE",
+    "month_start",
+    "add_months",
+    "partition_name",
+    "partition_month",
+    "month_bounds",
+    "is_partitioned",
+    "list_partitions",
+    "default_partition_name",
+    "create_month_partition",
+    "ensure_default_partition",
+    "detach_partition",
+    "missing_partition_months",
+    "expired_partitions",
+    "maintain_game_session_partitions",
+    "partition_maintenance_loop"
+]
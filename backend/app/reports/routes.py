@@ -2,15 +2,18 @@
 Reports and analytics routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db, get_analytics_db
+from app.core.pagination import InvalidCursorError, KeysetPage
 from app.auth.routes import get_current_user
 from app.auth.dependencies import require_professional
-from app.users.models import User, Child, Activity
+from app.users.models import Child
+from app.auth.principals import CurrentUser
 from app.users import crud
 from app.core.config import settings
 from app.reports.clinical_analytics import ClinicalAnalyticsService
@@ -21,7 +24,7 @@ from app.reports.anonymous_analytics import get_anonymous_analytics_service
 from app.reports.schemas import (
     # Game Session schemas
     GameSessionCreate, GameSessionUpdate, GameSessionComplete, GameSessionResponse,
-    GameSessionAnalytics, GameSessionFilters,
+    GameSessionAnalytics, GameSessionFilters, GameSessionBulkCreate, GameSessionBulkResult,
     # Report schemas
     ReportCreate, ReportUpdate, ReportStatusUpdate, ReportResponse,
     ReportSummary, ReportPermissions, ReportFilters,
@@ -50,16 +53,28 @@ START_DATE_DESC = "Start date for analysis"
 END_DATE_DESC = "End date for analysis"
 ANALYSIS_PERIOD_DESC = "Analysis period in days"
 
+
+def _set_page_headers(response: Response, page: KeysetPage) -> None:
+    """Expose keyset pagination state in headers so list bodies stay unchanged"""
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    if page.total_count is not None:
+        response.headers["X-Total-Count"] = str(page.total_count)
+        response.headers["X-Total-Count-Estimated"] = "true" if page.total_is_estimate else "false"
+
+
 @router.get("/dashboard")
 async def get_dashboard_stats(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get dashboard statistics for current user
     """
+    child_service = crud.get_async_child_service(db)
+    
     # Get user's children
-    children = crud.get_children_by_parent(db, parent_id=current_user.id)
+    children = await child_service.get_children_by_parent(current_user.id)
     
     if not children:
         return {
@@ -73,10 +88,8 @@ async def get_dashboard_stats(
     child_ids = [child.id for child in children]
       # Total activities this week
     week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    total_activities = db.query(Activity).filter(
-        Activity.child_id.in_(child_ids),
-        Activity.completed_at >= week_ago
-    ).count()
+    activity_counts = await child_service.count_recent_activities(child_ids, week_ago)
+    total_activities = sum(activity_counts.values())
     
     # Total points across all children
     total_points = sum(child.points for child in children)
@@ -84,17 +97,12 @@ async def get_dashboard_stats(
     # Individual child statistics
     children_stats = []
     for child in children:
-        recent_activities = db.query(Activity).filter(
-            Activity.child_id == child.id,
-            Activity.completed_at >= week_ago
-        ).count()
-        
         children_stats.append({
             "child_id": child.id,
             "name": child.name,
             "points": child.points,
             "level": child.level,
-            "activities_this_week": recent_activities
+            "activities_this_week": activity_counts.get(child.id, 0)
         })
     
     return {
@@ -108,14 +116,16 @@ async def get_dashboard_stats(
 async def get_child_progress(
     child_id: int,
     days: int = 30,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get progress report for a specific child
     """
+    child_service = crud.get_async_child_service(db)
+    
     # Verify child belongs to current user
-    child = crud.get_child_by_id(db, child_id=child_id)
+    child = await child_service.get_child_by_id(child_id)
     if not child or child.parent_id != current_user.id:
         from fastapi import HTTPException, status
         raise HTTPException(
@@ -124,10 +134,7 @@ async def get_child_progress(
         )
       # Get activities for the specified period
     start_date = datetime.now(timezone.utc) - timedelta(days=days)
-    activities = db.query(Activity).filter(
-        Activity.child_id == child_id,
-        Activity.completed_at >= start_date
-    ).order_by(Activity.completed_at.desc()).all()
+    activities = await child_service.get_activities_since(child_id, start_date)
     
     # Group activities by type
     activity_types = {}
@@ -175,8 +182,8 @@ async def get_population_analytics(
     age_min: Optional[int] = Query(None, ge=0, le=25, description="Minimum age filter"),
     age_max: Optional[int] = Query(None, ge=0, le=25, description="Maximum age filter"),
     support_level: Optional[int] = Query(None, ge=1, le=3, description="Support level filter"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Get comprehensive population analytics for professional's patients
@@ -247,8 +254,8 @@ async def get_population_analytics(
 @router.post("/analytics/cohort-comparison", response_model=Dict[str, Any])
 async def compare_patient_cohorts(
     cohort_data: Dict[str, Any],
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Compare multiple patient cohorts based on specified criteria
@@ -319,8 +326,8 @@ async def compare_patient_cohorts(
 async def get_clinical_insights(
     analysis_period: int = Query(default=90, ge=7, le=365, description=ANALYSIS_PERIOD_DESC),
     focus_areas: Optional[str] = Query(None, description="Comma-separated focus areas"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Generate AI-powered clinical insights for professional's patient population
@@ -401,8 +408,8 @@ async def analyze_treatment_effectiveness(
     therapy_type: Optional[str] = Query(None, description="Specific therapy type to analyze"),
     date_from: Optional[datetime] = Query(None, description="Start date for analysis"),
     date_to: Optional[datetime] = Query(None, description="End date for analysis"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Analyze treatment effectiveness across patient population
@@ -479,8 +486,8 @@ async def analyze_treatment_effectiveness(
 async def export_clinical_analytics(
     format: str = Query(default="json", pattern="^(json|csv)$"),    include_patient_details: bool = Query(default=False, description="Include patient details"),
     analysis_period: int = Query(default=90, ge=7, le=365, description=ANALYSIS_PERIOD_DESC),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Export comprehensive clinical analytics data
@@ -634,8 +641,8 @@ async def clinical_analytics_population(
     age_min: Optional[int] = Query(None, ge=0, le=25, description="Minimum age filter"),
     age_max: Optional[int] = Query(None, ge=0, le=25, description="Maximum age filter"),
     support_level: Optional[int] = Query(None, ge=1, le=3, description="Support level filter"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Task 16 Clinical Analytics - Population Overview
@@ -656,8 +663,8 @@ async def clinical_analytics_population(
 async def clinical_analytics_insights(
     analysis_period: int = Query(default=90, ge=7, le=365, description=ANALYSIS_PERIOD_DESC),
     focus_areas: Optional[str] = Query(None, description="Comma-separated focus areas"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Task 16 Clinical Analytics - Insights Overview
@@ -677,7 +684,7 @@ async def clinical_analytics_insights(
 
 @router.get("/analytics/test-data", response_model=Dict[str, Any])
 async def generate_test_analytics_data(
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -751,7 +758,7 @@ async def generate_test_analytics_data(
 @router.post("/sessions", response_model=GameSessionResponse)
 async def create_game_session(
     session_data: GameSessionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -801,7 +808,7 @@ async def create_game_session(
 @router.get("/sessions/{session_id}", response_model=GameSessionResponse)
 async def get_game_session(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -850,7 +857,7 @@ async def get_game_session(
 async def update_game_session(
     session_id: int,
     session_update: GameSessionUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -907,7 +914,7 @@ async def update_game_session(
 async def complete_game_session(
     session_id: int,
     completion_data: GameSessionComplete,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -963,6 +970,7 @@ async def complete_game_session(
 
 @router.get("/sessions", response_model=List[GameSessionResponse])
 async def list_game_sessions(
+    response: Response,
     child_id: Optional[int] = Query(None, description="Filter by child ID"),
     session_type: Optional[str] = Query(None, description="Filter by session type"),
     date_from: Optional[datetime] = Query(None, description="Start date filter"),
@@ -970,7 +978,9 @@ async def list_game_sessions(
     completion_status: Optional[str] = Query(None, description="Filter by completion status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    include_count: Optional[str] = Query(None, pattern="^(exact|estimated)$", description="Return the total in X-Total-Count"),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -978,6 +988,8 @@ async def list_game_sessions(
     
     Returns a list of game sessions based on the provided filters.
     Results are paginated and include basic session information.
+    Pass the X-Next-Cursor response header back as `cursor` for the next
+    page; `page` is only honoured when no cursor is given.
     """
     try:
         # Build filters
@@ -1016,16 +1028,21 @@ async def list_game_sessions(
         
         # Get sessions
         session_service = GameSessionService(db)
-        sessions = session_service.list_sessions(
+        page = session_service.list_sessions(
             filters=filters,
             pagination=pagination,
-            accessible_child_ids=accessible_child_ids
+            accessible_child_ids=accessible_child_ids,
+            cursor=cursor,
+            count=include_count
         )
+        _set_page_headers(response, page)
         
-        return [GameSessionResponse.model_validate(session) for session in sessions]
+        return [GameSessionResponse.model_validate(session) for session in page.items]
         
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing game sessions: {str(e)}")
         raise HTTPException(
@@ -1036,7 +1053,7 @@ async def list_game_sessions(
 @router.get("/sessions/{session_id}/analytics", response_model=GameSessionAnalytics)
 async def get_session_analytics(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1088,7 +1105,7 @@ async def get_child_session_trends(
     child_id: int,
     days: int = Query(30, ge=7, le=365, description="Number of days to analyze"),
     session_type: Optional[str] = Query(None, description="Filter by session type"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1141,7 +1158,7 @@ async def get_child_session_trends(
 @router.delete("/sessions/{session_id}")
 async def delete_game_session(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1203,7 +1220,7 @@ async def delete_game_session(
 @router.post("/reports", response_model=ReportResponse)
 async def create_report(
     report_data: ReportCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1255,7 +1272,7 @@ async def create_report(
 @router.get("/reports/{report_id}", response_model=ReportResponse)
 async def get_report(
     report_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1307,7 +1324,7 @@ async def get_report(
 async def update_report(
     report_id: int,
     report_update: ReportUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1349,7 +1366,7 @@ async def update_report(
 async def update_report_status(
     report_id: int,
     status_update: ReportStatusUpdate,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -1398,6 +1415,7 @@ async def update_report_status(
 
 @router.get("/reports", response_model=List[ReportSummary])
 async def list_reports(
+    response: Response,
     child_id: Optional[int] = Query(None, description="Filter by child ID"),
     report_type: Optional[str] = Query(None, description="Filter by report type"),
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -1405,7 +1423,9 @@ async def list_reports(
     date_to: Optional[datetime] = Query(None, description=END_DATE_DESC),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    include_count: Optional[str] = Query(None, pattern="^(exact|estimated)$", description="Return the total in X-Total-Count"),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1413,6 +1433,8 @@ async def list_reports(
     
     Returns a list of report summaries based on the provided filters.
     Results are filtered by user access permissions.
+    Pass the X-Next-Cursor response header back as `cursor` for the next
+    page; `page` is only honoured when no cursor is given.
     """
     try:
         # Build filters
@@ -1454,16 +1476,22 @@ async def list_reports(
         
         # Get reports
         report_service = ReportService(db)
-        reports = report_service.list_reports(
+        page = report_service.list_reports(
             filters=filters,
             pagination=pagination,
-            accessible_child_ids=accessible_child_ids
+            accessible_child_ids=accessible_child_ids,
+            cursor=cursor,
+            count=include_count
         )
+        _set_page_headers(response, page)
         
-        return [ReportSummary.model_validate(report) for report in reports]
+        return [ReportSummary.model_validate(report) for report in page.items]
         
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        # The "status" query parameter shadows fastapi.status in this endpoint
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing reports: {str(e)}")
         raise HTTPException(
@@ -1475,7 +1503,7 @@ async def list_reports(
 async def auto_generate_report_content(
     report_id: int,
     generation_params: Optional[Dict[str, Any]] = None,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -1532,7 +1560,7 @@ async def auto_generate_report_content(
 async def export_report(
     report_id: int,
     export_request: ExportRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1591,7 +1619,7 @@ async def export_report(
 async def share_report(
     report_id: int,
     share_request: ShareRequest,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -1647,7 +1675,7 @@ async def share_report(
 @router.get("/reports/{report_id}/permissions", response_model=ReportPermissions)
 async def get_report_permissions(
     report_id: int,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -1691,7 +1719,7 @@ async def get_report_permissions(
 async def update_report_permissions(
     report_id: int,
     permissions: ReportPermissions,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -1740,7 +1768,7 @@ async def update_report_permissions(
 @router.delete("/reports/{report_id}")
 async def delete_report(
     report_id: int,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -1797,7 +1825,7 @@ async def delete_report(
 async def get_child_progress_analytics(
     child_id: int,    period_days: int = Query(30, ge=7, le=365, description=ANALYSIS_PERIOD_DESC),
     include_recommendations: bool = Query(True, description="Include AI recommendations"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1854,7 +1882,7 @@ async def get_child_progress_analytics(
 @router.post("/game-sessions", response_model=GameSessionResponse)
 async def create_game_session_task23(
     session_data: GameSessionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1904,11 +1932,51 @@ async def create_game_session_task23(
             detail="Failed to create game session"
         )
 
+@router.post("/game-sessions/bulk", response_model=GameSessionBulkResult)
+async def bulk_create_game_sessions(
+    bulk_data: GameSessionBulkCreate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Ingest a batch of completed game sessions (e.g. synced from an offline device).
+    
+    Valid sessions are inserted in one statement; invalid sessions and sessions
+    of children the user cannot access are reported in "rejected" by their index
+    in the request. Authorization: parents can add sessions for their children,
+    professionals for assigned children.
+    """
+    if current_user.role == "parent":
+        accessible_children = crud.get_children_by_parent(db, parent_id=current_user.id)
+    elif current_user.role == "professional":
+        accessible_children = crud.get_assigned_children(db, professional_id=current_user.id)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    try:
+        session_service = GameSessionService(db)
+        result = session_service.bulk_create_sessions(
+            bulk_data.sessions,
+            accessible_child_ids=[child.id for child in accessible_children]
+        )
+    except Exception as e:
+        logger.error(f"Error during bulk game session ingestion: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to ingest game sessions"
+        )
+    
+    logger.info(f"User {current_user.id} bulk ingested {result.created_count} game sessions")
+    return result
+
 @router.put("/game-sessions/{session_id}/end", response_model=GameSessionResponse)
 async def end_game_session_task23(
     session_id: int,
     completion_data: GameSessionComplete,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1968,18 +2036,22 @@ async def end_game_session_task23(
 @router.get("/game-sessions/child/{child_id}", response_model=List[GameSessionResponse])
 async def get_child_game_sessions_task23(
     child_id: int,
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100, description="Maximum number of sessions"),
     session_type: Optional[str] = Query(default=None, description="Filter by session type"),
     date_from: Optional[datetime] = Query(None, description="Start date filter"),
     date_to: Optional[datetime] = Query(None, description="End date filter"),
     completion_status: Optional[str] = Query(None, description="Filter by completion status"),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    include_count: Optional[str] = Query(None, pattern="^(exact|estimated)$", description="Return the total in X-Total-Count"),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Task 23: Get all game sessions for a specific child.
     
     Returns a list of game sessions for the specified child with optional filtering.
+    Further pages are fetched by passing the X-Next-Cursor header back as `cursor`.
     Authorization: parents can access their children's data,
     professionals can access assigned children.
     """
@@ -2022,15 +2094,18 @@ async def get_child_game_sessions_task23(
         
         # Get sessions using the service
         session_service = GameSessionService(db)
-        sessions = session_service.list_sessions(
+        page = session_service.list_sessions(
             filters=filters,
             pagination=pagination,
-            accessible_child_ids=[child_id]
+            accessible_child_ids=[child_id],
+            cursor=cursor,
+            count=include_count
         )
+        _set_page_headers(response, page)
         
         # Convert to response format
         sessions_response = []
-        for session in sessions:
+        for session in page.items:
             session_response = GameSessionResponse.model_validate(session)
             sessions_response.append(session_response)
         
@@ -2039,6 +2114,8 @@ async def get_child_game_sessions_task23(
         
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Task 23: Error retrieving sessions for child {child_id}: {str(e)}")
         raise HTTPException(
@@ -2049,7 +2126,7 @@ async def get_child_game_sessions_task23(
 @router.get("/game-sessions/{session_id}", response_model=GameSessionResponse)
 async def get_game_session_task23(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2105,7 +2182,7 @@ async def get_child_progress_task24(
     child_id: int,
     period_days: int = Query(30, ge=7, le=365, description="Report period in days"),
     include_recommendations: bool = Query(True, description="Include AI recommendations"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2174,7 +2251,7 @@ async def get_child_progress_task24(
 @router.get("/child/{child_id}/summary", response_model=SummaryReport)
 async def get_child_summary_task24(
     child_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2245,7 +2322,7 @@ async def get_child_summary_task24(
 async def generate_child_report_task24(
     child_id: int,
     report_request: ReportGenerationRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2346,7 +2423,7 @@ async def get_child_analytics_task24(
     child_id: int,
     period_days: int = Query(30, ge=7, le=365, description="Analysis period in days"),
     include_predictive: bool = Query(False, description="Include predictive analytics"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2452,7 +2529,7 @@ async def export_child_data_task24(
     include_reports: bool = Query(True, description="Include generated reports"),
     date_from: Optional[datetime] = Query(None, description="Start date for data export"),
     date_to: Optional[datetime] = Query(None, description="End date for data export"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2561,8 +2638,8 @@ async def export_child_data_task24(
 @router.get("/professional/population-analytics")
 async def get_anonymous_population_analytics(
     days: int = Query(default=30, ge=7, le=365, description="Analysis period in days"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Anonymous population analytics for professionals
@@ -2632,8 +2709,8 @@ async def get_anonymous_population_analytics(
 @router.get("/professional/clinical-insights")
 async def get_clinical_insights_summary(
     focus_area: Optional[str] = Query(None, description="Focus area: engagement, outcomes, demographics"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Clinical insights summary for professionals
@@ -2692,8 +2769,8 @@ async def get_clinical_insights_summary(
 @router.get("/professional/platform-effectiveness")
 async def get_platform_effectiveness_metrics(
     metric_type: Optional[str] = Query(None, description="Metric type: engagement, outcomes, accessibility"),
-    current_user: User = Depends(require_professional),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(require_professional),
+    db: Session = Depends(get_analytics_db)
 ):
     """
     Platform effectiveness metrics for clinical evaluation
@@ -107,6 +107,45 @@ class GameSessionComplete(BaseModel):
     final_emotional_state: Optional[EmotionalStateEnum] = Field(None, description="Child's emotional state at end")
     session_summary_notes: Optional[str] = Field(None, max_length=500, description="Brief session summary")
 
+class GameSessionBulkItem(GameSessionCreate):
+    """A completed session recorded offline on a device and synced later"""
+    started_at: datetime = Field(..., description="Session start time on the device")
+    ended_at: Optional[datetime] = Field(None, description="Session end time on the device")
+    duration_seconds: Optional[int] = Field(None, ge=0, description="Duration (derived from the timestamps if omitted)")
+    completion_status: str = Field("completed", max_length=20, description="Session completion status")
+    exit_reason: Optional[str] = Field(None, max_length=100, description="Reason the session ended")
+    
+    # Game metrics
+    levels_completed: int = Field(0, ge=0, description="Number of levels completed")
+    max_level_reached: int = Field(0, ge=0, description="Highest level reached")
+    score: int = Field(0, ge=0, description="Final score")
+    interactions_count: int = Field(0, ge=0, description="Total interactions")
+    correct_responses: int = Field(0, ge=0, description="Number of correct responses")
+    incorrect_responses: int = Field(0, ge=0, description="Number of incorrect responses")
+    help_requests: int = Field(0, ge=0, description="Number of help requests")
+    hint_usage_count: int = Field(0, ge=0, description="Number of hints used")
+    total_pause_duration: int = Field(0, ge=0, description="Total pause duration in seconds")
+    
+    # Complex data fields
+    emotional_data: Optional[Dict[str, Any]] = Field(None, description="Emotional state tracking data")
+    interaction_patterns: Optional[Dict[str, Any]] = Field(None, description="Behavioral interaction analytics")
+    achievements_unlocked: List[str] = Field(default_factory=list, description="Achievements earned in session")
+    
+    # Parent/caregiver input
+    parent_notes: Optional[str] = Field(None, max_length=1000, description="Parent observations and notes")
+    parent_rating: Optional[int] = Field(None, ge=1, le=5, description="Parent rating of session (1-5)")
+
+class GameSessionBulkCreate(BaseModel):
+    """Schema for ingesting a batch of completed sessions"""
+    sessions: List[GameSessionBulkItem] = Field(..., min_length=1, max_length=500, description="Sessions to ingest")
+
+class GameSessionBulkResult(BaseModel):
+    """Result of a bulk session ingestion"""
+    created_ids: List[int] = Field(default_factory=list, description="IDs of the created sessions, in request order")
+    created_count: int = 0
+    rejected: List[Dict[str, Any]] = Field(default_factory=list, description="Rejected items: {index, errors}")
+    warnings: List[Dict[str, Any]] = Field(default_factory=list, description="Validation warnings: {index, warnings}")
+
 class GameSessionResponse(BaseModel):
     """Response schema for game session data"""
     model_config = ConfigDict(from_attributes=True)
@@ -249,6 +288,8 @@ class ReportResponse(BaseModel):
 
 class ReportSummary(BaseModel):
     """Simplified report summary for listings"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     title: str
     report_type: str
@@ -10,7 +10,7 @@ import statistics
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import func
 from collections import defaultdict, Counter
 import numpy as np
 
@@ -41,13 +41,7 @@ class AnalyticsService:
         """
         try:
             # Get sessions within the date range
-            from_date = datetime.now(timezone.utc) - timedelta(days=date_range_days)
-            sessions = self.db.query(GameSession).filter(
-                and_(
-                    GameSession.child_id == child_id,
-                    GameSession.started_at >= from_date
-                )
-            ).order_by(GameSession.started_at).all()
+            sessions = self._child_sessions_query(child_id, date_range_days).all()
             if not sessions:
                 return {"error": "No sessions found for analysis"}
             
@@ -110,13 +104,7 @@ class AnalyticsService:
         """
         try:
             # Get sessions within the date range
-            from_date = datetime.now(timezone.utc) - timedelta(days=date_range_days)
-            sessions = self.db.query(GameSession).filter(
-                and_(
-                    GameSession.child_id == child_id,
-                    GameSession.started_at >= from_date
-                )
-            ).order_by(GameSession.started_at).all()
+            sessions = self._child_sessions_query(child_id, date_range_days).all()
             
             if not sessions:
                 return {"error": "No sessions found for emotional analysis"}
@@ -168,20 +156,19 @@ class AnalyticsService:
             logger.error(f"Error analyzing emotional patterns: {str(e)}")
             return {"error": str(e)}
     
-    def generate_engagement_metrics(self, child_id: int, date_range_days: int = 30) -> Dict[str, Any]:
+    def generate_engagement_metrics(self, child_id: int, date_range_days: Optional[int] = None) -> Dict[str, Any]:
         """
         Generate comprehensive engagement metrics and analysis
         
         Args:
             child_id: ID of the child for engagement analysis
+            date_range_days: Number of days to analyze (default: full history)
             
         Returns:
             Dictionary with engagement metrics, patterns, and optimization insights
         """
-        try:            # Get all sessions for the child
-            sessions = self.db.query(GameSession).filter(
-                GameSession.child_id == child_id
-            ).order_by(GameSession.started_at).all()
+        try:            # Get the child's sessions (bounded ranges only scan the matching partitions)
+            sessions = self._child_sessions_query(child_id, date_range_days).all()
             
             if not sessions:
                 return {"error": "No session data provided for engagement analysis"}
@@ -227,21 +214,20 @@ class AnalyticsService:
             logger.error(f"Error generating engagement metrics: {str(e)}")
             return {"error": str(e)}
     
-    def identify_behavioral_patterns(self, child_id: int, date_range_days: int = 30) -> Dict[str, Any]:
+    def identify_behavioral_patterns(self, child_id: int, date_range_days: Optional[int] = None) -> Dict[str, Any]:
         """
         Identify comprehensive behavioral patterns for a specific child
         
         Args:
             child_id: ID of the child for behavioral pattern analysis
+            date_range_days: Number of days to analyze (default: full history)
             
         Returns:
             Dictionary with behavioral patterns, insights, and recommendations
         """
         try:
-            # Get all sessions for the child
-            sessions = self.db.query(GameSession).filter(
-                GameSession.child_id == child_id
-            ).order_by(GameSession.started_at).all()
+            # Get the child's sessions (bounded ranges only scan the matching partitions)
+            sessions = self._child_sessions_query(child_id, date_range_days).all()
             
             if not sessions:
                 return {"error": f"No sessions found for child {child_id}"}
@@ -291,6 +277,19 @@ class AnalyticsService:
             return {"error": str(e)}
     
     # Helper Methods
+    def _child_sessions_query(self, child_id: int, date_range_days: Optional[int] = None):
+        """
+        Sessions of a child in chronological order
+        
+        The lower bound is a plain comparison on started_at (the partition key)
+        so PostgreSQL prunes the monthly partitions outside the range.
+        """
+        query = self.db.query(GameSession).filter(GameSession.child_id == child_id)
+        if date_range_days is not None:
+            from_date = datetime.now(timezone.utc) - timedelta(days=date_range_days)
+            query = query.filter(GameSession.started_at >= from_date)
+        return query.order_by(GameSession.started_at)
+    
     def _calculate_score_trend(self, sessions: List[GameSession]) -> Dict[str, Any]:
         """Calculate score trends across sessions"""
         try:
@@ -9,7 +9,7 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, func, desc, asc, case
+from sqlalchemy import and_, or_, func, desc, asc, case, insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.auth.models import User, UserRole
@@ -17,15 +17,26 @@ from app.users.models import Child, Activity
 from app.reports.models import GameSession, Report, SessionType, EmotionalState, ReportType
 from app.reports.schemas import (
     GameSessionCreate, GameSessionUpdate, GameSessionComplete, GameSessionResponse,
-    GameSessionFilters, PaginationParams, GameSessionAnalytics
+    GameSessionFilters, PaginationParams, GameSessionAnalytics,
+    GameSessionBulkItem, GameSessionBulkResult, SessionDataValidator
 )
 from app.core.cache import (
     cached, performance_cache, cache_child_sessions, 
-    invalidate_child_cache, cache_child_analytics
+    invalidate_child_cache, cache_child_analytics, child_tag
 )
+from app.core.snapshots import to_snapshots
+from app.core.pagination import KeysetPage, keyset_paginate, count_rows
 
 logger = logging.getLogger(__name__)
 
+# Non-column GameSession attributes captured in cached snapshots (used by GameSessionResponse)
+GAME_SESSION_SNAPSHOT_ATTRIBUTES = (
+    "scenario_version", "pause_count", "total_pause_duration", "incorrect_responses",
+    "hint_usage_count", "achievements_unlocked", "progress_markers_hit", "device_model",
+    "environment_type", "support_person_present", "created_at", "updated_at",
+    "success_rate", "engagement_score"
+)
+
 
 class GameSessionService:
     """
@@ -162,6 +173,9 @@ class GameSessionService:
         """
         Get sessions for a child with filtering and caching (Task 27 Performance Optimization)
         
+        Cached results are detached, read-only GameSession snapshots; they expose
+        the same column attributes and can be passed to GameSessionResponse.model_validate.
+        
         Args:
             child_id: ID of the child
             filters: Optional filters for session retrieval
@@ -169,7 +183,7 @@ class GameSessionService:
             use_cache: Whether to use caching for performance (default: True)
             
         Returns:
-            List of GameSession objects
+            List of GameSession objects (or GameSession snapshots on cache hit)
         """
         try:
             logger.info(f"Retrieving sessions for child {child_id}")
@@ -217,8 +231,14 @@ class GameSessionService:
             
             # Cache the result if it's a simple query
             if cache_key and use_cache:
-                performance_cache.set(cache_key, sessions, ttl_seconds=300)  # Cache for 5 minutes
-                logger.debug(f"Cached sessions for child {child_id}")
+                try:
+                    snapshots = to_snapshots(sessions, GAME_SESSION_SNAPSHOT_ATTRIBUTES)
+                except (AttributeError, SQLAlchemyError) as e:
+                    logger.warning(f"Not caching sessions for child {child_id}: {e}")
+                else:
+                    performance_cache.set(cache_key, snapshots, ttl_seconds=300,  # Cache for 5 minutes
+                                          tags={child_tag(child_id)})
+                    logger.debug(f"Cached sessions for child {child_id}")
             
             logger.info(f"Retrieved {len(sessions)} sessions for child {child_id}")
             return sessions
@@ -229,6 +249,150 @@ class GameSessionService:
         except Exception as e:
             logger.error(f"Error retrieving sessions for child {child_id}: {str(e)}")
             return []
+    
+    def list_sessions(
+        self,
+        filters: Optional[GameSessionFilters] = None,
+        pagination: Optional[PaginationParams] = None,
+        accessible_child_ids: Optional[List[int]] = None,
+        cursor: Optional[str] = None,
+        count: Optional[str] = None
+    ) -> KeysetPage:
+        """
+        List sessions newest first with keyset pagination on (started_at, id)
+        
+        Args:
+            filters: Optional filters
+            pagination: Page size; page numbers only apply without a cursor
+            accessible_child_ids: Restrict to these children (access control)
+            cursor: Cursor returned with the previous page
+            count: None (no count), "exact" or "estimated" total
+            
+        Returns:
+            KeysetPage of GameSession objects
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        query = self.db.query(GameSession).options(joinedload(GameSession.child))
+        
+        # Apply access control
+        if accessible_child_ids is not None:
+            query = query.filter(GameSession.child_id.in_(accessible_child_ids))
+        
+        if filters:
+            if filters.child_id:
+                query = query.filter(GameSession.child_id == filters.child_id)
+            if filters.session_type:
+                query = query.filter(GameSession.session_type == filters.session_type)
+            if filters.completion_status:
+                query = query.filter(GameSession.completion_status == filters.completion_status)
+            if filters.date_from:
+                query = query.filter(GameSession.started_at >= filters.date_from)
+            if filters.date_to:
+                query = query.filter(GameSession.started_at <= filters.date_to)
+        
+        page_size = pagination.page_size if pagination else 20
+        offset = (pagination.page - 1) * page_size if pagination and not cursor else 0
+        page = keyset_paginate(query, GameSession.started_at, GameSession.id, page_size, cursor, offset)
+        if count:
+            page.total_count, page.total_is_estimate = count_rows(query, estimated=(count == "estimated"))
+        return page
+    
+    def bulk_create_sessions(
+        self,
+        items: List[GameSessionBulkItem],
+        accessible_child_ids: Optional[List[int]] = None
+    ) -> GameSessionBulkResult:
+        """
+        Ingest a batch of completed sessions (e.g. synced from an offline device)
+        
+        Every item is validated with SessionDataValidator; invalid items, unknown
+        children and children outside accessible_child_ids are rejected and the
+        rest is written with one multi-row INSERT ... RETURNING and one commit.
+        hint_usage_count and total_pause_duration have no columns and are
+        stored in interaction_patterns. Child caches are invalidated once per
+        child, not once per session.
+        
+        Args:
+            items: Sessions to ingest
+            accessible_child_ids: Restrict to these children (access control)
+            
+        Returns:
+            GameSessionBulkResult with the created IDs in request order
+            
+        Raises:
+            SQLAlchemyError: If the insert fails (nothing is written)
+        """
+        result = GameSessionBulkResult()
+        requested_ids = {item.child_id for item in items}
+        existing_ids = {
+            row[0] for row in self.db.query(Child.id).filter(Child.id.in_(requested_ids))
+        } if requested_ids else set()
+        allowed_ids = set(accessible_child_ids) if accessible_child_ids is not None else None
+        column_keys = set(GameSession.__table__.columns.keys())
+        
+        rows = []
+        for index, item in enumerate(items):
+            data = item.model_dump()
+            if data["duration_seconds"] is None and item.ended_at is not None:
+                data["duration_seconds"] = max(0, int((item.ended_at - item.started_at).total_seconds()))
+            
+            errors = []
+            if item.child_id not in existing_ids:
+                errors.append(f"Child {item.child_id} not found")
+            elif allowed_ids is not None and item.child_id not in allowed_ids:
+                errors.append(f"Access denied to child {item.child_id}")
+            if item.ended_at is not None and item.ended_at < item.started_at:
+                errors.append("Session cannot end before it started")
+            
+            validation = SessionDataValidator.validate_session_metrics(
+                {key: value for key, value in data.items() if value is not None}
+            )
+            errors.extend(validation.errors)
+            if errors:
+                result.rejected.append({"index": index, "errors": errors})
+                continue
+            if validation.warnings:
+                result.warnings.append({"index": index, "warnings": validation.warnings})
+            
+            data["session_type"] = item.session_type.value
+            data["achievement_unlocked"] = data["achievements_unlocked"]
+            # No columns for these; keep them with the interaction analytics
+            data["interaction_patterns"] = {
+                **(data["interaction_patterns"] or {}),
+                "hint_usage_count": item.hint_usage_count,
+                "total_pause_duration": item.total_pause_duration
+            }
+            rows.append({key: value for key, value in data.items() if key in column_keys})
+        
+        if not rows:
+            return result
+        
+        try:
+            # executemany with RETURNING is sent as batched multi-row VALUES (insertmanyvalues)
+            created = self.db.execute(
+                insert(GameSession).returning(GameSession.id, sort_by_parameter_order=True),
+                rows
+            )
+            result.created_ids = list(created.scalars())
+            self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during bulk session ingestion ({len(rows)} sessions): {str(e)}")
+            self.db.rollback()
+            raise
+        result.created_count = len(result.created_ids)
+        
+        child_ids = {row["child_id"] for row in rows}
+        for child_id in child_ids:
+            invalidate_child_cache(child_id)
+        
+        logger.info(
+            f"Bulk ingested {result.created_count} sessions for {len(child_ids)} children "
+            f"({len(result.rejected)} rejected)"
+        )
+        return result
+    
     def calculate_session_metrics(self, session_or_id) -> Dict[str, Any]:
         """
         Calculate comprehensive metrics for a specific session
@@ -276,7 +440,10 @@ class GameSessionService:
             logger.error(f"Error calculating metrics for session {session_id}: {str(e)}")
             return {"error": str(e)}
     
-    @cached(ttl_seconds=900, key_prefix="child_analytics")  # Cache for 15 minutes
+    @cached(ttl_seconds=900, key_prefix="child_analytics",  # Cache for 15 minutes
+            tags=lambda self, child_id, *args, **kwargs: {child_tag(child_id)},
+            early_refresh_beta=1.0,  # Refresh hot children before expiry
+            stale_ttl=300)  # Serve up to 5 minutes stale while refreshing in background
     def get_child_analytics_cached(self, child_id: int, days: int = 30) -> Dict[str, Any]:
         """
         Get comprehensive analytics for a child with caching (Task 27 Performance Optimization)
@@ -9,10 +9,12 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.auth.models import User, UserRole
+from app.auth.principals import CurrentUser
 from app.auth.dependencies import (
     get_current_user, get_current_verified_user,
     require_parent, require_professional, require_admin,
@@ -29,7 +31,8 @@ from app.users.schemas import (
 from app.reports.schemas import GameSessionResponse
 from app.users.crud import (
     get_child_service, get_activity_service, get_session_service,
-    get_analytics_service, ChildService, ActivityService
+    get_analytics_service, ChildService, ActivityService,
+    get_async_child_service, get_async_session_service
 )
 import logging
 
@@ -57,7 +60,7 @@ router = APIRouter()
 @router.post("/children", response_model=ChildResponse, status_code=status.HTTP_201_CREATED)
 async def create_child(
     child_data: ChildCreate,
-    current_user: User = Depends(require_parent),
+    current_user: CurrentUser = Depends(require_parent),
     db: Session = Depends(get_db)
 ):
     """
@@ -97,8 +100,8 @@ async def create_child(
 @router.get("/children", response_model=List[ChildResponse])
 async def get_children_list(
     include_inactive: bool = Query(default=False, description="Include inactive children"),
-    current_user: User = Depends(get_current_verified_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_verified_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get list of children for current user
@@ -109,20 +112,21 @@ async def get_children_list(
     - For admins: All children with filtering
     """
     try:
-        child_service = get_child_service(db)
+        child_service = get_async_child_service(db)
         
         if current_user.role == UserRole.PARENT:
             # Parents can only see their own children
-            children = child_service.get_children_by_parent(
+            children = await child_service.get_children_by_parent(
                 current_user.id, 
                 include_inactive=include_inactive
             )
             
         elif current_user.role == UserRole.ADMIN:
             # Admins can see all children
-            children = db.query(Child).filter(
+            result = await db.execute(select(Child).filter(
                 Child.is_active == True if not include_inactive else True
-            ).order_by(desc(Child.created_at)).limit(100).all()
+            ).order_by(desc(Child.created_at)).limit(100))
+            children = result.scalars().all()
             
         elif current_user.role == UserRole.PROFESSIONAL:
             # Professionals see assigned children (placeholder for future implementation)
@@ -153,7 +157,7 @@ async def get_children_list(
 @router.get("/children/{child_id}", response_model=ChildDetailResponse)
 async def get_child_detail(
     child_id: int,
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -244,7 +248,7 @@ async def get_child_detail(
 async def update_child(
     child_id: int,
     update_data: ChildUpdate,
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -286,7 +290,7 @@ async def update_child(
 async def delete_child(
     child_id: int,
     permanent: bool = Query(default=False, description="Permanently delete (admin only)"),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -364,7 +368,7 @@ async def get_child_activities(
     limit: int = Query(default=50, ge=1, le=200, description="Maximum number of activities"),
     activity_type: Optional[str] = Query(default=None, description="Filter by activity type"),
     verified_only: bool = Query(default=False, description="Only verified activities"),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -424,8 +428,8 @@ async def get_child_game_sessions(
     child_id: int,
     limit: int = Query(default=20, ge=1, le=100, description="Maximum number of sessions"),
     session_type: Optional[str] = Query(default=None, description="Filter by session type"),
-    current_user: User = Depends(get_current_verified_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_verified_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get game sessions for a specific child
@@ -437,8 +441,8 @@ async def get_child_game_sessions(
     """
     try:
         # Verify child access permissions
-        child_service = get_child_service(db)
-        child = child_service.get_child_by_id(child_id, include_relationships=False)
+        child_service = get_async_child_service(db)
+        child = await child_service.get_child_by_id(child_id)
         
         if not child:
             raise HTTPException(
@@ -454,8 +458,8 @@ async def get_child_game_sessions(
             )
         
         # Get game sessions
-        session_service = get_session_service(db)
-        sessions = session_service.get_sessions_by_child(
+        session_service = get_async_session_service(db)
+        sessions = await session_service.get_sessions_by_child(
             child_id, 
             limit=limit, 
             session_type=session_type
@@ -488,7 +492,7 @@ async def get_child_game_sessions(
 async def get_child_progress(
     child_id: int,
     days: int = Query(default=30, ge=1, le=365, description="Number of days to analyze"),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -544,7 +548,7 @@ async def get_child_progress(
 @router.get("/children/{child_id}/achievements")
 async def get_child_achievements(
     child_id: int,
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -664,7 +668,7 @@ async def get_child_achievements(
 async def add_points_to_child(
     child_id: int,
     points_data: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -756,7 +760,7 @@ async def add_points_to_child(
 @router.put("/children/bulk-update", response_model=BulkOperationResponse)
 async def bulk_update_children(
     bulk_data: BulkChildUpdateSchema,
-    current_user: User = Depends(require_admin),  # Admin only
+    current_user: CurrentUser = Depends(require_admin),  # Admin only
     db: Session = Depends(get_db)
 ):
     """
@@ -828,7 +832,7 @@ async def search_children(
     support_level: Optional[int] = Query(None, ge=1, le=3, description="ASD support level"),
     diagnosis_keyword: Optional[str] = Query(None, description="Search in diagnosis"),
     limit: int = Query(default=50, ge=1, le=200, description="Maximum results"),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -920,7 +924,7 @@ async def verify_child_activity(
     child_id: int,
     activity_id: int,
     verification_data: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1024,7 +1028,7 @@ async def verify_child_activity(
 async def add_progress_note(
     child_id: int,
     note_data: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1123,7 +1127,7 @@ async def get_progress_notes(
     child_id: int,
     category: Optional[str] = Query(None, description="Filter by category"),
     limit: int = Query(default=50, ge=1, le=200, description="Maximum notes to return"),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1191,7 +1195,7 @@ async def get_progress_notes(
 async def update_sensory_profile(
     child_id: int,
     sensory_data: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1272,7 +1276,7 @@ async def update_sensory_profile(
 async def get_sensory_profile(
     child_id: int,
     domain: Optional[str] = Query(None, description="Specific sensory domain"),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1364,7 +1368,7 @@ async def export_child_data(
     include_notes: bool = Query(default=True),
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1590,7 +1594,7 @@ async def export_child_data(
 
 @router.get("/children/statistics")
 async def get_children_statistics(
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1720,7 +1724,7 @@ async def get_children_statistics(
 @router.get("/children/{child_id}/profile-completion")
 async def check_profile_completion(
     child_id: int,
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -1935,7 +1939,7 @@ async def compare_children_progress(
     child_ids: List[int] = Query(..., description="List of child IDs to compare"),
     metric: str = Query(default="points", description="Comparison metric"),
     period_days: int = Query(default=30, ge=1, le=365, description="Comparison period"),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2139,7 +2143,7 @@ def _generate_comparison_insights(comparison_data: List[Dict], metric: str) -> D
 @router.post("/children/quick-setup", response_model=ChildResponse)
 async def quick_child_setup(
     basic_info: Dict[str, Any],
-    current_user: User = Depends(require_parent),
+    current_user: CurrentUser = Depends(require_parent),
     db: Session = Depends(get_db)
 ):
     """
@@ -2207,7 +2211,7 @@ async def quick_child_setup(
 
 @router.get("/children/templates")
 async def get_child_profile_templates(
-    current_user: User = Depends(get_current_verified_user)
+    current_user: CurrentUser = Depends(get_current_verified_user)
 ):
     """
     Get child profile templates for different scenarios
@@ -2304,7 +2308,7 @@ async def get_child_profile_templates(
 async def share_child_profile(
     child_id: int,
     share_data: Dict[str, Any],
-    current_user: User = Depends(require_parent),
+    current_user: CurrentUser = Depends(require_parent),
     db: Session = Depends(get_db)
 ):
     """
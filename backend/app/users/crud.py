@@ -6,8 +6,9 @@ Enhanced with performance optimization, caching, and data integrity for Task 27
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, or_, desc, asc, func, text
+from sqlalchemy import and_, or_, desc, asc, func, text, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.models import User, UserRole
 from app.users.models import Child, Activity, Assessment, ProfessionalProfile
@@ -19,13 +20,17 @@ from app.users.schemas import (
 from app.reports.schemas import GameSessionCreate, GameSessionUpdate
 from app.core.cache import (
     cached, performance_cache, cache_user_children,
-    invalidate_child_cache, invalidate_user_cache
+    invalidate_child_cache, invalidate_user_cache, child_tag, user_tag
 )
+from app.core.snapshots import to_snapshots
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Computed Child attributes captured in cached snapshots (used by ChildResponse)
+CHILD_SNAPSHOT_ATTRIBUTES = ("full_profile_complete", "age_category")
+
 # =============================================================================
 # CHILD CRUD OPERATIONS
 # =============================================================================
@@ -115,13 +120,16 @@ class ChildService:
         """
         Get all children for a parent with optimized loading and caching (Task 27 Performance Optimization)
         
+        Cached results are detached, read-only Child snapshots; they expose the
+        same column attributes and can be passed to ChildResponse.model_validate.
+        
         Args:
             parent_id: Parent user ID
             include_inactive: Whether to include inactive children
             use_cache: Whether to use caching for performance
             
         Returns:
-            List of Child objects
+            List of Child objects (or Child snapshots on cache hit)
         """
         try:
             # Generate cache key for active children queries
@@ -146,8 +154,14 @@ class ChildService:
             
             # Cache the result for active children queries
             if cache_key and use_cache:
-                performance_cache.set(cache_key, children, ttl_seconds=600)  # Cache for 10 minutes
-                logger.debug(f"Cached children for parent {parent_id}")
+                cache_tags = {user_tag(parent_id)} | {child_tag(child.id) for child in children}
+                try:
+                    snapshots = to_snapshots(children, CHILD_SNAPSHOT_ATTRIBUTES)
+                except (AttributeError, SQLAlchemyError) as e:
+                    logger.warning(f"Not caching children for parent {parent_id}: {e}")
+                else:
+                    performance_cache.set(cache_key, snapshots, ttl_seconds=600, tags=cache_tags)  # Cache for 10 minutes
+                    logger.debug(f"Cached children for parent {parent_id}")
             
             logger.info(f"Retrieved {len(children)} children for parent {parent_id}")
             return children
@@ -671,6 +685,149 @@ class GameSessionService:
             logger.error(f"Error getting sessions for child {child_id}: {str(e)}")
             return []
 
+# =============================================================================
+# ASYNC READ SERVICES (hot paths used by async routes)
+# =============================================================================
+
+class AsyncChildService:
+    """Child lookups on an AsyncSession, so async routes do not block the event loop"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_children_by_parent(self, parent_id: int, include_inactive: bool = False,
+                                     use_cache: bool = True) -> List[Child]:
+        """
+        Get all children for a parent (shares the cache entries of ChildService)
+        
+        Args:
+            parent_id: Parent user ID
+            include_inactive: Whether to include inactive children
+            use_cache: Whether to use caching for performance
+            
+        Returns:
+            List of Child objects (or Child snapshots on cache hit)
+        """
+        try:
+            cache_key = None
+            if use_cache and not include_inactive:
+                cache_key = cache_user_children(parent_id)
+                cached_result = performance_cache.get(cache_key)
+                if cached_result is not None:
+                    logger.debug(f"Cache hit for parent {parent_id} children")
+                    return cached_result
+            
+            query = select(Child).where(Child.parent_id == parent_id)
+            if not include_inactive:
+                query = query.where(Child.is_active == True)
+            
+            result = await self.db.execute(query.order_by(desc(Child.created_at)))
+            children = list(result.scalars().all())
+            
+            if cache_key and use_cache:
+                cache_tags = {user_tag(parent_id)} | {child_tag(child.id) for child in children}
+                try:
+                    snapshots = to_snapshots(children, CHILD_SNAPSHOT_ATTRIBUTES)
+                except (AttributeError, SQLAlchemyError) as e:
+                    logger.warning(f"Not caching children for parent {parent_id}: {e}")
+                else:
+                    performance_cache.set(cache_key, snapshots, ttl_seconds=600, tags=cache_tags)
+            
+            logger.info(f"Retrieved {len(children)} children for parent {parent_id}")
+            return children
+            
+        except Exception as e:
+            logger.error(f"Error getting children for parent {parent_id}: {str(e)}")
+            return []
+    
+    async def get_child_by_id(self, child_id: int) -> Optional[Child]:
+        """
+        Get child by ID (relationships are not loaded)
+        
+        Args:
+            child_id: Child ID
+            
+        Returns:
+            Child object or None
+        """
+        try:
+            return await self.db.get(Child, child_id)
+        except Exception as e:
+            logger.error(f"Error getting child {child_id}: {str(e)}")
+            return None
+    
+    async def count_recent_activities(self, child_ids: List[int], since: datetime) -> Dict[int, int]:
+        """
+        Count activities completed since a date, per child, in one query
+        
+        Args:
+            child_ids: Child IDs
+            since: Lower bound for completed_at
+            
+        Returns:
+            Mapping of child ID to activity count (missing children have 0)
+        """
+        if not child_ids:
+            return {}
+        result = await self.db.execute(
+            select(Activity.child_id, func.count(Activity.id))
+            .where(Activity.child_id.in_(child_ids), Activity.completed_at >= since)
+            .group_by(Activity.child_id)
+        )
+        counts = {child_id: 0 for child_id in child_ids}
+        counts.update({child_id: count for child_id, count in result.all()})
+        return counts
+    
+    async def get_activities_since(self, child_id: int, since: datetime) -> List[Activity]:
+        """
+        Get a child's activities completed since a date, newest first
+        
+        Args:
+            child_id: Child ID
+            since: Lower bound for completed_at
+            
+        Returns:
+            List of Activity objects
+        """
+        result = await self.db.execute(
+            select(Activity)
+            .where(Activity.child_id == child_id, Activity.completed_at >= since)
+            .order_by(Activity.completed_at.desc())
+        )
+        return list(result.scalars().all())
+
+
+class AsyncGameSessionService:
+    """Game session lookups on an AsyncSession"""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_sessions_by_child(self, child_id: int, limit: int = 20,
+                                    session_type: Optional[str] = None) -> List[GameSession]:
+        """
+        Get game sessions for a child, newest first
+        
+        Args:
+            child_id: Child ID
+            limit: Maximum number of sessions
+            session_type: Optional session type filter
+            
+        Returns:
+            List of GameSession objects
+        """
+        try:
+            query = select(GameSession).where(GameSession.child_id == child_id)
+            if session_type:
+                query = query.where(GameSession.session_type == session_type)
+            
+            result = await self.db.execute(query.order_by(desc(GameSession.started_at)).limit(limit))
+            return list(result.scalars().all())
+            
+        except Exception as e:
+            logger.error(f"Error getting sessions for child {child_id}: {str(e)}")
+            return []
+
 # =============================================================================
 # PROFESSIONAL PROFILE CRUD OPERATIONS
 # =============================================================================
@@ -1292,6 +1449,14 @@ def get_professional_service(db: Session):
     """Get professional service instance"""
     return ProfessionalService(db)
 
+def get_async_child_service(db: AsyncSession) -> AsyncChildService:
+    """Get async child service instance"""
+    return AsyncChildService(db)
+
+def get_async_session_service(db: AsyncSession) -> AsyncGameSessionService:
+    """Get async game session service instance"""
+    return AsyncGameSessionService(db)
+
 # =============================================================================
 # CONVENIENCE CRUD FUNCTIONS (for backward compatibility)
 # =============================================================================
@@ -5,7 +5,8 @@ Extends the existing auth system with specialized models for comprehensive autis
 
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, JSON, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -98,7 +99,7 @@ class Child(Base):
     communication_notes = Column(Text, nullable=True)
     
     # Therapy and intervention information
-    current_therapies = Column(JSON, default=list, nullable=False, doc="""
+    current_therapies = Column(JSONB, default=list, nullable=False, doc="""
     [
         {
             "type": "ABA|speech|occupational|physical",
@@ -327,9 +328,15 @@ class Activity(Base):
     Activity tracking with comprehensive ASD-focused data collection
     """
     __tablename__ = "activities"
+    __table_args__ = (
+        # Hot path: WHERE child_id = ? AND completed_at >= ? ORDER BY completed_at;
+        # INCLUDE columns serve points/verification aggregates. Replaces ix_activities_child_id.
+        Index('ix_activities_child_id_completed_at', 'child_id', 'completed_at',
+              postgresql_include=['points_earned', 'verified_by_parent']),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    child_id = Column(Integer, ForeignKey(CHILDREN_TABLE_ID), nullable=False, index=True)
+    child_id = Column(Integer, ForeignKey(CHILDREN_TABLE_ID), nullable=False)
     
     # Activity identification
     activity_type = Column(String(50), nullable=False, index=True)
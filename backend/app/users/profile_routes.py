@@ -18,6 +18,7 @@ from app.auth.dependencies import (
     get_current_user, get_current_verified_user,
     require_parent, require_professional, require_admin
 )
+from app.auth.principals import CurrentUser, invalidate_principal
 from app.users.models import Child, ProfessionalProfile
 from app.auth.schemas import UserResponse, UserDetailResponse
 from app.users.schemas import (
@@ -38,7 +39,7 @@ router = APIRouter()
 
 @router.get("/profile", response_model=UserDetailResponse)
 async def get_detailed_user_profile(
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -125,7 +126,7 @@ async def get_detailed_user_profile(
 @router.put("/profile", response_model=UserResponse)
 async def update_user_profile(
     update_data: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -162,21 +163,22 @@ async def update_user_profile(
             )
         
         # Update user fields
+        user = current_user.user
         for field, value in filtered_data.items():
-            if hasattr(current_user, field):
-                setattr(current_user, field, value)
+            if hasattr(user, field):
+                setattr(user, field, value)
         
         # Update full_name if first_name or last_name changed
         if "first_name" in filtered_data or "last_name" in filtered_data:
-            current_user.full_name = f"{current_user.first_name} {current_user.last_name}"
+            user.full_name = f"{user.first_name} {user.last_name}"
         
-        current_user.updated_at = datetime.now(timezone.utc)
+        user.updated_at = datetime.now(timezone.utc)
         
         db.commit()
-        db.refresh(current_user)
+        db.refresh(user)
         
         logger.info(f"Profile updated for user {current_user.id}")
-        return UserResponse.model_validate(current_user)
+        return UserResponse.model_validate(user)
         
     except HTTPException:
         raise
@@ -191,7 +193,7 @@ async def update_user_profile(
 @router.post("/profile/avatar")
 async def upload_avatar(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -223,8 +225,9 @@ async def upload_avatar(
         avatar_url = f"https://avatars.smileadventure.com/users/{current_user.id}/{file.filename}"
         
         # Update user avatar URL
-        current_user.avatar_url = avatar_url
-        current_user.updated_at = datetime.now(timezone.utc)
+        user = current_user.user
+        user.avatar_url = avatar_url
+        user.updated_at = datetime.now(timezone.utc)
         
         db.commit()
         
@@ -245,13 +248,14 @@ async def upload_avatar(
 
 @router.delete("/profile/avatar")
 async def remove_avatar(
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """Remove user avatar"""
     try:
-        current_user.avatar_url = None
-        current_user.updated_at = datetime.now(timezone.utc)
+        user = current_user.user
+        user.avatar_url = None
+        user.updated_at = datetime.now(timezone.utc)
         
         db.commit()
         
@@ -272,7 +276,7 @@ async def remove_avatar(
 @router.post("/professional-profile", response_model=ProfessionalProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_professional_profile(
     profile_data: ProfessionalProfileCreate,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """
@@ -315,7 +319,7 @@ async def create_professional_profile(
 
 @router.get("/professional-profile", response_model=ProfessionalProfileResponse)
 async def get_professional_profile(
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """Get current user's professional profile"""
@@ -343,7 +347,7 @@ async def get_professional_profile(
 @router.put("/professional-profile", response_model=ProfessionalProfileResponse)
 async def update_professional_profile(
     profile_data: ProfessionalProfileUpdate,
-    current_user: User = Depends(require_professional),
+    current_user: CurrentUser = Depends(require_professional),
     db: Session = Depends(get_db)
 ):
     """Update professional profile"""
@@ -377,7 +381,7 @@ async def update_professional_profile(
 
 @router.get("/preferences")
 async def get_user_preferences(
-    current_user: User = Depends(get_current_verified_user)
+    current_user: CurrentUser = Depends(get_current_verified_user)
 ):
     """Get user preferences and settings"""
     return {
@@ -404,20 +408,21 @@ async def get_user_preferences(
 @router.put("/preferences")
 async def update_user_preferences(
     preferences: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """Update user preferences and settings"""
     try:
         # Update basic preferences
+        user = current_user.user
         if "timezone" in preferences:
-            current_user.timezone = preferences["timezone"]
+            user.timezone = preferences["timezone"]
         if "language" in preferences:
-            current_user.language = preferences["language"]
+            user.language = preferences["language"]
         
-        current_user.updated_at = datetime.now(timezone.utc)
+        user.updated_at = datetime.now(timezone.utc)
         db.commit()
-        db.refresh(current_user)
+        db.refresh(user)
         
         # Return updated preferences (similar to GET endpoint but with updated values)
         logger.info(f"Preferences updated for user {current_user.id}")
@@ -453,7 +458,7 @@ async def update_user_preferences(
 
 @router.get("/profile/completion")
 async def get_profile_completion(
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """Get user profile completion status and score"""
@@ -482,7 +487,7 @@ async def get_profile_completion(
 @router.get("/users/{user_id}", response_model=UserDetailResponse)
 async def get_user_by_id(
     user_id: int,
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Get detailed user information by ID (Admin only)"""
@@ -531,7 +536,7 @@ async def get_user_by_id(
 async def update_user_status(
     user_id: int,
     status_data: Dict[str, str],
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """Update user status (Admin only)"""
@@ -562,6 +567,7 @@ async def update_user_status(
         user.last_modified_by = current_user.id
         
         db.commit()
+        invalidate_principal(user_id)
         
         logger.info(f"User {user_id} status updated by admin {current_user.id}")
         return {"message": "User status updated successfully"}
@@ -586,7 +592,7 @@ async def search_professionals(
     location: Optional[str] = None,
     accepts_new_patients: bool = True,
     limit: int = 20,
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -634,7 +640,7 @@ async def search_professionals(
 @router.post("/profile/search/professionals")
 async def search_professionals_with_filters(
     search_data: Dict[str, Any],
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -677,7 +683,7 @@ async def search_professionals_with_filters(
 @router.get("/profile/professional/{professional_id}")
 async def get_professional_public_profile(
     professional_id: int,
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
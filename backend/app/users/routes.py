@@ -9,8 +9,9 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, desc
 
-from app.core.database import get_db
+from app.core.database import get_db, get_readonly_db
 from app.auth.models import User, UserRole
+from app.auth.principals import CurrentUser
 from app.auth.dependencies import (
     get_current_user, get_current_verified_user,
     require_parent, require_professional, require_admin
@@ -48,8 +49,8 @@ router.include_router(
 
 @router.get("/dashboard")
 async def get_dashboard_stats(
-    current_user: User = Depends(get_current_verified_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_verified_user),
+    db: Session = Depends(get_readonly_db)
 ):
     """
     Get dashboard statistics for current user
@@ -298,8 +299,8 @@ async def _get_admin_dashboard(_: int, db: Session) -> Dict[str, Any]:
 async def get_child_progress_report(
     child_id: int,
     days: int = Query(default=30, ge=1, le=365, description="Number of days to include in report"),
-    current_user: User = Depends(get_current_verified_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_verified_user),
+    db: Session = Depends(get_readonly_db)
 ):
     """
     Get comprehensive progress report for a specific child
@@ -794,7 +795,7 @@ def _calculate_weekly_trends(
 @router.get("/analytics/platform")
 async def get_platform_analytics(
     days: int = Query(default=30, ge=1, le=365),
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -1056,7 +1057,7 @@ async def export_child_data(
     child_id: int,
     format: str = Query(default="json", pattern="^(json|csv)$"),
     include_sensitive: bool = Query(default=False),
-    current_user: User = Depends(get_current_verified_user),
+    current_user: CurrentUser = Depends(get_current_verified_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -2,9 +2,12 @@
 Smile Adventure Backend - Main FastAPI Application
 """
 
+from contextlib import asynccontextmanager
+import asyncio
+import logging
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 import uvicorn
 import os
 from dotenv import load_dotenv
@@ -14,26 +17,93 @@ load_dotenv()
 
 # Import routers
 from app.api.main import api_router
-from app.core.database import engine
+from app.core.database import engine, async_engine
 from app.core.config import settings
 
 # Import database utilities
 from app.core.database import DatabaseManager
+from app.core.cache import performance_cache, cache_maintenance_loop
+from app.core.password_pool import password_pool
+from app.auth.activity_buffer import activity_buffer, activity_flush_loop
+from app.core.metrics import render_prometheus_metrics, PROMETHEUS_CONTENT_TYPE
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.rate_limit import RateLimitMiddleware, credential_rate_limiter
+from app.reports.partitions import maintain_game_session_partitions, partition_maintenance_loop
 
 # Import all models to ensure they are registered with SQLAlchemy
 from app.users import models as user_models
 from app.reports import models as report_models
 from app.auth import models as auth_models
 
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown: database tables and cache maintenance"""
+    try:
+        db_manager = DatabaseManager()
+        db_manager.create_all_tables()
+        print("✅ Database tables created successfully")
+    except Exception as e:
+        print(f"❌ Error creating database tables: {e}")
+    
+    try:
+        maintain_game_session_partitions()
+    except Exception:
+        logger.exception("Error maintaining game session partitions")
+    
+    maintenance_task = None
+    if settings.CACHE_MAINTENANCE_INTERVAL > 0:
+        maintenance_task = asyncio.create_task(cache_maintenance_loop(
+            interval_seconds=settings.CACHE_MAINTENANCE_INTERVAL,
+            sweep_batch_size=settings.CACHE_SWEEP_BATCH_SIZE
+        ))
+    
+    partition_task = None
+    if settings.PARTITION_MAINTENANCE_INTERVAL > 0:
+        partition_task = asyncio.create_task(partition_maintenance_loop(
+            interval_seconds=settings.PARTITION_MAINTENANCE_INTERVAL
+        ))
+    
+    activity_task = None
+    if activity_buffer.enabled:
+        activity_task = asyncio.create_task(activity_flush_loop(
+            interval_seconds=settings.ACTIVITY_FLUSH_INTERVAL
+        ))
+    
+    yield
+    
+    for task in (maintenance_task, partition_task, activity_task):
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    activity_buffer.flush()  # Write out buffered timestamps before exit
+    performance_cache.refresher.shutdown(wait=False)
+    password_pool.shutdown(wait=False)
+    if async_engine is not None:
+        await async_engine.dispose()
+
 # Create FastAPI app
 app = FastAPI(
     title="Smile Adventure API",
     description="Backend API for Smile Adventure - A gamified learning platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
+# Rate limit credential endpoints before any bcrypt/DB work (added first so 429s still get CORS headers)
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=credential_rate_limiter,
+        trusted_proxy_hops=settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    )
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -41,21 +111,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Total-Count-Estimated", "Server-Timing", "Retry-After"],
 )
 
+# Per-request SQL count/time (Server-Timing header, N+1 warnings)
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+        server_timing=settings.SQL_SERVER_TIMING
+    )
+
 # Include API routes with versioning
 app.include_router(api_router, prefix="/api/v1")
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database tables on startup"""
-    try:
-        db_manager = DatabaseManager()
-        db_manager.create_all_tables()
-        print("✅ Database tables created successfully")
-    except Exception as e:
-        print(f"❌ Error creating database tables: {e}")
-
 @app.get("/")
 async def root():
     """Root endpoint - Health check"""
@@ -74,6 +143,11 @@ async def health_check():
         "database": "connected"
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics: per-namespace cache statistics, DB pool and password pool status"""
+    return PlainTextResponse(render_prometheus_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
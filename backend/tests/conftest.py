@@ -0,0 +1,133 @@
+"""
+Shared pytest fixtures
+
+Tests run against an in-memory SQLite database built from the ORM metadata,
+so they need no running PostgreSQL. Tests that depend on PostgreSQL-only
+behaviour (query plans, partitions) skip themselves on other backends.
+"""
+
+import pytest
+from sqlalchemy import MetaData, PrimaryKeyConstraint, create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core import query_stats
+from app.core.cache import performance_cache
+from app.core.database import Base
+from app.auth import models as auth_models
+from app.users import models as user_models
+from app.reports import models as report_models
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+def _sqlite_metadata() -> MetaData:
+    """
+    Application tables in a form SQLite can create
+    
+    game_sessions is keyed (id, started_at) for partitioning; SQLite only
+    generates ids for a single INTEGER primary key, so the copy used here is
+    keyed on id alone (the ORM identity is id either way).
+    """
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(metadata)
+    game_sessions = metadata.tables[report_models.GameSession.__tablename__]
+    game_sessions.c.started_at.primary_key = False
+    game_sessions.primary_key = PrimaryKeyConstraint(game_sessions.c.id)
+    return metadata
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """In-memory SQLite engine with every application table"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    
+    # pysqlite does not emit BEGIN itself; needed for the savepoints used by `db`
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
+    _sqlite_metadata().create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    """
+    Session whose work is rolled back after the test
+    
+    Commits made by the code under test only release a savepoint.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start every test with an empty performance cache"""
+    performance_cache.clear()
+    yield
+    performance_cache.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert the SQL budget of a block, typically one endpoint call
+    
+    Usage:
+        async def test_progress(db, query_budget):
+            with query_budget(3, max_repeats=1) as stats:
+                await get_child_progress_report(child_id=1, days=30, current_user=user, db=db)
+    
+    Fails the test when the block runs more than max_queries statements, or
+    one statement shape more than max_repeats times (N+1 loops).
+    """
+    return query_stats.query_budget
+
+
+@pytest.fixture
+def parent(db):
+    """Active, verified parent account"""
+    user = auth_models.User(
+        email="parent@example.com",
+        hashed_password="not-a-real-hash",
+        first_name="Test",
+        last_name="Parent",
+        role=auth_models.UserRole.PARENT,
+        status=auth_models.UserStatus.ACTIVE,
+        is_active=True,
+        is_verified=True
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+@pytest.fixture
+def make_child(db):
+    """Factory adding a child for a parent id"""
+    def make(parent_id: int, name: str = "Test Child"):
+        child = user_models.Child(name=name, age=6, parent_id=parent_id)
+        db.add(child)
+        db.flush()
+        return child
+    return make
@@ -0,0 +1,85 @@
+"""
+Write-behind activity timestamps: coalescing, flush, retry after failure and the row cap
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, select
+
+from app.auth.activity_buffer import ActivityTimestampBuffer
+
+T0 = datetime(2026, 10, 17, 8, 0, tzinfo=timezone.utc)
+
+metadata = MetaData()
+users = Table("auth_users", metadata, Column("id", Integer, primary_key=True), Column("last_login_at", DateTime(timezone=True)))
+sessions = Table("auth_user_sessions", metadata, Column("id", Integer, primary_key=True), Column("last_accessed_at", DateTime(timezone=True)))
+
+
+@pytest.fixture
+def activity_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'activity.db'}")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(users.insert(), [{"id": 1, "last_login_at": None}, {"id": 2, "last_login_at": T0 + timedelta(hours=1)}])
+        connection.execute(sessions.insert(), [{"id": 10}])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def broken_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")  # no tables: every flush fails
+    yield engine
+    engine.dispose()
+
+
+def _logins(engine):
+    with engine.connect() as connection:
+        return {row.id: row.last_login_at.replace(tzinfo=timezone.utc) if row.last_login_at else None
+                for row in connection.execute(select(users))}
+
+
+def test_flush_writes_latest_timestamp_per_row(activity_engine):
+    buffer = ActivityTimestampBuffer()
+    buffer.record_login(1, T0)
+    buffer.record_login(1, T0 + timedelta(minutes=5))
+    buffer.record_login(1, T0 + timedelta(minutes=2))
+    buffer.record_login(2, T0)  # older than the stored value
+    buffer.record_session_access(10, T0)
+
+    assert buffer.flush(activity_engine) == 3
+    assert _logins(activity_engine) == {1: T0 + timedelta(minutes=5), 2: T0 + timedelta(hours=1)}
+    assert buffer.get_stats()["pending"] == 0
+    assert buffer.flush(activity_engine) == 0
+
+
+def test_failed_flush_is_merged_back_and_retried(activity_engine, broken_engine):
+    buffer = ActivityTimestampBuffer()
+    buffer.record_login(1, T0)
+    buffer.record_login(2, T0 + timedelta(hours=2))
+
+    assert buffer.flush(broken_engine) == 0
+    stats = buffer.get_stats()
+    assert stats["flush_errors"] == 1 and stats["pending"] == 2
+
+    buffer.record_login(1, T0 + timedelta(minutes=1))  # recorded while the batch was failing
+    assert buffer.flush(activity_engine) == 2
+    assert _logins(activity_engine) == {1: T0 + timedelta(minutes=1), 2: T0 + timedelta(hours=2)}
+
+
+def test_pending_rows_are_capped(broken_engine):
+    buffer = ActivityTimestampBuffer(max_rows=2)
+    buffer.record_login(1, T0)
+    buffer.record_login(2, T0)
+    buffer.record_login(3, T0)  # over the cap
+    buffer.record_login(1, T0 + timedelta(minutes=1))  # known rows still update
+    assert buffer.get_stats()["dropped"] == 1
+
+    assert buffer.flush(broken_engine) == 0
+    buffer.record_session_access(10, T0)  # fills the slot freed by the failing batch
+    buffer.flush(broken_engine)
+
+    stats = buffer.get_stats()
+    assert stats["pending"] == 2
+    assert stats["dropped"] == 2
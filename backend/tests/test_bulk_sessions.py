@@ -0,0 +1,70 @@
+"""
+Bulk ingestion of offline game sessions (GameSessionService.bulk_create_sessions)
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from app.auth import models as auth_models
+from app.reports.models import GameSession
+from app.reports.schemas import GameSessionBulkItem
+from app.reports.services import game_session_service
+from app.reports.services.game_session_service import GameSessionService
+
+
+def _item(child_id: int, **overrides) -> GameSessionBulkItem:
+    started_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    fields = {
+        "child_id": child_id,
+        "session_type": "therapy_session",
+        "scenario_name": "Dentist",
+        "started_at": started_at,
+        "ended_at": started_at + timedelta(minutes=10),
+        "interactions_count": 10,
+        "correct_responses": 7,
+        "incorrect_responses": 3,
+        "score": 70,
+    }
+    fields.update(overrides)
+    return GameSessionBulkItem(**fields)
+
+
+def test_mixed_batch(db, parent, make_child, monkeypatch):
+    other_parent = auth_models.User(
+        email="other@example.com", hashed_password="not-a-real-hash",
+        first_name="Other", last_name="Parent", role=auth_models.UserRole.PARENT,
+        status=auth_models.UserStatus.ACTIVE, is_active=True, is_verified=True
+    )
+    db.add(other_parent)
+    db.flush()
+    child = make_child(parent.id)
+    second_child = make_child(parent.id, "Second Child")
+    foreign_child = make_child(other_parent.id, "Foreign Child")
+
+    invalidated = Counter()
+    monkeypatch.setattr(game_session_service, "invalidate_child_cache", lambda child_id: invalidated.update([child_id]))
+
+    items = [
+        _item(child.id, hint_usage_count=4, total_pause_duration=30, interaction_patterns={"response_times": [1.5]}),
+        _item(child.id, correct_responses=20),  # more responses than interactions
+        _item(foreign_child.id),
+        _item(second_child.id),
+        _item(999999),
+        _item(child.id),
+    ]
+    result = GameSessionService(db).bulk_create_sessions(items, accessible_child_ids=[child.id, second_child.id])
+
+    assert result.created_count == 3
+    assert [entry["index"] for entry in result.rejected] == [1, 2, 4]
+    assert "Total responses cannot exceed interaction count" in result.rejected[0]["errors"]
+    assert result.rejected[1]["errors"] == [f"Access denied to child {foreign_child.id}"]
+    assert result.rejected[2]["errors"] == ["Child 999999 not found"]
+    assert invalidated == Counter({child.id: 1, second_child.id: 1})
+
+    sessions = {session.id: session for session in db.query(GameSession).filter(GameSession.id.in_(result.created_ids))}
+    first = sessions[result.created_ids[0]]
+    assert first.child_id == child.id
+    assert first.duration_seconds == 600
+    assert first.interaction_patterns == {"response_times": [1.5], "hint_usage_count": 4, "total_pause_duration": 30}
+    assert (first.hint_usage_count, first.total_pause_duration) == (4, 30)
+    assert [sessions[session_id].child_id for session_id in result.created_ids] == [child.id, second_child.id, child.id]
@@ -0,0 +1,61 @@
+"""
+Compressed cache values: thresholds, round trips and byte accounting
+"""
+
+import os
+
+from app.core.cache import CompressedValue, PerformanceCache, ValueCodec, estimate_size
+
+
+def _report(rows: int = 500):
+    return [{"session_id": index, "scenario": "Dentist", "score": index % 100} for index in range(rows)]
+
+
+def test_codec_skips_small_and_incompressible_values():
+    codec = ValueCodec(threshold_bytes=1024)
+    small = {"score": 1}
+    assert codec.encode(small, estimate_size(small)) is None
+
+    noise = os.urandom(8192)
+    assert codec.encode(noise, estimate_size(noise)) is None
+
+    assert ValueCodec(threshold_bytes=0).encode(_report(), estimate_size(_report())) is None  # disabled
+
+
+def test_codec_round_trip():
+    codec = ValueCodec(threshold_bytes=1024)
+    value = _report()
+    encoded = codec.encode(value, estimate_size(value))
+
+    assert isinstance(encoded, CompressedValue)
+    assert len(encoded.payload) < estimate_size(value) * (1 - ValueCodec.MIN_SAVING)
+    assert ValueCodec.decode(encoded) == value
+
+
+def test_cache_stores_large_values_compressed():
+    cache = PerformanceCache(compression_threshold=1024)
+    value = _report()
+    cache.set("child_analytics:1", value)
+    cache.set("child_sessions:1", [1, 2, 3])
+
+    compression = cache.get_stats()["compression"]
+    assert compression["compressed_entries"] == 1
+    assert compression["stored_bytes"] < compression["raw_bytes"]
+    assert compression["ratio"] > 1
+    assert cache.get_stats()["current_bytes"] < estimate_size(value)
+
+    hit = cache.get("child_analytics:1")
+    assert hit == value
+    hit.append("mutated")  # hits are fresh copies
+    assert cache.get("child_analytics:1") == value
+    assert cache.get_stats()["decompressions"] == 2
+
+
+def test_removing_compressed_entries_resets_accounting():
+    cache = PerformanceCache(compression_threshold=1024)
+    cache.set("child_analytics:1", _report(), tags={"child:1"})
+    cache.invalidate_tags("child:1")
+
+    compression = cache.get_stats()["compression"]
+    assert (compression["compressed_entries"], compression["raw_bytes"], compression["stored_bytes"]) == (0, 0, 0)
+    assert cache.get_stats()["current_bytes"] == 0
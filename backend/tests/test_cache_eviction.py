@@ -0,0 +1,84 @@
+"""
+Size-bounded eviction: LRU order, TinyLFU admission and byte limits
+"""
+
+import pytest
+
+from app.core.cache import EvictionPolicy, FrequencySketch, PerformanceCache, estimate_size
+
+
+def test_eviction_policy_is_abstract():
+    with pytest.raises(TypeError):
+        EvictionPolicy()
+
+
+def test_lru_evicts_least_recently_used():
+    cache = PerformanceCache(max_entries=3, eviction_policy="lru")
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    cache.get("a")
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["a", "c", "d"]
+    assert cache.get_stats()["evictions_by_policy"] == {"lru": 1}
+
+
+def test_tinylfu_keeps_hot_entries_during_a_scan():
+    cache = PerformanceCache(max_entries=100, eviction_policy="tinylfu")
+    for index in range(100):
+        cache.set(f"hot:{index}", index)
+    for _ in range(3):
+        for index in range(100):
+            cache.get(f"hot:{index}")
+
+    # One-off keys (e.g. a scan over every child) are not admitted over hot ones
+    for index in range(500):
+        cache.set(f"scan:{index}", index)
+
+    # Plain LRU would keep none; sketch collisions (string hashing is seeded per
+    # process) can let a few scan keys through
+    hot_left = sum(cache.get(f"hot:{index}") is not None for index in range(100))
+    assert hot_left >= 80
+    assert cache.get_stats()["admission_rejections"] > 0
+
+
+def test_tinylfu_admits_keys_requested_more_often_than_the_victim():
+    cache = PerformanceCache(max_entries=100, eviction_policy="tinylfu")
+    for index in range(100):
+        cache.set(f"cold:{index}", index)
+    for _ in range(5):
+        cache.get("popular")  # misses still count towards its frequency
+
+    assert cache.set("popular", "value")
+    assert cache.get("popular") == "value"
+    assert cache.get_stats()["cache_size"] == 100
+
+
+def test_frequency_sketch_ages_incrementally():
+    sketch = FrequencySketch(capacity=1024)
+    assert sketch._mask + 1 > FrequencySketch._AGING_SLICE
+    for _ in range(8):
+        sketch.increment("key")
+    sketch._additions = sketch._sample_size - 1
+
+    sketch.increment("other")  # starts aging: only the first slice is halved
+    assert sketch._aging_cursor == FrequencySketch._AGING_SLICE
+    while sketch._aging_cursor is not None:
+        sketch.increment("other")
+    assert sketch.frequency("key") == 4
+
+
+def test_oversized_overwrite_drops_the_old_value():
+    cache = PerformanceCache(max_bytes=2048)
+    assert cache.set("report", "small", tags={"child:1"})
+
+    big = "x" * 4096
+    assert estimate_size(big) > 2048
+    assert cache.set("report", big) is False
+
+    assert cache.get("report") is None
+    stats = cache.get_stats()
+    assert stats["sets"] == 1
+    assert stats["tag_count"] == 0
+    assert stats["current_bytes"] == 0
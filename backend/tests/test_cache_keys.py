@@ -0,0 +1,97 @@
+"""
+Cache key regression tests: service-method caches must hit across requests
+(each request has its own Session) and keys must match across workers
+"""
+
+import os
+import subprocess
+import sys
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheKeyBuilder, MAX_KEY_DEPTH, normalize_key_value, performance_cache
+from app.reports.services.game_session_service import GameSessionService
+
+
+def _analytics_key(child_id, days=30):
+    return None
+
+
+def test_service_cache_hits_across_request_sessions(db):
+    """get_child_analytics_cached must not key on the per-request Session"""
+    requests = 10
+    for _ in range(requests):
+        request_session = Session(bind=db.connection())
+        try:
+            GameSessionService(request_session).get_child_analytics_cached(42, days=30)
+        finally:
+            request_session.close()
+    
+    stats = performance_cache.get_namespace_stats()["child_analytics"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == requests - 1
+    assert stats["hit_rate_percent"] >= 90.0
+
+
+def test_keys_ignore_call_style_and_defaults():
+    builder = CacheKeyBuilder(GameSessionService.get_child_analytics_cached.__wrapped__, key_prefix="child_analytics")
+    first = GameSessionService(Session())
+    second = GameSessionService(Session())
+    
+    key = builder.build((first, 7), {})
+    assert builder.build((second, 7, 30), {}) == key
+    assert builder.build((second,), {"child_id": 7, "days": 30}) == key
+    assert builder.build((second, 7), {"days": 31}) != key
+    assert key.startswith("child_analytics:GameSessionService.get_child_analytics_cached:")
+
+
+def test_keys_are_stable_across_processes():
+    """Keys must not depend on the per-process hash seed"""
+    script = (
+        "from app.core.cache import CacheKeyBuilder\n"
+        "from tests.test_cache_keys import _analytics_key\n"
+        "print(CacheKeyBuilder(_analytics_key, 'k').build((5,), {'days': 7}))\n"
+    )
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    keys = set()
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        output = subprocess.run(
+            [sys.executable, "-c", script], cwd=backend_dir, env=env,
+            capture_output=True, text=True, check=True
+        )
+        keys.add(output.stdout.strip().splitlines()[-1])
+    assert len(keys) == 1
+
+
+def test_normalize_handles_cycles_sessions_and_depth():
+    class Node:
+        def __init__(self):
+            self.parent = self
+            self.db = Session()
+    
+    node = Node()
+    normalized = normalize_key_value(node)
+    assert normalized["parent"] == f"<{Node.__qualname__}>"
+    assert normalized["db"] == "<Session>"
+    
+    nested = current = []
+    for _ in range(MAX_KEY_DEPTH + 5):
+        current.append([])
+        current = current[0]
+    flat = normalize_key_value(nested)
+    for _ in range(MAX_KEY_DEPTH):
+        flat = flat[0]
+    assert flat == "<list>"
+    
+    # Shared (non-cyclic) references normalise the same way each time
+    shared = {"a": 1}
+    assert normalize_key_value([shared, shared]) == [{"a": 1}, {"a": 1}]
+
+
+def test_unbindable_call_keys_without_walking_receiver():
+    """The TypeError fallback keys on the raw arguments, including self"""
+    builder = CacheKeyBuilder(GameSessionService.get_child_analytics_cached.__wrapped__, key_prefix="child_analytics")
+    service = GameSessionService(Session())
+    key = builder.build((service, 1, 2, 3), {})
+    assert key == builder.build((GameSessionService(Session()), 1, 2, 3), {})
@@ -0,0 +1,100 @@
+"""
+Expiry sweeps: bounded batches, heap compaction and the maintenance loop
+"""
+
+import asyncio
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import PerformanceCache, cache_maintenance_loop, performance_cache
+from app.core.shared_cache import SharedCacheTier
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+def _overwrite_then_expire(cache, clock, overwrites):
+    """A live key rewritten many times (leaving expired, outdated heap pairs) plus one expired key"""
+    for index in range(overwrites):
+        cache.set("rewritten", index, ttl_seconds=1)
+        clock.now += 1
+    cache.set("rewritten", "latest", ttl_seconds=3600)
+    cache.set("expiring", "value", ttl_seconds=1)
+    clock.now += 100
+
+
+def test_batches_of_outdated_pairs_do_not_end_the_sweep(clock):
+    cache = PerformanceCache()
+    _overwrite_then_expire(cache, clock, overwrites=6)
+
+    assert cache.sweep_expired(3) == (0, 3)  # only outdated pairs for "rewritten"
+    removed = 0
+    while True:
+        batch_removed, visited = cache.sweep_expired(3)
+        removed += batch_removed
+        if visited < 3:
+            break
+    assert removed == 1
+    assert cache.get("expiring") is None and cache.get("rewritten") == "latest"
+
+
+@pytest.mark.asyncio
+async def test_maintenance_loop_sweeps_past_outdated_pairs(clock):
+    _overwrite_then_expire(performance_cache, clock, overwrites=12)
+
+    task = asyncio.create_task(cache_maintenance_loop(interval_seconds=0, sweep_batch_size=4, stats_every_ticks=0))
+    try:
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if performance_cache.get_stats()["cache_size"] == 1:
+                break
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert performance_cache.get_stats()["cache_size"] == 1
+    assert performance_cache.get("rewritten") == "latest"
+
+
+def test_heap_is_compacted_in_slices(clock):
+    cache = PerformanceCache()
+    for index in range(1100):
+        cache.set("rewritten", index, ttl_seconds=60)
+    cache.set("kept", "value", ttl_seconds=60)
+
+    assert cache.sweep_expired(100) == (0, 0)  # nothing expired; compaction starts
+    assert cache._compacting_heap is not None and cache._expiry_heap == []
+
+    slices = 0
+    while cache._compacting_heap is not None:
+        _, visited = cache.sweep_expired(100)
+        assert visited <= 100
+        slices += 1
+    assert slices == 12
+    assert sorted(key for _, key in cache._expiry_heap) == ["kept", "rewritten"]
+
+    clock.now += 120
+    assert cache.sweep_expired(100) == (2, 2)
+
+
+def test_prune_shared(tmp_path, clock):
+    cache = PerformanceCache()
+    assert cache.prune_shared() == 0  # no shared tier
+
+    cache.attach_shared_tier(SharedCacheTier(str(tmp_path / "cache.db")))
+    cache.set("report", "value", ttl_seconds=1)
+    clock.now += 10
+    assert cache.prune_shared() == 1
@@ -0,0 +1,61 @@
+"""
+Tag index: targeted invalidation and index cleanup
+"""
+
+from app.core.cache import PerformanceCache, child_tag, invalidate_child_cache, performance_cache, user_tag
+
+
+def test_invalidate_removes_only_tagged_entries():
+    cache = PerformanceCache()
+    cache.set("child_sessions:1", [1], tags={child_tag(1)})
+    cache.set("child_analytics:1", {}, tags={child_tag(1)})
+    cache.set("user_children:7", [1, 2], tags={user_tag(7), child_tag(1), child_tag(2)})
+    cache.set("child_sessions:2", [2], tags={child_tag(2)})
+
+    assert cache.invalidate_tags(child_tag(1)) == 3
+    assert cache.get("child_sessions:2") == [2]
+    assert cache.get("user_children:7") is None
+
+    assert cache.invalidate_tags(child_tag(1), child_tag(2)) == 1
+    assert cache.get_stats()["cache_size"] == 0
+
+
+def test_index_drops_tags_with_their_last_entry():
+    cache = PerformanceCache()
+    cache.set("a", 1, tags={"child:1", "user:7"})
+    cache.set("b", 2, tags={"child:1"})
+    assert cache.get_stats()["tag_count"] == 2
+
+    cache.delete("a")
+    assert cache.get_stats()["tag_count"] == 1
+    cache.invalidate_tags("child:1")
+    assert cache.get_stats()["tag_count"] == 0
+
+
+def test_overwrite_replaces_tags():
+    cache = PerformanceCache()
+    cache.set("report", "old", tags={"child:1"})
+    cache.set("report", "new", tags={"child:2"})
+
+    assert cache.invalidate_tags("child:1") == 0
+    assert cache.get("report") == "new"
+    assert cache.invalidate_tags("child:2") == 1
+
+
+def test_evicted_entries_leave_the_index():
+    cache = PerformanceCache(max_entries=2, eviction_policy="lru")
+    for index in range(3):
+        cache.set(f"child_sessions:{index}", index, tags={child_tag(index)})
+
+    assert cache.get_stats()["tag_count"] == 2
+    assert cache.invalidate_tags(child_tag(0)) == 0
+
+
+def test_invalidate_child_cache_uses_the_global_cache():
+    performance_cache.set("child_sessions:5", [], tags={child_tag(5)})
+    performance_cache.set("child_sessions:6", [], tags={child_tag(6)})
+
+    invalidate_child_cache(5)
+
+    assert performance_cache.get("child_sessions:5") is None
+    assert performance_cache.get("child_sessions:6") == []
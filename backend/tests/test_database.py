@@ -0,0 +1,129 @@
+"""
+Engine options per backend and async engine/session wiring
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.auth import models as auth_models
+from app.core import database
+from app.core.cache import cache_user_children, performance_cache
+from app.core.config import settings
+from app.users import models as user_models
+from app.users.crud import AsyncChildService
+from tests.conftest import _sqlite_metadata
+
+
+def test_analytics_options_on_postgresql():
+    options = database._analytics_engine_options("postgresql://user:pw@db/smile")
+    assert options["isolation_level"] == "READ_COMMITTED"
+    assert f"statement_timeout={settings.ANALYTICS_STATEMENT_TIMEOUT}" in options["connect_args"]["options"]
+    assert options["pool_size"] == settings.ANALYTICS_POOL_SIZE
+
+
+def test_analytics_options_elsewhere_skip_postgresql_settings(tmp_path):
+    url = f"sqlite:///{tmp_path / 'analytics.db'}"
+    options = database._analytics_engine_options(url)
+    assert "connect_args" not in options and "isolation_level" not in options
+
+    engine = create_engine(url, **options)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+    engine.dispose()
+
+
+@pytest.mark.parametrize("database_url, async_database_url, expected", [
+    ("postgresql://smile:secret@db/smile", "", "postgresql+asyncpg://smile:secret@db/smile"),
+    ("postgresql+psycopg2://smile:secret@db/smile", "", "postgresql+asyncpg://smile:secret@db/smile"),
+    ("sqlite:///./smile.db", "", "sqlite+aiosqlite:///./smile.db"),
+    ("sqlite+aiosqlite:///./smile.db", "", "sqlite+aiosqlite:///./smile.db"),
+    ("postgresql://smile:secret@db/smile", "postgresql+asyncpg://other@pgbouncer/smile",
+     "postgresql+asyncpg://other@pgbouncer/smile"),
+    ("mysql://smile@db/smile", "", None),  # no known async driver
+])
+def test_async_database_url(monkeypatch, database_url, async_database_url, expected):
+    monkeypatch.setattr(settings, "DATABASE_URL", database_url)
+    monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", async_database_url)
+    assert database.get_async_database_url() == expected
+
+
+def test_async_options_only_on_postgresql():
+    options = database._async_engine_options("postgresql+asyncpg://smile@db/smile")
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == "30s"
+    assert database._async_engine_options("sqlite+aiosqlite:///./smile.db") == {}
+
+
+@pytest.mark.asyncio
+async def test_get_async_db_without_async_driver(monkeypatch):
+    monkeypatch.setattr(database, "AsyncSessionLocal", None)
+    with pytest.raises(RuntimeError, match="ASYNC_DATABASE_URL"):
+        await database.get_async_db().__anext__()
+
+
+@pytest.mark.asyncio
+async def test_async_child_service_shares_the_sync_cache_entry(tmp_path):
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    _sqlite_metadata().create_all(sync_engine)
+    with Session(sync_engine) as session:
+        parent = auth_models.User(
+            email="async@example.com", hashed_password="not-a-real-hash", first_name="Async",
+            last_name="Parent", role=auth_models.UserRole.PARENT, status=auth_models.UserStatus.ACTIVE,
+            is_active=True, is_verified=True
+        )
+        session.add(parent)
+        session.flush()
+        session.add(user_models.Child(name="Async Child", age=7, parent_id=parent.id))
+        session.commit()
+        parent_id = parent.id
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with AsyncSession(async_engine) as db:
+            children = await AsyncChildService(db).get_children_by_parent(parent_id)
+    finally:
+        await async_engine.dispose()
+
+    assert [child.name for child in children] == ["Async Child"]
+    cached = performance_cache.get(cache_user_children(parent_id))
+    assert [child.name for child in cached] == ["Async Child"]
+    assert cached[0].age_category == children[0].age_category
+
+
+def test_session_dependencies_use_their_own_pools():
+    for dependency, bind in ((database.get_db, database.engine), (database.get_analytics_db, database.analytics_engine)):
+        sessions = dependency()
+        session = next(sessions)
+        try:
+            assert session.get_bind() is bind
+        finally:
+            sessions.close()
+
+
+ANALYTICS_ROUTES = [
+    "/api/v1/reports/analytics/population",
+    "/api/v1/reports/analytics/cohort-comparison",
+    "/api/v1/reports/analytics/insights",
+    "/api/v1/reports/analytics/treatment-effectiveness",
+    "/api/v1/reports/analytics/export",
+    "/api/v1/reports/clinical-analytics/population",
+    "/api/v1/reports/clinical-analytics/insights",
+    "/api/v1/reports/professional/population-analytics",
+    "/api/v1/reports/professional/clinical-insights",
+    "/api/v1/reports/professional/platform-effectiveness",
+]
+
+
+def test_long_running_analytics_routes_use_the_analytics_pool():
+    from fastapi.routing import APIRoute
+
+    from main import app
+
+    routes = {route.path: route for route in app.routes if isinstance(route, APIRoute)}
+    for path in ANALYTICS_ROUTES:
+        # The handler's own session; authentication keeps using get_db
+        db = next(sub for sub in routes[path].dependant.dependencies if sub.name == "db")
+        assert db.call is database.get_analytics_db, path
@@ -0,0 +1,85 @@
+"""
+Prometheus /metrics output
+"""
+
+import re
+
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.cache import performance_cache
+from app.core.metrics import PrometheusWriter, render_prometheus_metrics
+
+# name{label="value",...} value
+_SAMPLE_PATTERN = re.compile(r'^(smile_[a-z_0-9]+)(\{[a-z_]+="(?:[^"\\]|\\.)*"(?:,[a-z_]+="(?:[^"\\]|\\.)*")*\})? -?[0-9.e+-]+$')
+
+
+def _families(text):
+    """metric name -> (type, sample lines); fails on malformed or orphaned lines"""
+    families = {}
+    current = None
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            current = line.split()[2]
+            assert current not in families, f"duplicate family {current}"
+            families[current] = [None, []]
+        elif line.startswith("# TYPE "):
+            _, _, name, metric_type = line.split()
+            assert name == current and metric_type in ("counter", "gauge")
+            families[name][0] = metric_type
+        else:
+            match = _SAMPLE_PATTERN.match(line)
+            assert match and match.group(1) == current, f"unexpected line {line!r}"
+            families[current][1].append(line)
+    return families
+
+
+def test_writer_format_and_escaping():
+    writer = PrometheusWriter()
+    writer.metric("demo_total", "counter", "Demo counter", [
+        ({"path": 'a"b\\c\nd'}, 3),
+        (None, None),  # skipped
+    ])
+
+    assert writer.render() == (
+        "# HELP smile_demo_total Demo counter\n"
+        "# TYPE smile_demo_total counter\n"
+        'smile_demo_total{path="a\\"b\\\\c\\nd"} 3.0\n'
+    )
+
+
+def test_rendered_metrics_are_well_formed():
+    # Namespace counters outlive cache.clear(); use a namespace of our own
+    performance_cache.set("metrics_probe:1", [1, 2, 3])
+    performance_cache.get("metrics_probe:1")
+    performance_cache.get("metrics_probe:2")
+
+    families = _families(render_prometheus_metrics())
+
+    assert 'smile_cache_hits_total{namespace="metrics_probe"} 1.0' in families["smile_cache_hits_total"][1]
+    assert 'smile_cache_misses_total{namespace="metrics_probe"} 1.0' in families["smile_cache_misses_total"][1]
+    assert families["smile_cache_entries"][0] == "gauge"
+    assert 'smile_db_pool_pool_size{pool="analytics"}' in "\n".join(families["smile_db_pool_pool_size"][1])
+    for name in ("smile_password_pool_queue_depth", "smile_rate_limit_allowed_total"):
+        assert families[name][1]
+
+
+def test_failing_collector_does_not_hide_the_others(monkeypatch):
+    def broken():
+        raise RuntimeError("pool gone")
+
+    monkeypatch.setattr(metrics.password_pool, "get_stats", broken)
+    families = _families(render_prometheus_metrics())
+
+    assert "smile_password_pool_queue_depth" not in families
+    assert "smile_cache_hits_total" in families and "smile_rate_limit_allowed_total" in families
+
+
+def test_metrics_endpoint():
+    from main import app
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE smile_cache_hits_total counter" in response.text
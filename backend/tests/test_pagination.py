@@ -0,0 +1,106 @@
+"""
+Keyset pagination: cursors, page boundaries, tie-breaks and counts
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.core.pagination import (
+    InvalidCursorError, count_rows, decode_cursor, encode_cursor, keyset_paginate
+)
+from app.reports import routes
+from app.reports.models import GameSession
+
+START = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def sessions(db, parent, make_child):
+    """Five sessions of one child; the last three share a timestamp"""
+    child = make_child(parent.id)
+    rows = []
+    for minutes in (0, 1, 2, 2, 2):
+        row = GameSession(
+            child_id=child.id, session_type="therapy_session", scenario_name="Dentist",
+            started_at=START + timedelta(minutes=minutes)
+        )
+        db.add(row)
+        db.flush()
+        rows.append(row)
+    return rows
+
+
+def _query(db, sessions):
+    return db.query(GameSession).filter(GameSession.child_id == sessions[0].child_id)
+
+
+def _all_pages(query, page_size):
+    pages, cursor = [], None
+    while True:
+        page = keyset_paginate(query, GameSession.started_at, GameSession.id, page_size, cursor=cursor)
+        pages.append([row.id for row in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(START, 42)) == (START, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(START, 1)[:-3], "W10"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+async def _child_sessions(db, parent, child_id, **params):
+    response = Response()
+    defaults = dict(limit=2, session_type=None, date_from=None, date_to=None, completion_status=None,
+                    cursor=None, include_count=None)
+    items = await routes.get_child_game_sessions_task23(
+        child_id=child_id, response=response, current_user=parent, db=db, **{**defaults, **params}
+    )
+    return items, response
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_a_bad_request(db, parent, sessions):
+    with pytest.raises(HTTPException) as error:
+        await _child_sessions(db, parent, sessions[0].child_id, cursor="not-a-cursor")
+    assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_route_sets_page_headers(db, parent, sessions):
+    items, response = await _child_sessions(db, parent, sessions[0].child_id, include_count="exact")
+    assert len(items) == 2
+    assert response.headers["X-Total-Count"] == "5"
+    assert response.headers["X-Total-Count-Estimated"] == "false"
+
+    items, response = await _child_sessions(
+        db, parent, sessions[0].child_id, limit=3, cursor=response.headers["X-Next-Cursor"]
+    )
+    assert len(items) == 3 and "X-Next-Cursor" not in response.headers
+
+
+def test_pages_are_newest_first_with_id_tie_break(db, sessions):
+    expected = [row.id for row in sorted(sessions, key=lambda row: (row.started_at, row.id), reverse=True)]
+    pages = _all_pages(_query(db, sessions), page_size=2)
+
+    # The three rows sharing a timestamp straddle a page boundary without repeats or gaps
+    assert pages == [expected[0:2], expected[2:4], expected[4:5]]
+
+
+def test_exact_final_page_has_no_cursor(db, sessions):
+    query = _query(db, sessions).filter(GameSession.id != sessions[0].id)
+    pages = _all_pages(query, page_size=2)
+    assert [len(page) for page in pages] == [2, 2]
+
+
+def test_counts_fall_back_to_exact_off_postgresql(db, sessions):
+    query = _query(db, sessions)
+    assert count_rows(query) == (5, False)
+    assert count_rows(query, estimated=True) == (5, False)
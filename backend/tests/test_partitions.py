@@ -0,0 +1,53 @@
+"""
+game_sessions partition maintenance: planning and per-step transactions
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import ProgrammingError
+
+from app.reports import partitions
+
+NOW = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+
+def test_missing_partition_months():
+    existing = ["game_sessions_default", "game_sessions_p2026_10", "game_sessions_p2026_12"]
+    months = partitions.missing_partition_months(existing, months_ahead=3, now=NOW)
+    assert [partitions.partition_name(month) for month in months] == [
+        "game_sessions_p2026_11", "game_sessions_p2027_01"
+    ]
+
+
+def test_expired_partitions():
+    existing = ["game_sessions_default", "game_sessions_p2026_07", "game_sessions_p2026_08", "game_sessions_p2026_10"]
+    assert partitions.expired_partitions(existing, retention_months=3, now=NOW) == ["game_sessions_p2026_07"]
+    assert partitions.expired_partitions(existing, retention_months=0, now=NOW) == []
+
+
+def test_not_partitioned_off_postgresql(db_engine):
+    summary = partitions.maintain_game_session_partitions(bind=db_engine, now=NOW)
+    assert summary == {"partitioned": False, "created": [], "detached": [], "failed": []}
+
+
+def test_failed_step_does_not_abort_the_others(db_engine, monkeypatch):
+    existing = ["game_sessions_default", "game_sessions_p2026_01", "game_sessions_p2026_10"]
+    monkeypatch.setattr(partitions, "is_partitioned", lambda connection: True)
+    monkeypatch.setattr(partitions, "ensure_default_partition", lambda connection: "game_sessions_default")
+    monkeypatch.setattr(partitions, "list_partitions", lambda connection: existing)
+    detached = []
+    monkeypatch.setattr(partitions, "detach_partition", lambda connection, name: detached.append(name))
+
+    def create(connection, month):
+        if month.month == 11:
+            raise ProgrammingError("ATTACH PARTITION", {}, Exception("updated partition constraint violated"))
+
+    monkeypatch.setattr(partitions, "create_month_partition", create)
+
+    summary = partitions.maintain_game_session_partitions(
+        bind=db_engine, months_ahead=2, retention_months=6, now=NOW
+    )
+
+    assert summary["failed"] == ["game_sessions_p2026_11"]
+    assert summary["created"] == ["game_sessions_p2026_12"]
+    assert summary["detached"] == detached == ["game_sessions_p2026_01"]
@@ -0,0 +1,31 @@
+"""
+Password operations run on the password pool with their own session
+"""
+
+import threading
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.auth import routes as auth_routes
+
+
+@pytest.mark.asyncio
+async def test_password_operation_uses_its_own_session(db, db_engine, monkeypatch):
+    sessions = []
+
+    def session_factory():
+        sessions.append(Session(bind=db_engine))
+        return sessions[-1]
+
+    monkeypatch.setattr(auth_routes, "SessionLocal", session_factory)
+
+    def operation(service, user_id):
+        return threading.current_thread().name, service.db, user_id
+
+    thread_name, job_db, user_id = await auth_routes._run_password_operation(operation, 7)
+
+    assert thread_name.startswith("password-hash")
+    assert job_db is sessions[0] and job_db is not db
+    assert user_id == 7
+    assert not job_db.in_transaction()  # closed when the job finished
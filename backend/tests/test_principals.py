@@ -0,0 +1,78 @@
+"""
+Authenticated principal cache: reuse, invalidation and the CurrentUser proxy
+"""
+
+import pytest
+
+from app.auth.dependencies import _resolve_principal
+from app.auth.models import UserStatus
+from app.auth.principals import CurrentUser, principal_cache_key
+from app.auth.schemas import PasswordChange, TokenData
+from app.auth.services import AuthService
+from app.auth.utils import get_password_hash
+from app.core.cache import performance_cache, user_tag
+from app.core.query_stats import track_queries
+
+ISSUED_AT = 1_790_000_000
+
+
+def _token(user) -> TokenData:
+    return TokenData(user_id=user.id, email=user.email, role=user.role.value, issued_at=ISSUED_AT)
+
+
+def _cached(user) -> bool:
+    return performance_cache.get(principal_cache_key(user.id, ISSUED_AT)) is not None
+
+
+def test_principal_is_served_from_cache(db, parent):
+    first = _resolve_principal(AuthService(db), _token(parent), db)
+    assert isinstance(first, CurrentUser) and _cached(parent)
+
+    with track_queries() as stats:
+        second = _resolve_principal(AuthService(db), _token(parent), db)
+        assert (second.id, second.email, second.role, second.is_active) == (
+            parent.id, parent.email, parent.role, True
+        )
+    assert stats.query_count == 0
+
+    assert second.first_name == "Test"  # other attributes load the row
+    assert second.user is parent
+
+
+def test_current_user_is_read_only(db, parent):
+    current_user = _resolve_principal(AuthService(db), _token(parent), db)
+    with pytest.raises(AttributeError, match="current_user.user"):
+        current_user.first_name = "Changed"
+    assert parent.first_name == "Test"
+
+
+def test_principal_tag_leaves_user_entries_alone(db, parent):
+    performance_cache.set(f"user_children:{parent.id}", [], tags={user_tag(parent.id)})
+    _resolve_principal(AuthService(db), _token(parent), db)
+
+    AuthService(db).update_user(parent.id, {"first_name": "Renamed"})
+
+    assert not _cached(parent)
+    assert performance_cache.get(f"user_children:{parent.id}") == []
+
+
+@pytest.mark.parametrize("change", [
+    lambda service, user: service.update_user(user.id, {"last_name": "Changed"}),
+    lambda service, user: service.change_password(user.id, PasswordChange(
+        current_password="Original1pass", new_password="Replaced2pass", new_password_confirm="Replaced2pass"
+    )),
+    lambda service, user: service.deactivate_user(user.id),
+], ids=["update_user", "change_password", "deactivate_user"])
+def test_account_changes_invalidate_the_principal(db, parent, change):
+    parent.hashed_password = get_password_hash("Original1pass")
+    db.flush()
+    _resolve_principal(AuthService(db), _token(parent), db)
+    assert _cached(parent)
+
+    assert change(AuthService(db), parent)
+
+    assert not _cached(parent)
+    current_user = _resolve_principal(AuthService(db), _token(parent), db)
+    assert current_user.status == parent.status
+    if parent.status == UserStatus.INACTIVE:
+        assert not current_user.is_active
@@ -0,0 +1,60 @@
+"""
+Query budgets per endpoint (see the query_budget fixture)
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.auth.principals import CurrentUser, Principal
+from app.core.query_stats import track_queries
+from app.reports.models import GameSession
+from app.users.models import Activity
+from app.users.routes import get_child_progress_report
+
+
+@pytest.mark.asyncio
+async def test_child_progress_report_query_budget(db, parent, make_child, query_budget):
+    child = make_child(parent.id)
+    now = datetime.now(timezone.utc)
+    for day in range(5):
+        db.add(Activity(
+            child_id=child.id, activity_type="exercise", activity_name=f"Activity {day}",
+            points_earned=10, completed_at=now - timedelta(days=day)
+        ))
+        db.add(GameSession(
+            child_id=child.id, session_type="therapy_session", scenario_name="Dentist",
+            started_at=now - timedelta(days=day), score=50
+        ))
+    db.commit()
+    db.connection()  # Open the fixture's next savepoint outside the budget
+    current_user = CurrentUser(Principal.from_user(parent), db, parent)
+    
+    # Child lookup, activities, sessions - independent of the number of rows
+    with query_budget(3, max_repeats=1) as stats:
+        report = await get_child_progress_report(child_id=child.id, days=30, current_user=current_user, db=db)
+    
+    assert report["child"]["id"] == child.id
+    assert stats.query_count == 3
+
+
+def test_query_budget_reports_n_plus_one(db, parent, make_child, query_budget):
+    children = [make_child(parent.id, name=f"Child {index}") for index in range(4)]
+    db.expire_all()
+    
+    with pytest.raises(AssertionError, match="repeated 4 times"):
+        with query_budget(10, max_repeats=1):
+            for child in children:
+                db.query(Activity).filter(Activity.child_id == child.id).count()
+
+
+def test_failed_statement_leaves_no_timing_state(db):
+    connection = db.connection()
+    with track_queries() as stats:
+        with pytest.raises(OperationalError):
+            connection.exec_driver_sql("SELECT * FROM no_such_table")
+        connection.exec_driver_sql("SELECT 1")
+    
+    assert stats.query_count == 1
+    assert "query_start_times" not in connection.info
@@ -0,0 +1,125 @@
+"""
+Query plans of the per-child time-range hot path
+
+EXPLAINs the key ORM queries (sessions and activities of a child in a time
+window) and fails on any sequential scan, i.e. a query that lost its composite
+index. Plans only mean something on PostgreSQL, so these tests run against
+TEST_DATABASE_URL (a migrated PostgreSQL database) and skip without one:
+
+    TEST_DATABASE_URL=postgresql://... pytest tests/test_query_plans.py
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+import pytest
+from sqlalchemy import create_engine, desc, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
+
+from app.users.models import Activity
+from app.reports.models import GameSession
+
+# Parameters for the sample queries; the planner only needs representative values
+SAMPLE_CHILD_IDS = [1, 2]
+SAMPLE_WINDOW_DAYS = 30
+
+
+def _since() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=SAMPLE_WINDOW_DAYS)
+
+
+# name -> builder of the ORM query to check
+HOT_PATH_QUERIES: Dict[str, Callable[[Session], Query]] = {
+    "game_sessions_by_child_in_range": lambda db: db.query(GameSession).filter(
+        GameSession.child_id == SAMPLE_CHILD_IDS[0],
+        GameSession.started_at >= _since()
+    ).order_by(GameSession.started_at),
+    "game_sessions_keyset_page": lambda db: db.query(GameSession).filter(
+        GameSession.child_id.in_(SAMPLE_CHILD_IDS)
+    ).order_by(desc(GameSession.started_at), desc(GameSession.id)).limit(21),
+    "activities_by_child_in_range": lambda db: db.query(Activity).filter(
+        Activity.child_id == SAMPLE_CHILD_IDS[0],
+        Activity.completed_at >= _since()
+    ).order_by(Activity.completed_at),
+    "recent_activity_counts": lambda db: db.query(
+        Activity.child_id, func.count(Activity.id)
+    ).filter(
+        Activity.child_id.in_(SAMPLE_CHILD_IDS),
+        Activity.completed_at >= _since()
+    ).group_by(Activity.child_id),
+}
+
+
+def find_seq_scans(plan: Dict[str, Any]) -> List[str]:
+    """Relations read with a sequential scan anywhere in an EXPLAIN (FORMAT JSON) plan tree"""
+    relations = []
+    if plan.get("Node Type") == "Seq Scan":
+        relations.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        relations.extend(find_seq_scans(child))
+    return relations
+
+
+def explain_query(db: Session, query: Query) -> Dict[str, Any]:
+    """
+    EXPLAIN (FORMAT JSON) an ORM query without executing it
+
+    enable_seqscan is turned off so the planner only falls back to a
+    sequential scan when no index can serve the query; small or empty test
+    tables would otherwise hide a missing index.
+
+    Returns:
+        Root plan node
+    """
+    statement = query.statement
+    compiled = statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+    connection = db.connection()
+    savepoint = connection.begin_nested()
+    try:
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    finally:
+        savepoint.rollback()  # Also reverts SET LOCAL
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+@pytest.fixture(scope="module")
+def pg_db():
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url or not url.startswith("postgresql"):
+        pytest.skip("query plan checks need TEST_DATABASE_URL pointing at PostgreSQL")
+    try:
+        engine = create_engine(url)
+        engine.connect().close()
+    except (ImportError, SQLAlchemyError) as e:
+        pytest.skip(f"PostgreSQL at TEST_DATABASE_URL is not reachable: {e}")
+
+    session = Session(bind=engine)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        engine.dispose()
+
+
+def test_find_seq_scans_walks_the_plan_tree():
+    plan = {
+        "Node Type": "Limit",
+        "Plans": [
+            {"Node Type": "Index Scan", "Relation Name": "game_sessions_2026_10"},
+            {"Node Type": "Sort", "Plans": [{"Node Type": "Seq Scan", "Relation Name": "activities"}]},
+        ],
+    }
+    assert find_seq_scans(plan) == ["activities"]
+
+
+@pytest.mark.parametrize("name", sorted(HOT_PATH_QUERIES))
+def test_hot_path_query_uses_an_index(pg_db, name):
+    plan = explain_query(pg_db, HOT_PATH_QUERIES[name](pg_db))
+    assert find_seq_scans(plan) == [], f"{name} lost its index: {json.dumps(plan, indent=2)}"
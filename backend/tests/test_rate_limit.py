@@ -0,0 +1,28 @@
+"""
+Client IP used by the credential rate limiter
+"""
+
+import pytest
+
+from app.core.rate_limit import RateLimitMiddleware
+
+
+def _scope(*forwarded_for: str):
+    return {
+        "type": "http",
+        "client": ("10.0.0.2", 51000),
+        "headers": [(b"x-forwarded-for", value.encode("latin-1")) for value in forwarded_for],
+    }
+
+
+@pytest.mark.parametrize("hops, headers, expected", [
+    (0, ["6.6.6.6"], "10.0.0.2"),  # header ignored without trusted proxies
+    (1, ["6.6.6.6, 203.0.113.7"], "203.0.113.7"),  # spoofed leftmost entry is skipped
+    (1, ["6.6.6.6", "203.0.113.7"], "203.0.113.7"),  # repeated headers
+    (2, ["6.6.6.6, 203.0.113.7, 10.0.0.9"], "203.0.113.7"),
+    (2, ["203.0.113.7"], "10.0.0.2"),  # shorter than the proxy chain: use the peer
+    (1, [], "10.0.0.2"),
+])
+def test_client_ip(hops, headers, expected):
+    middleware = RateLimitMiddleware(app=None, trusted_proxy_hops=hops)
+    assert middleware._client_ip(_scope(*headers)) == expected
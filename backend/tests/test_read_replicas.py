@@ -0,0 +1,65 @@
+"""
+Read-replica sessions, with two SQLite files standing in for primary and replica
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.core.database import ReadOnlySession, SessionLocal, engine
+
+ReplicaBase = declarative_base()
+
+
+class Counter(ReplicaBase):
+    __tablename__ = "counters"
+    id = Column(Integer, primary_key=True)
+    fails = Column(Integer, nullable=False)
+
+
+@pytest.fixture
+def primary_and_replica(tmp_path):
+    engines = []
+    for name, fails in (("primary", 4), ("replica", 0)):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        ReplicaBase.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(Counter.__table__.insert(), {"id": 1, "fails": fails})
+        engines.append(engine)
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def test_read_only_session_reads_replica(primary_and_replica):
+    primary, replica = primary_and_replica
+    ReadOnly = sessionmaker(class_=ReadOnlySession, replicas=[replica], bind=primary)
+    with ReadOnly() as session:
+        assert session.get(Counter, 1).fails == 0
+
+
+def test_read_only_session_refuses_writes(primary_and_replica):
+    primary, replica = primary_and_replica
+    ReadOnly = sessionmaker(class_=ReadOnlySession, replicas=[replica], bind=primary)
+    with ReadOnly() as session:
+        session.get(Counter, 1).fails += 1
+        with pytest.raises(InvalidRequestError):
+            session.commit()
+
+
+def test_default_sessions_never_use_replicas():
+    """Sessions that may write (get_db) are bound to the primary for every statement"""
+    session = SessionLocal()
+    try:
+        assert not isinstance(session, ReadOnlySession)
+        assert session.get_bind() is engine
+    finally:
+        session.close()
+
+
+def test_read_only_session_without_replicas_uses_primary(primary_and_replica):
+    primary, _ = primary_and_replica
+    ReadOnly = sessionmaker(class_=ReadOnlySession, replicas=[], bind=primary)
+    with ReadOnly() as session:
+        assert session.get(Counter, 1).fails == 4
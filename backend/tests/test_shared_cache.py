@@ -0,0 +1,80 @@
+"""
+Shared cache tier: file permission checks and stats collection
+"""
+
+import os
+import threading
+
+import pytest
+
+from app.core.cache import PerformanceCache
+from app.core.shared_cache import SharedCacheTier
+
+
+def test_new_file_is_owner_only(tmp_path):
+    path = str(tmp_path / "cache.db")
+    tier = SharedCacheTier(path)
+    assert tier.set("key", {"value": 1}, expires_at=4102444800.0)
+
+    assert tier.get("key")["value"] == {"value": 1}
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+@pytest.mark.parametrize("suffix", ["", "-wal", "-shm"])
+def test_refuses_files_writable_by_others(tmp_path, suffix):
+    path = str(tmp_path / "cache.db")
+    SharedCacheTier(path)  # creates the database and its WAL files
+    target = path + suffix
+    if not os.path.exists(target):
+        open(target, "wb").close()
+    os.chmod(target, 0o666)
+
+    with pytest.raises(PermissionError):
+        SharedCacheTier(path)
+
+
+def test_refuses_symlinks(tmp_path):
+    real = tmp_path / "elsewhere.db"
+    real.touch(mode=0o600)
+    link = tmp_path / "cache.db"
+    link.symlink_to(real)
+
+    with pytest.raises(OSError):
+        SharedCacheTier(str(link))
+
+
+def test_stats_are_collected_outside_the_cache_lock(tmp_path):
+    cache = PerformanceCache()
+    tier = SharedCacheTier(str(tmp_path / "cache.db"))
+    cache.attach_shared_tier(tier)
+    lock_free = []
+
+    def probe():
+        acquired = cache._lock.acquire(timeout=1)
+        if acquired:
+            cache._lock.release()
+        lock_free.append(acquired)
+
+    def get_stats():
+        # Another thread must be able to take the cache lock meanwhile
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        return SharedCacheTier.get_stats(tier)
+
+    tier.get_stats = get_stats
+    stats = cache.get_stats()
+
+    assert lock_free == [True]
+    assert stats["shared_tier"]["entries"] == 0
+
+
+def test_concurrent_stats_are_exact(tmp_path):
+    tier = SharedCacheTier(str(tmp_path / "cache.db"))
+    threads = [threading.Thread(target=lambda: [tier.get("missing") for _ in range(200)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tier.get_stats()["misses"] == 800
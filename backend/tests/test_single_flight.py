@@ -0,0 +1,114 @@
+"""
+Single-flight: concurrent computations of one key run once
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.cache import SingleFlight
+
+
+def test_concurrent_threads_share_one_computation():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "report"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do("key", compute)))
+    leader.start()
+    started.wait(timeout=5)
+    followers = [threading.Thread(target=lambda: results.append(flights.do("key", compute))) for _ in range(7)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.1)  # Let the followers block on the leader
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    assert results == ["report"] * 8
+    assert len(calls) == 1
+    assert flights.stats == {"leaders": 1, "coalesced": 7}
+    assert flights._calls == {}
+
+
+def test_followers_receive_the_leaders_error():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute():
+        started.set()
+        release.wait(timeout=5)
+        raise ValueError("database unavailable")
+
+    errors = []
+
+    def call():
+        try:
+            flights.do("key", compute)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(timeout=5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    time.sleep(0.1)
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert errors == ["database unavailable"] * 2
+    assert flights.stats == {"leaders": 1, "coalesced": 1}
+
+
+def test_reentrant_call_does_not_deadlock():
+    flights = SingleFlight()
+    assert flights.do("key", lambda: flights.do("key", lambda: "inner")) == "inner"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_coroutines_share_one_computation():
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "report"
+
+    results = await asyncio.gather(*(flights.do_async("key", compute) for _ in range(5)))
+
+    assert results == ["report"] * 5
+    assert len(calls) == 1
+    assert flights.stats == {"leaders": 1, "coalesced": 4}
+
+
+@pytest.mark.asyncio
+async def test_follower_computes_when_the_leader_is_cancelled():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "report"
+
+    leader = asyncio.create_task(flights.do_async("key", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do_async("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "report"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
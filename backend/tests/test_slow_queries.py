@@ -0,0 +1,64 @@
+"""
+Slow-query log: EXPLAIN safety and per-statement timing state
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core import query_stats
+from app.core.query_stats import track_queries
+from app.core.slow_queries import is_plain_read
+
+
+@pytest.mark.parametrize("statement", [
+    "SELECT id FROM game_sessions WHERE child_id = %(child_id)s",
+    "  select count(*) from activities",
+    "WITH recent AS (SELECT * FROM game_sessions) SELECT * FROM recent",
+    "SELECT id FROM reports WHERE status = 'update pending'",
+])
+def test_plain_reads_may_be_analyzed(statement):
+    assert is_plain_read(statement)
+
+
+@pytest.mark.parametrize("statement", [
+    "SELECT * FROM auth_users WHERE id = %(id)s FOR UPDATE",
+    "SELECT * FROM auth_users WHERE id = %(id)s FOR NO KEY UPDATE",
+    "SELECT * FROM children FOR SHARE",
+    "SELECT * FROM children FOR KEY SHARE SKIP LOCKED",
+    "WITH moved AS (DELETE FROM game_sessions WHERE id = 1 RETURNING *) SELECT * FROM moved",
+    "WITH touched AS (UPDATE auth_users SET last_login_at = now() RETURNING id) SELECT id FROM touched",
+    "WITH added AS (INSERT INTO activities (child_id) VALUES (1) RETURNING id) SELECT id FROM added",
+    "SELECT * INTO children_backup FROM children",
+    "SELECT nextval('game_sessions_id_seq')",
+    "UPDATE auth_users SET is_active = false",
+])
+def test_locking_or_writing_statements_are_not_analyzed(statement):
+    assert not is_plain_read(statement)
+
+
+def test_failed_statement_leaves_no_timing_state(db):
+    connection = db.connection()
+    with pytest.raises(OperationalError):
+        connection.exec_driver_sql("SELECT * FROM no_such_table")
+    
+    assert "slow_query_start_times" not in connection.info
+
+
+def test_statements_are_timed_once_for_every_consumer(db, monkeypatch):
+    durations = []
+
+    def failing(*args):
+        raise RuntimeError("consumer bug")
+
+    monkeypatch.setattr(query_stats, "_query_timers", [
+        *query_stats._query_timers,
+        (lambda: True, failing),
+        (lambda: True, lambda *args: durations.append(args[-1])),
+    ])
+    with track_queries() as stats:
+        assert db.execute(text("SELECT 1")).scalar() == 1
+
+    assert stats.query_count >= 1
+    assert len(durations) == stats.query_count
+    assert sum(durations) == pytest.approx(stats.total_seconds)
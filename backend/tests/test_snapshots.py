@@ -0,0 +1,47 @@
+"""
+ORM snapshots for cached rows: failures propagate instead of caching None fields
+"""
+
+import pickle
+
+import pytest
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from app.core.cache import performance_cache
+from app.core.snapshots import snapshot_as_dict, to_snapshot
+from app.users import crud
+from app.users.crud import CHILD_SNAPSHOT_ATTRIBUTES, ChildService
+
+
+def test_snapshot_round_trips(parent, make_child):
+    child = make_child(parent.id, "Snapshot Child")
+    snapshot = to_snapshot(child, CHILD_SNAPSHOT_ATTRIBUTES)
+
+    restored = pickle.loads(pickle.dumps(snapshot))
+    assert restored == snapshot
+    assert snapshot_as_dict(restored)["name"] == "Snapshot Child"
+    assert restored.age_category == child.age_category
+
+
+def test_unknown_attribute_raises(parent, make_child):
+    child = make_child(parent.id)
+    with pytest.raises(AttributeError):
+        to_snapshot(child, ("full_profile_complet",))
+
+
+def test_unloadable_attribute_raises(db, parent, make_child):
+    child = make_child(parent.id)
+    db.expire(child)
+    db.expunge(child)
+    with pytest.raises(DetachedInstanceError):
+        to_snapshot(child)
+
+
+def test_failed_snapshot_skips_caching(db, parent, make_child, monkeypatch):
+    make_child(parent.id)
+    monkeypatch.setattr(crud, "CHILD_SNAPSHOT_ATTRIBUTES", ("no_such_attribute",))
+
+    children = ChildService(db).get_children_by_parent(parent.id)
+
+    assert len(children) == 1  # rows are still returned
+    assert performance_cache.get(crud.cache_user_children(parent.id)) is None
@@ -0,0 +1,101 @@
+"""
+Stale-while-revalidate: background refreshes must not outlive the request's
+session or resurrect invalidated values
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cached, performance_cache
+
+
+def _wait_for_refreshes(timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while performance_cache.refresher.get_stats()["in_flight"]:
+        assert time.monotonic() < deadline, "background refresh did not finish"
+        time.sleep(0.01)
+
+
+def _make_cached_counter(release: threading.Event):
+    calls = []
+    
+    @cached(ttl_seconds=0, key_prefix="swr_test", tags=lambda item_id: {f"item:{item_id}"},
+            stale_ttl=60, single_flight=False)
+    def load(item_id: int):
+        calls.append(item_id)
+        if len(calls) > 1:
+            release.wait(5)
+        return {"item_id": item_id, "version": len(calls)}
+    
+    return load, calls
+
+
+def test_refresh_replaces_stale_value():
+    release = threading.Event()
+    release.set()
+    load, calls = _make_cached_counter(release)
+    
+    assert load(1)["version"] == 1
+    assert load(1)["version"] == 1  # Stale value served, refresh scheduled
+    _wait_for_refreshes()
+    
+    assert len(calls) == 2
+    assert load(1)["version"] == 2  # Refreshed value (stale again with ttl 0)
+    _wait_for_refreshes()
+    assert performance_cache.get_stats()["discarded_refreshes"] == 0
+
+
+def test_refresh_invalidated_mid_flight_is_discarded():
+    release = threading.Event()
+    load, calls = _make_cached_counter(release)
+    
+    load(2)
+    discarded_before = performance_cache.get_stats()["discarded_refreshes"]
+    assert load(2)["version"] == 1  # Refresh starts and blocks
+    deadline = time.monotonic() + 5
+    while len(calls) < 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    
+    performance_cache.invalidate_tags("item:2")
+    release.set()
+    _wait_for_refreshes()
+    
+    assert performance_cache.get_stats()["discarded_refreshes"] == discarded_before + 1
+    assert performance_cache.get_stats()["cache_size"] == 0
+    # Next call recomputes instead of returning the pre-invalidation refresh
+    assert load(2)["version"] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_refresh_uses_its_own_async_session():
+    class ReportService:
+        def __init__(self, db: AsyncSession):
+            self.db = db
+        
+        @cached(ttl_seconds=0, key_prefix="swr_async_test", stale_ttl=60)
+        async def summary(self, child_id: int):
+            seen_sessions.append(self.db)
+            return {"child_id": child_id, "calls": len(seen_sessions)}
+    
+    seen_sessions = []
+    request_session = AsyncSession()
+    service = ReportService(request_session)
+    
+    await service.summary(5)
+    assert (await service.summary(5))["calls"] == 1  # Stale; refresh scheduled
+    await request_session.close()  # The request ends before the refresh runs
+    for _ in range(100):
+        if len(seen_sessions) == 2 and not performance_cache.refresher.get_stats()["in_flight"]:
+            break
+        await asyncio.sleep(0.01)
+    
+    assert len(seen_sessions) == 2
+    refresh_session = seen_sessions[1]
+    assert isinstance(refresh_session, AsyncSession)
+    assert refresh_session is not request_session
+    assert service.db is request_session